@@ -19,9 +19,18 @@ import random
 import html
 import traceback
 import itertools
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from PIL import Image
 from io import BytesIO
+from llm_cache import generate_content_cached
+from image_store import get_default_store
+from cache_backends import SQLiteCacheBackend
+from wp_tag_index import WordPressTagIndex
+from wp_publisher import WordPressPublisher, format_timings
 
 # ##############################################################################
 # 사용자 설정 (자동화 제어)
@@ -29,6 +38,16 @@ from io import BytesIO
 MAX_POSTS_PER_RUN = 10
 PUBLISHED_LOG_FILE = "published_log.txt"
 POST_DELAY_SECONDS = 15
+MAX_VALID_IMAGES = 10          # 대표 이미지 1개 + 갤러리 9개를 확보하면 검증 중단
+IMAGE_VALIDATION_WORKERS = 6   # 이미지 동시 검증 스레드 수
+PREFETCH_AHEAD = 2             # 현재 글을 생성/발행하는 동안 미리 수집할 다음 여행지 수 (0이면 순차 처리)
+LOOKUP_CACHE_DB = "/var/www/novacents/tools/cache/overseas_lookup_cache.db"
+LOOKUP_CACHE_TTL_SECONDS = {   # 외부 조회 결과 캐시 유효 기간 (소스별)
+    "places": 30 * 24 * 3600,      # 장소 ID/주소/운영시간/개요 (사진 제외)
+    "place_photos": 10 * 60,       # 사진 이름은 만료되므로 짧게만 보관
+    "pexels": 7 * 24 * 3600,
+    "youtube": 3 * 24 * 3600,
+}
 # ##############################################################################
 
 try:
@@ -66,49 +85,185 @@ def load_configuration():
         return None
     return config
 
-def get_final_redirected_url(initial_url):
+IMAGE_HEADER_CHUNK = 8192
+IMAGE_HEADER_MAX_BYTES = 256 * 1024
+
+def _image_store():
+    """공용 이미지 저장소 (열 수 없는 환경이면 None - 저장소 없이 동작)"""
     try:
-        response = requests.get(initial_url, allow_redirects=True, timeout=15, stream=True)
-        response.raise_for_status()
-        return response.url
-    except requests.RequestException:
+        return get_default_store()
+    except (OSError, sqlite3.Error):
         return None
 
-def validate_image_url(url):
+def probe_image_url(url):
+    """
+    이미지 URL을 한 번만 요청해 리다이렉트 최종 URL과 이미지 유효성을 함께 확인
+    - 이미지 저장소에 검증 결과가 있으면 네트워크 요청 없이 사용
+    - 본문 전체를 받지 않고 Pillow가 포맷/크기를 읽을 수 있을 만큼만 헤더 바이트를 읽음
+      (바이트는 Gemini 프롬프트용으로 내려받을 때 저장소에 저장)
+    :return: 최종 URL (유효하지 않으면 None)
+    """
+    store = _image_store()
+    if store:
+        record = store.lookup(url)
+        if record:
+            return record['url'] if record['valid'] else None
+
+    def _verdict(final_url, valid, mime_type=None, size=(None, None)):
+        if store:
+            store.record_verdict(url, final_url, valid, mime_type, size[0], size[1])
+        return final_url if valid else None
+
     try:
-        response = requests.get(url, timeout=15, allow_redirects=True)
-        response.raise_for_status()
-        content_type = response.headers.get('Content-Type', '')
-        if 'image/' not in content_type: return False
-        content_length = int(response.headers.get('Content-Length', 0))
-        if content_length < 10240: return False
+        with requests.get(url, timeout=15, allow_redirects=True, stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            if 'image/' not in content_type: return _verdict(response.url, False)
+            content_length = int(response.headers.get('Content-Length', 0))
+            if content_length < 10240: return _verdict(response.url, False, content_type)
+
+            header_bytes = b""
+            for chunk in response.iter_content(chunk_size=IMAGE_HEADER_CHUNK):
+                header_bytes += chunk
+                try:
+                    img = Image.open(BytesIO(header_bytes))
+                except Exception:
+                    # 헤더가 아직 다 오지 않았으면 더 읽음
+                    if len(header_bytes) >= IMAGE_HEADER_MAX_BYTES: return _verdict(response.url, False, content_type)
+                    continue
+                valid = img.size[0] >= 100 and img.size[1] >= 100
+                return _verdict(response.url, valid, content_type, img.size)
+            return _verdict(response.url, False, content_type)
+    except (requests.RequestException, ValueError, sqlite3.Error):
+        return None
+
+def validate_images_concurrently(images_data, place_name, max_valid=MAX_VALID_IMAGES, max_workers=IMAGE_VALIDATION_WORKERS):
+    """
+    수집된 이미지들을 스레드 풀로 동시에 검증하고, max_valid개를 확보하면 남은 검증은 취소
+    :param images_data: [{'url', 'attribution', ...}] (앞쪽이 우선순위 높음)
+    :return: 유효 이미지 목록 (url은 최종 URL로 교체, 원래 순서 유지)
+    """
+    print(f"[⚙️] '{place_name}': 수집된 {len(images_data)}개 이미지의 URL 추적 및 최종 검증 (동시 {max_workers}개)...")
+    validated = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(probe_image_url, image_data['url']): index for index, image_data in enumerate(images_data)}
+        for future in as_completed(futures):
+            final_url = future.result()
+            if not final_url:
+                continue
+            index = futures[future]
+            validated[index] = dict(images_data[index], url=final_url)
+            if len(validated) >= max_valid:
+                for pending in futures:
+                    pending.cancel()
+                break
+    finally:
+        executor.shutdown(wait=False)
+
+    # 먼저 끝난 순서가 아닌 원래 우선순위(Pexels → Google) 순서로 정렬
+    return [validated[index] for index in sorted(validated)][:max_valid]
+
+_lookup_cache_backend = None
+_lookup_cache_lock = threading.Lock()
+LOOKUP_CACHE_STATS = {source: {"hits": 0, "misses": 0} for source in LOOKUP_CACHE_TTL_SECONDS}
+
+def _lookup_cache():
+    """Places/Pexels/YouTube 조회 캐시 (열 수 없는 환경이면 None - 캐시 없이 동작)"""
+    global _lookup_cache_backend
+    with _lookup_cache_lock:
+        if _lookup_cache_backend is None:
+            try:
+                _lookup_cache_backend = SQLiteCacheBackend(LOOKUP_CACHE_DB)
+            except (OSError, sqlite3.Error) as e:
+                print(f"[⚠️] 조회 캐시를 열 수 없어 캐시 없이 진행합니다: {e}")
+                _lookup_cache_backend = False
+        return _lookup_cache_backend or None
+
+def cached_lookup(source, key_parts, fetch):
+    """
+    외부 API 원본 응답 캐시 조회 (없으면 fetch 호출 후 저장)
+    - API 키가 들어간 URL 등은 저장하지 않도록 원본 응답만 캐시
+    - fetch에서 발생한 예외와 빈 결과는 저장하지 않음 (일시적인 빈 응답이 TTL 동안 고정되지 않도록)
+    :param source: 'places' / 'pexels' / 'youtube'
+    :param key_parts: 캐시 키 구성 값 (장소명, 카테고리, 필드 마스크/파라미터)
+    :param fetch: 캐시 미스 시 호출할 함수
+    """
+    cache = _lookup_cache()
+    key = f"{source}:" + hashlib.sha256(json.dumps(key_parts, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+    if cache:
+        try:
+            cached = cache.get(key)
+        except sqlite3.Error:
+            cached = None
+        if cached is not None:
+            with _lookup_cache_lock:
+                LOOKUP_CACHE_STATS[source]["hits"] += 1
+            print(f"[💾] {source} 캐시 사용 ({key_parts[0]})")
+            return cached["data"]
+
+    with _lookup_cache_lock:
+        LOOKUP_CACHE_STATS[source]["misses"] += 1
+    data = fetch()
+    if cache and data:
         try:
-            img = Image.open(BytesIO(response.content))
-            img.verify()
-            if img.size[0] < 100 or img.size[1] < 100: return False
-            return True
-        except Exception: return False
-    except requests.RequestException: return False
+            cache.set(key, {"data": data}, LOOKUP_CACHE_TTL_SECONDS[source])
+        except sqlite3.Error:
+            pass
+    return data
+
+def print_lookup_cache_stats():
+    """소스별 조회 캐시 적중 통계 출력"""
+    print("[📊] 조회 캐시 통계:")
+    for source, counts in LOOKUP_CACHE_STATS.items():
+        total = counts["hits"] + counts["misses"]
+        hit_rate = (counts["hits"] / total * 100) if total else 0
+        print(f"  - {source}: 적중 {counts['hits']} / 미스 {counts['misses']} (적중률 {hit_rate:.1f}%)")
 
 def get_google_place_details(cfg, place_name, category_name):
     search_query = f"{place_name} in {category_name} tourist attraction landmark"
     print(f"[🔍] '{search_query}': Google Places API에서 정보 및 사진 출처를 검색합니다...")
     api_key = cfg["google_places_api_key"]
     search_url = "https://places.googleapis.com/v1/places:searchText"
+    # 장기 캐시는 안정적인 필드만, 사진 이름(만료됨)은 같은 요청으로 받되 짧은 TTL로 따로 보관
+    stable_field_mask = "places.id,places.displayName,places.formattedAddress,places.websiteUri,places.editorialSummary,places.regularOpeningHours"
+    photo_field_mask = "photos.name,photos.authorAttributions"
     search_headers = {
         "Content-Type": "application/json",
         "X-Goog-Api-Key": api_key,
-        "X-Goog-FieldMask": "places.id,places.displayName,places.formattedAddress,places.websiteUri,places.editorialSummary,places.photos.name,places.photos.authorAttributions,places.regularOpeningHours"
+        "X-Goog-FieldMask": f"{stable_field_mask},places.photos.name,places.photos.authorAttributions"
     }
     search_data = {"textQuery": search_query, "languageCode": "ko"}
     details = {}
-    try:
+    fresh_photos = {}
+
+    def _fetch_places():
         response = requests.post(search_url, headers=search_headers, json=search_data, timeout=20)
         response.raise_for_status()
-        data = response.json()
-        places = data.get('places', [])
+        places = response.json().get('places', [])
+        for place in places:
+            fresh_photos[place.get('id')] = place.pop('photos', [])
+        return places
+
+    try:
+        places = cached_lookup("places", [place_name, category_name, stable_field_mask], _fetch_places)
         if not places: return None
         place_info = places[0]
+        place_id = place_info.get('id')
+
+        def _fetch_photos():
+            # 방금 검색한 응답의 사진이 있으면 재사용, 장소 정보가 캐시에서 왔으면 Place Details로 사진만 조회
+            if place_id in fresh_photos:
+                return fresh_photos[place_id]
+            response = requests.get(
+                f"https://places.googleapis.com/v1/places/{place_id}",
+                headers={"X-Goog-Api-Key": api_key, "X-Goog-FieldMask": photo_field_mask},
+                timeout=20
+            )
+            response.raise_for_status()
+            return response.json().get('photos', [])
+
+        photos = cached_lookup("place_photos", [place_name, place_id], _fetch_photos) if place_id else fresh_photos.get(place_id, [])
         details['place_id'] = place_info.get('id')
         details['overview'] = place_info.get('editorialSummary', {}).get('text', 'No information available.')
         details['address'] = place_info.get('formattedAddress', 'No information available.')
@@ -116,7 +271,6 @@ def get_google_place_details(cfg, place_name, category_name):
         opening_hours_texts = place_info.get('regularOpeningHours', {}).get('weekdayDescriptions', [])
         details['opening_hours'] = " \n ".join(opening_hours_texts) if opening_hours_texts else 'No information available.'
         image_data = []
-        photos = place_info.get('photos', [])
         for photo in photos:
             photo_name = photo.get('name')
             photo_url = f"https://places.googleapis.com/v1/{photo_name}/media?maxHeightPx=1200&key={api_key}"
@@ -143,9 +297,13 @@ def search_pexels_images(cfg, place_name, category_name):
     try:
         headers = {"Authorization": cfg['pexels_key']}
         params = {"query": search_query, "per_page": 15, "locale": "ko-KR"}
-        response = requests.get("https://api.pexels.com/v1/search", headers=headers, params=params, timeout=20)
-        response.raise_for_status()
-        results = response.json().get('photos', [])
+
+        def _fetch_photos():
+            response = requests.get("https://api.pexels.com/v1/search", headers=headers, params=params, timeout=20)
+            response.raise_for_status()
+            return response.json().get('photos', [])
+
+        results = cached_lookup("pexels", [place_name, category_name, params], _fetch_photos)
         image_data = []
         for item in results:
             image_data.append({
@@ -164,7 +322,37 @@ def search_pexels_images(cfg, place_name, category_name):
         print(f"[❌] '{search_query}': Pexels 데이터 처리 중 오류: {e}")
         return []
 
-def generate_gemini_content(place_name, place_details, context_images):
+def _table_data_format(place_details):
+    """요약 테이블 데이터 출력 형식 (본문 생성/누락 섹션 보완 요청 공용)"""
+    return (
+        f"--- 요약 테이블 데이터 형식 시작 ---\n<TABLE_DATA>\n"
+        f"위치: [{place_details.get('address')}]\n"
+        f"운영시간: [핵심 운영 시간과 휴무일을 요약하여 기입]\n"
+        f"입장료: [알려진 입장료 정보 기입, 무료인 경우 '무료'라고 명시, 변동 가능성 언급]\n"
+        f"공식 웹사이트: [{place_details.get('homepage')}]\n"
+        f"추천 방문 시기: [가장 방문하기 좋은 계절이나 요일 명시]\n"
+        f"방문꿀팁: [가장 중요한 팁 하나를 30자 내외로 요약하여 기입]\n"
+        f"</TABLE_DATA>\n--- 요약 테이블 데이터 형식 끝 ---\n\n"
+    )
+
+def _faq_data_format():
+    """FAQ 데이터 출력 형식 (본문 생성/누락 섹션 보완 요청 공용)"""
+    return (
+        f"--- FAQ 데이터 형식 시작 (정확히 5개 항목) ---\n<FAQ_DATA>\n"
+        f"Q1: [여행자들이 가장 궁금해할 만한 실용적인 첫 번째 질문 작성 (예: 티켓 예매 방법)]\nA1: [첫 번째 질문에 대한 상세하고 친절한 답변 작성]\n"
+        f"Q2: [두 번째 예상 질문 작성 (예: 사진 촬영 팁)]\nA2: [두 번째 답변 작성]\n"
+        f"Q3: [세 번째 예상 질문 작성 (예: 소요 시간)]\nA3: [세 번째 답변 작성]\n"
+        f"Q4: [네 번째 예상 질문 작성 (예: 근처 다른 관광지)]\nA4: [네 번째 답변 작성]\n"
+        f"Q5: [다섯 번째 예상 질문 작성 (예: 어린이나 노약자 동반 시 팁)]\nA5: [다섯 번째 답변 작성]\n"
+        f"</FAQ_DATA>\n--- FAQ 데이터 형식 끝 ---"
+    )
+
+def _has_article_body(text):
+    """TABLE_DATA/FAQ_DATA 블록을 제외한 본문이 있는지 (본문 없는 응답은 캐시하지 않음)"""
+    body = re.sub(r'<(TABLE_DATA|FAQ_DATA)>.*?</\1>', '', text, flags=re.DOTALL)
+    return bool(body.strip())
+
+def generate_gemini_content(place_name, place_details, context_images, bypass_cache=False):
     print(f"[🤖] '{place_name}': Gemini AI로 강화된 본문, 테이블, FAQ 데이터 생성을 시작합니다...")
     model = genai.GenerativeModel('gemini-1.5-pro-latest')
     prompt_parts = [
@@ -174,14 +362,23 @@ def generate_gemini_content(place_name, place_details, context_images):
         f"### 참고 사진 (Reference Photos):\n(아래 첨부된 사진들을 참고하여, 사진의 분위기와 특징을 글에 자연스럽게 녹여내세요.)\n",
     ]
     image_count = 0
+    store = _image_store()
     for img_data in context_images:
         if image_count >= 3: break
         try:
-            response_img = requests.get(img_data['url'], timeout=15)
-            response_img.raise_for_status()
-            img_bytes = response_img.content
-            mime_type = response_img.headers.get('Content-Type', 'image/jpeg')
-            prompt_parts.append({"mime_type": mime_type, "data": img_bytes})
+            # 이전 실행이나 검증 단계에서 저장한 바이트가 있으면 다시 내려받지 않음
+            stored = store.get_bytes(img_data['url']) if store else None
+            if stored:
+                img_bytes, mime_type = stored
+            else:
+                response_img = requests.get(img_data['url'], timeout=15)
+                response_img.raise_for_status()
+                img_bytes = response_img.content
+                mime_type = response_img.headers.get('Content-Type', 'image/jpeg')
+                if store:
+                    record = store.lookup(img_data['url']) or {}
+                    store.put(img_data['url'], img_bytes, mime_type, record.get('width'), record.get('height'))
+            prompt_parts.append({"mime_type": mime_type or 'image/jpeg', "data": img_bytes})
             image_count += 1
         except Exception as e:
             print(f"[⚠️] '{place_name}': Gemini용 이미지 다운로드({img_data['url']}) 오류: {e}")
@@ -195,97 +392,160 @@ def generate_gemini_content(place_name, place_details, context_images):
                         f"#### [여행 꿀팁: 최적 방문 시기, 입장료, 주변 정보]\n[가장 여행하기 좋은 계절이나 시간대, 공식적인 입장료 정보, 예상치 못한 비용, 주변의 다른 볼거리 등을 구체적인 팁과 함께 작성]\n\n"
                         f"#### [현지인 추천: 주변 맛집 & 특색있는 카페]\n[관광지 근처에서 식사하거나 차를 마시기 좋은, 현지인에게 인기 있는 식당이나 카페 1~2곳을 추천 이유와 함께 소개]\n"
                         f"--- 블로그 글 형식 끝 ---\n\n"
-                        f"--- 요약 테이블 데이터 형식 시작 ---\n<TABLE_DATA>\n"
-                        f"위치: [{place_details.get('address')}]\n"
-                        f"운영시간: [핵심 운영 시간과 휴무일을 요약하여 기입]\n"
-                        f"입장료: [알려진 입장료 정보 기입, 무료인 경우 '무료'라고 명시, 변동 가능성 언급]\n"
-                        f"공식 웹사이트: [{place_details.get('homepage')}]\n"
-                        f"추천 방문 시기: [가장 방문하기 좋은 계절이나 요일 명시]\n"
-                        f"방문꿀팁: [가장 중요한 팁 하나를 30자 내외로 요약하여 기입]\n"
-                        f"</TABLE_DATA>\n--- 요약 테이블 데이터 형식 끝 ---\n\n"
-                        f"--- FAQ 데이터 형식 시작 (정확히 5개 항목) ---\n<FAQ_DATA>\n"
-                        f"Q1: [여행자들이 가장 궁금해할 만한 실용적인 첫 번째 질문 작성 (예: 티켓 예매 방법)]\nA1: [첫 번째 질문에 대한 상세하고 친절한 답변 작성]\n"
-                        f"Q2: [두 번째 예상 질문 작성 (예: 사진 촬영 팁)]\nA2: [두 번째 답변 작성]\n"
-                        f"Q3: [세 번째 예상 질문 작성 (예: 소요 시간)]\nA3: [세 번째 답변 작성]\n"
-                        f"Q4: [네 번째 예상 질문 작성 (예: 근처 다른 관광지)]\nA4: [네 번째 답변 작성]\n"
-                        f"Q5: [다섯 번째 예상 질문 작성 (예: 어린이나 노약자 동반 시 팁)]\nA5: [다섯 번째 답변 작성]\n"
-                        f"</FAQ_DATA>\n--- FAQ 데이터 형식 끝 ---")
+                        + _table_data_format(place_details)
+                        + _faq_data_format())
     try:
-        response_gen_content = model.generate_content(prompt_parts, generation_config={"response_mime_type": "text/plain"})
+        response_gen_content = generate_content_cached(
+            model, prompt_parts, generation_config={"response_mime_type": "text/plain"},
+            bypass=bypass_cache, validate=_has_article_body
+        )
         print(f"[✅] '{place_name}': 콘텐츠 생성을 완료했습니다.")
         return response_gen_content.text
     except Exception as e:
         print(f"[❌] '{place_name}': Gemini 콘텐츠 생성 중 오류 발생: {e}")
         return None
 
-def generate_dedicated_title(place_name, post_content_summary):
-    print(f"[🤖] '{place_name}': 전용 제목 생성을 시도합니다...")
-    fallback_title = place_name
+def generate_missing_sections(place_name, place_details, article_body, missing_sections):
+    """
+    이미 생성된 본문을 재사용해 누락된 섹션(테이블/FAQ)만 텍스트로 요청 (이미지 재전송 없음)
+    :param missing_sections: "table", "faq" 중 누락된 항목 목록
+    :return: 요청한 태그 블록이 담긴 응답 텍스트 또는 None
+    """
+    print(f"[🤖] '{place_name}': 누락된 섹션만 생성합니다: {', '.join(missing_sections)}")
     model = genai.GenerativeModel('gemini-1.5-pro-latest')
-    prompt = f"당신은 사용자의 클릭을 극대화하는 매우 창의적인 여행 블로그 전문 카피라이터입니다.\n다음 여행지와 게시물 핵심 내용 요약을 바탕으로, 사용자의 시선을 즉시 사로잡고 반드시 클릭하고 싶게 만드는 매우 매력적인 블로그 게시물 제목을 **오직 하나만, 다른 설명 없이 제목 텍스트 자체만** 생성해주세요.\n[요구사항]\n1. '{place_name}' 키워드를 자연스럽게 포함하되, 단순 나열이 아닌 흥미로운 방식으로 활용하세요.\n2. 제목의 길이는 한글 기준 15자 이상 40자 이하로 작성해주세요.\n3. 예시: \"{place_name} 여행의 모든 것: 놓치지 말아야 할 숨은 명소 TOP 5 전격 공개!\"\n4. 결과는 오직 제목 텍스트만이어야 하며, '# 제목:'과 같은 접두어나 따옴표, 줄바꿈 등을 절대 포함하지 마세요.\n[여행지명]\n{place_name}\n[게시물 핵심 내용 요약]\n{post_content_summary}\n생성할 제목:"
+    section_formats = []
+    required_tags = []
+    if "table" in missing_sections:
+        section_formats.append(_table_data_format(place_details))
+        required_tags.append("</TABLE_DATA>")
+    if "faq" in missing_sections:
+        section_formats.append(_faq_data_format())
+        required_tags.append("</FAQ_DATA>")
+
+    prompt = (
+        f"당신은 여행 블로그 전문 SEO 에디터입니다. 아래는 해외 여행지 '{place_name}'에 대해 이미 작성된 블로그 글입니다. "
+        f"이 글과 공식 정보를 바탕으로 아래 형식의 데이터만 정확히 생성해주세요. 본문이나 다른 설명은 절대 출력하지 마세요.\n\n"
+        f"### 공식 정보 요약:\n- 주소: {place_details.get('address')}\n- 운영시간: {place_details.get('opening_hours')}\n- 홈페이지: {place_details.get('homepage')}\n\n"
+        f"### 작성된 블로그 글:\n{article_body}\n\n"
+        + "\n\n".join(section_formats)
+    )
+    try:
+        response = generate_content_cached(
+            model, prompt, generation_config={"response_mime_type": "text/plain"},
+            validate=lambda text: all(tag in text for tag in required_tags)
+        )
+        return response.text
+    except Exception as e:
+        print(f"[❌] '{place_name}': 누락 섹션 생성 중 오류 발생: {e}")
+        return None
 
-    for i in range(3):
-        try:
-            print(f"[🤖] -> 제목 생성 시도 ({i+1}/3)...")
-            response = model.generate_content(prompt)
-            new_title = response.text.strip()
-            if new_title and '\n' not in new_title and (10 <= len(new_title) <= 50):
-                print(f"[✅] '{place_name}': 전용 제목 생성 성공: '{new_title}'")
-                return new_title
-            else:
-                print(f"[⚠️] -> 생성된 제목이 유효성 검증에 실패했습니다: '{new_title}'")
-        except Exception as e:
-            print(f"[❌] -> 제목 생성 중 API 오류 발생: {e}")
-        if i < 2: time.sleep(2)
+def _is_valid_title(title):
+    return bool(title) and '\n' not in title and (10 <= len(title) <= 50)
 
-    print(f"[⚠️] '{place_name}': 전용 제목 생성에 최종 실패하여 폴백 제목을 사용합니다.")
-    return fallback_title
+def _is_valid_keyphrase(keyphrase):
+    return bool(keyphrase) and '\n' not in keyphrase and 2 <= len(keyphrase.split()) <= 7
 
-def generate_focus_keyphrase(place_name, post_content_summary):
-    print(f"[🤖] '{place_name}': 초점 키프레이즈를 생성합니다...")
-    fallback_keyphrase = f"{place_name} 가볼만한 곳"
-    try:
-        model = genai.GenerativeModel('gemini-1.5-pro-latest')
-        prompt = f"당신은 여행 블로그 전문 SEO 콘텐츠 전략가입니다. 주어진 정보를 바탕으로, 워드프레스 블로그 글에 사용할 최적의 '초점 키프레이즈'를 딱 하나만 생성해 주세요.\n[정보]\n* 글의 핵심 주제: {place_name} 상세 소개 및 여행 정보\n[규칙]\n1. '{place_name}' 또는 관련 지리적 명칭을 자연스럽게 포함해야 합니다.\n2. 3~5 단어의 '롱테일 키프레이즈' 형태여야 합니다.\n3. 사용자의 검색 의도가 명확히 드러나는 단어(예: 가볼만한 곳, 필수 코스, 후기, 팁)를 포함해야 합니다.\n4. 생성된 키프레이즈 외에 다른 설명, 줄 바꿈, 따옴표 등은 절대 포함하지 마세요."
-        response = model.generate_content(prompt)
-        keyphrase = response.text.strip()
-        if not keyphrase or '\n' in keyphrase or len(keyphrase.split()) < 2 or len(keyphrase.split()) > 7: return fallback_keyphrase
-        print(f"[✅] '{place_name}': 초점 키프레이즈 생성 완료: {keyphrase}")
-        return keyphrase
-    except Exception as e:
-        print(f"[❌] '{place_name}': 초점 키프레이즈 생성 실패: {e}. 폴백을 사용합니다.")
-        return fallback_keyphrase
+def _is_valid_meta_description(description):
+    return 110 <= len(description) <= 160
 
-def generate_meta_description(focus_keyphrase, place_name, post_content_summary):
-    print(f"[🤖] '{place_name}': 메타 설명을 생성합니다...")
-    fallback_description = f"'{focus_keyphrase}'에 대한 모든 것! 입장료, 교통 정보부터 숨겨진 관람 팁까지 완벽 가이드를 확인해보세요."
-    try:
-        model = genai.GenerativeModel('gemini-1.5-pro-latest')
-        prompt = f"당신은 SEO 전문 카피라이터입니다. 주어진 정보와 '초점 키프레이즈'를 바탕으로, 구글 검색에 노출될 매력적인 '메타 설명'을 한 문단만 생성해 주세요.\n[정보]\n* 글의 핵심 주제: {place_name} 여행 정보\n* 초점 키프레이즈: {focus_keyphrase}\n[규칙]\n1. '{focus_keyphrase}'를 문장 안에 자연스럽게 포함하고, 가급적 문장 앞부분에 배치하세요.\n2. 글의 핵심 내용을 요약하며 궁금증을 자아내는 문구를 사용하세요.\n3. 클릭을 유도하는 문구(Call to Action)를 적절히 사용해 주세요.\n4. 전체 길이는 한글 기준 120자 이상, 150자 이하로 작성해야 합니다.\n5. 생성된 메타 설명 외에 다른 설명, 줄 바꿈, 따옴표 등은 절대 포함하지 마세요."
-        response = model.generate_content(prompt)
-        description = response.text.strip()
-        if not (110 <= len(description) <= 160): return fallback_description
-        print(f"[✅] '{place_name}': 메타 설명 생성 완료.")
-        return description
-    except Exception as e:
-        print(f"[❌] '{place_name}': 메타 설명 생성 실패: {e}. 폴백을 사용합니다.")
-        return fallback_description
+SEO_METADATA_FIELDS = ("title", "focus_keyphrase", "meta_description", "tags")
+SEO_METADATA_MAX_ROUNDS = 3
 
-def generate_tags(place_name, post_content_summary):
-    print(f"[🤖] '{place_name}': 게시물 태그를 생성합니다...")
-    fallback_tags = [place_name, f"{place_name.split()[-1]} 여행", f"{place_name} 가볼만한곳", f"{place_name} 추천"]
+def _normalize_tags(value):
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, list):
+        return []
+    return [str(tag).strip() for tag in value if str(tag).strip()][:10]
+
+def _validate_seo_field(field, value):
+    """SEO 필드 로컬 검증"""
+    if field == "tags":
+        return bool(_normalize_tags(value))
+    if not isinstance(value, str):
+        return False
+    value = value.strip()
+    if field == "title":
+        return _is_valid_title(value)
+    if field == "focus_keyphrase":
+        return _is_valid_keyphrase(value)
+    if field == "meta_description":
+        return _is_valid_meta_description(value)
+    return False
+
+def _parse_seo_json(text):
+    """응답에서 JSON 객체 추출 (코드 블록으로 감싼 경우 포함)"""
+    match = re.search(r'\{.*\}', text or "", re.DOTALL)
+    if not match:
+        return {}
     try:
-        model = genai.GenerativeModel('gemini-1.5-pro-latest')
-        prompt = f"당신은 SEO 전문가입니다. 다음 여행지에 대한 블로그 글의 핵심 내용을 바탕으로, 검색 최적화에 가장 효과적인 키워드 5~10개를 쉼표(,)로 구분된 하나의 문자열로 만들어주세요.\n[요구사항]\n- '{place_name}'을(를) 포함한 핵심/관련 키워드를 조화롭게 포함하세요.\n- 각 키워드는 실제 검색어처럼 자연스러워야 합니다.\n- 결과는 오직 '키워드1,키워드2,키워드3' 형식으로만 출력하고 다른 설명은 절대 추가하지 마세요.\n[여행지 및 글 내용 요약]\n여행지: {place_name}\n내용 요약: {post_content_summary[:500]}"
-        response = model.generate_content(prompt)
-        tags_string = response.text.strip()
-        tags = [tag.strip() for tag in tags_string.split(',') if tag.strip()][:10]
-        if not tags: return fallback_tags
-        print(f"[✅] '{place_name}': 태그 {len(tags)}개 생성 완료.")
-        return tags
-    except Exception as e:
-        print(f"[❌] '{place_name}': 태그 생성 실패: {e}. 폴백을 사용합니다.")
-        return fallback_tags
+        data = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def generate_seo_metadata(place_name, post_content_summary):
+    """
+    제목, 초점 키프레이즈, 메타 설명, 태그를 JSON 한 번으로 생성
+    - 각 필드를 로컬 규칙으로 검증하고, 실패한 필드만 다시 요청
+    - 끝까지 실패한 필드는 폴백 값 사용
+    :return: {"title", "focus_keyphrase", "meta_description", "tags"}
+    """
+    print(f"[🤖] '{place_name}': SEO 메타데이터(제목/키프레이즈/메타 설명/태그)를 생성합니다...")
+    model = genai.GenerativeModel('gemini-1.5-pro-latest')
+    field_rules = {
+        "title": f"사용자의 클릭을 극대화하는 매력적인 블로그 제목. '{place_name}' 키워드를 자연스럽게 포함하고, 한글 기준 15자 이상 40자 이하, 줄바꿈/따옴표/'# 제목:' 같은 접두어 없이 제목 텍스트만",
+        "focus_keyphrase": f"워드프레스 초점 키프레이즈 하나. '{place_name}' 또는 관련 지리적 명칭 포함, 3~5 단어의 롱테일 키프레이즈, 검색 의도가 드러나는 단어(가볼만한 곳, 필수 코스, 후기, 팁 등) 포함",
+        "meta_description": "구글 검색에 노출될 메타 설명 한 문단. focus_keyphrase를 가급적 앞부분에 자연스럽게 포함하고, 클릭을 유도하는 문구 사용, 한글 기준 120자 이상 150자 이하, 줄바꿈 없음",
+        "tags": f"검색 최적화에 효과적인 키워드 5~10개의 문자열 배열. '{place_name}'을(를) 포함한 핵심/관련 키워드"
+    }
+
+    accepted = {}
+    for round_no in range(1, SEO_METADATA_MAX_ROUNDS + 1):
+        pending_fields = [field for field in SEO_METADATA_FIELDS if field not in accepted]
+        if not pending_fields:
+            break
+
+        rules_text = "\n".join(f'- "{field}": {field_rules[field]}' for field in pending_fields)
+        accepted_text = json.dumps(accepted, ensure_ascii=False) if accepted else "없음"
+        prompt = (
+            f"당신은 여행 블로그 전문 SEO 콘텐츠 전략가이자 카피라이터입니다. 아래 여행지와 게시물 핵심 내용 요약을 바탕으로 "
+            f"다음 키를 가진 JSON 객체 하나만 출력하세요. 다른 설명은 절대 포함하지 마세요.\n"
+            f"[생성할 필드와 규칙]\n{rules_text}\n"
+            f"[이미 확정된 필드 (참고용, 다시 출력하지 마세요)]\n{accepted_text}\n"
+            f"[여행지명]\n{place_name}\n[게시물 핵심 내용 요약]\n{post_content_summary[:500]}"
+        )
+
+        print(f"[🤖] -> SEO 메타데이터 요청 ({round_no}/{SEO_METADATA_MAX_ROUNDS}): {', '.join(pending_fields)}")
+        try:
+            response = generate_content_cached(
+                model, prompt, generation_config={"response_mime_type": "application/json"},
+                validate=lambda text: all(_validate_seo_field(f, _parse_seo_json(text).get(f)) for f in pending_fields)
+            )
+            data = _parse_seo_json(response.text)
+        except Exception as e:
+            print(f"[❌] -> SEO 메타데이터 생성 중 API 오류 발생: {e}")
+            data = {}
+
+        for field in pending_fields:
+            value = data.get(field)
+            if _validate_seo_field(field, value):
+                accepted[field] = _normalize_tags(value) if field == "tags" else value.strip()
+            elif value is not None:
+                print(f"[⚠️] -> '{field}' 필드가 유효성 검증에 실패했습니다: {value!r}")
+
+    focus_keyphrase = accepted.get("focus_keyphrase", f"{place_name} 가볼만한 곳")
+    metadata = {
+        "title": accepted.get("title", place_name),
+        "focus_keyphrase": focus_keyphrase,
+        "meta_description": accepted.get("meta_description", f"'{focus_keyphrase}'에 대한 모든 것! 입장료, 교통 정보부터 숨겨진 관람 팁까지 완벽 가이드를 확인해보세요."),
+        "tags": accepted.get("tags", [place_name, f"{place_name.split()[-1]} 여행", f"{place_name} 가볼만한곳", f"{place_name} 추천"])
+    }
+    fallback_fields = [field for field in SEO_METADATA_FIELDS if field not in accepted]
+    if fallback_fields:
+        print(f"[⚠️] '{place_name}': 폴백 사용 필드: {', '.join(fallback_fields)}")
+    print(f"[✅] '{place_name}': SEO 메타데이터 생성 완료 (제목: '{metadata['title']}', 태그 {len(metadata['tags'])}개)")
+    return metadata
 
 def extract_table_data_and_format_html(raw_content, place_name):
     try:
@@ -345,10 +605,14 @@ def extract_faq_data_and_format_html(raw_content):
 def create_gallery_html(image_urls, place_name):
     if not image_urls: return ""
     print(f"[⚙️] '{place_name}': {len(image_urls)}개 이미지로 Masonry 갤러리 HTML 생성을 시작합니다...")
+    store = _image_store()
     gallery_html = '<div class="masonry-gallery">\n'
     for url in image_urls:
         alt_text = f"{place_name} 갤러리 이미지"
-        gallery_html += f'<div class="masonry-item"><img src="{url}" alt="{alt_text}" loading="lazy"/></div>\n'
+        # 검증 단계에서 기록한 크기로 width/height 지정 (레이아웃 이동 방지)
+        record = store.lookup(url) if store else None
+        size_attrs = f' width="{record["width"]}" height="{record["height"]}"' if record and record.get('width') else ""
+        gallery_html += f'<div class="masonry-item"><img src="{url}" alt="{alt_text}"{size_attrs} loading="lazy"/></div>\n'
     gallery_html += '</div>\n'
     print(f"[✅] '{place_name}': Masonry 갤러리 HTML 생성을 완료했습니다.")
     return gallery_html
@@ -391,9 +655,14 @@ def search_youtube_video(place_name, category_name, api_key):
             'maxResults': 1, 'type': 'video', 'videoEmbeddable': 'true',
             'relevanceLanguage': 'ko'
         }
-        response = requests.get(search_url, params=params, timeout=20)
-        response.raise_for_status()
-        results = response.json().get('items', [])
+
+        def _fetch_videos():
+            response = requests.get(search_url, params=params, timeout=20)
+            response.raise_for_status()
+            return response.json().get('items', [])
+
+        cache_params = {k: v for k, v in params.items() if k != 'key'}
+        results = cached_lookup("youtube", [place_name, category_name, cache_params], _fetch_videos)
         if results:
             video_id = results[0]['id']['videoId']
             channel_title = results[0]['snippet']['channelTitle']
@@ -518,97 +787,121 @@ def create_faq_schema_html(qas_data, place_name):
         print(f"[❌] '{place_name}': FAQ 스키마 생성 중 오류: {e}")
         return ""
 
+_tag_index = None
+
 def ensure_tags_on_wordpress(cfg, tag_list, place_name):
+    """
+    태그 이름 → ID 변환 (로컬 태그 인덱스 조회, 없는 태그만 생성)
+    :return: 태그 ID 목록
+    """
+    global _tag_index
     print(f"[☁️] '{place_name}': 워드프레스에 태그를 확인하고 등록합니다...")
-    auth = (cfg["wp_user"], cfg["wp_app_pass"])
-    headers = {'Content-Type': 'application/json'}
-    tag_ids = []
-    for tag_name in tag_list:
-        if not tag_name: continue
-        try:
-            res = requests.get(f"{cfg['wp_api_base']}/tags", auth=auth, params={"search": tag_name}, headers=headers, timeout=10)
-            res.raise_for_status()
-            existing_tags = res.json()
-            found = False
-            if isinstance(existing_tags, list):
-                for tag_data in existing_tags:
-                    if isinstance(tag_data, dict) and tag_data.get('name', '').lower() == tag_name.lower():
-                        tag_ids.append(tag_data['id']); found = True; break
-            if not found:
-                print(f"[⚙️] '{place_name}': 태그 '{tag_name}'을(를) 새로 생성합니다...")
-                create_res = requests.post(f"{cfg['wp_api_base']}/tags", auth=auth, json={"name": tag_name}, headers=headers, timeout=10)
-                create_res.raise_for_status()
-                if create_res.status_code == 201: tag_ids.append(create_res.json()['id'])
-        except requests.exceptions.RequestException as e: print(f"[❌] '{place_name}': 태그 API 요청 중 오류 ('{tag_name}'): {e}")
+    if _tag_index is None:
+        _tag_index = WordPressTagIndex(cfg['wp_api_base'], (cfg["wp_user"], cfg["wp_app_pass"]))
+    tag_ids = _tag_index.resolve([tag_name for tag_name in tag_list if tag_name])
     print(f"[✅] '{place_name}': {len(tag_ids)}개의 태그 ID를 확보했습니다.")
     return tag_ids
 
+_wp_publisher = None
+
 def post_to_wordpress(cfg, post_data):
+    """
+    게시물 발행 (썸네일 메타는 생성 요청에 포함, 나머지 후속 설정은 배치/동시 요청)
+    :return: 발행 성공 여부
+    """
+    global _wp_publisher
     place_name_for_log = post_data.get('korean_slug', '알 수 없는 여행지')
     print(f"[🚀] '{place_name_for_log}': 워드프레스에 최종 게시물 발행을 시작합니다...")
-    auth = (cfg["wp_user"], cfg["wp_app_pass"])
-    headers = {'Content-Type': 'application/json'}
-    payload = {
+    if _wp_publisher is None:
+        _wp_publisher = WordPressPublisher(cfg['wp_url'], (cfg["wp_user"], cfg["wp_app_pass"]), posts_url=f"{cfg['wp_api_base']}/posts")
+    fields = {
         "title": post_data['title'], "content": post_data['content'], "status": "publish",
         "categories": [post_data['wp_category_id']], "tags": post_data['tag_ids'], "slug": post_data['korean_slug']
     }
     try:
-        print(f"[⚙️] 1단계 - 게시물을 생성합니다...")
-        created_post_res = requests.post(f"{cfg['wp_api_base']}/posts", auth=auth, json=payload, headers=headers, timeout=30)
-        created_post_res.raise_for_status()
-        post_json = created_post_res.json()
-        post_id, post_link = post_json.get("id"), post_json.get("link")
-        if not post_id:
-            print(f"[❌] '{place_name_for_log}': 게시물 생성 후 ID를 받아오지 못했습니다.")
-            return
-        print(f"[✅] '{place_name_for_log}': 게시물 생성 성공! (ID: {post_id})")
-
-        print(f"[⚙️] 2단계 - SEO 및 썸네일 메타데이터를 설정합니다...")
-        fifu_payload = {"meta": {"_fifu_image_url": post_data['featured_image_url']}}
-        requests.post(f"{cfg['wp_api_base']}/posts/{post_id}", auth=auth, json=fifu_payload, headers=headers, timeout=20)
-        print("[✅] FIFU 썸네일 설정 완료.")
-
-        yoast_payload = { "post_id": post_id, "focus_keyphrase": post_data['focus_keyphrase'], "meta_description": post_data['meta_description'] }
-        yoast_url = f"{cfg['wp_url'].rstrip('/')}/wp-json/my-api/v1/update-seo"
-        requests.post(yoast_url, auth=auth, json=yoast_payload, headers=headers, timeout=20)
-        print("[✅] Yoast SEO 메타데이터 설정 완료.")
-
-        print(f"[🎉] '{place_name_for_log}': 모든 작업 완료! 발행된 글 주소: {post_link}")
-    except requests.exceptions.RequestException as e:
-        print(f"[❌] '{place_name_for_log}': 워드프레스 게시 중 오류 발생: {e}")
-        if 'created_post_res' in locals() and created_post_res is not None: print(f"응답: {created_post_res.text[:500]}...")
+        result = _wp_publisher.publish(
+            fields,
+            meta={"_fifu_image_url": post_data['featured_image_url']},
+            seo={"focus_keyphrase": post_data['focus_keyphrase'], "meta_description": post_data['meta_description']}
+        )
     except Exception as e:
-        print(f"[❌] '{place_name_for_log}': 워드프레스 메타데이터 업데이트 중 예기치 않은 오류 발생: {e}")
+        print(f"[❌] '{place_name_for_log}': 워드프레스 게시 중 예기치 않은 오류 발생: {e}")
+        return False
 
-def process_single_place(cfg, place_name, current_category_id):
+    print(f"[⏱️] '{place_name_for_log}': 단계별 소요 시간 - {format_timings(result['timings'])}")
+    if not result['success']:
+        print(f"[❌] '{place_name_for_log}': {result['message']}")
+        if result.get('response'): print(f"응답: {result['response'][:500]}...")
+        return False
+
+    print(f"[✅] '{place_name_for_log}': 게시물 생성 성공! (ID: {result['post_id']})")
+    for step, message in result['failed_followups'].items():
+        print(f"[⚠️] '{place_name_for_log}': 후속 설정 '{step}' 실패 ({message})")
+    print(f"[🎉] '{place_name_for_log}': 모든 작업 완료! 발행된 글 주소: {result['post_url']}")
+    return True
+
+def prefetch_place_assets(cfg, place_name, current_category_id):
+    """
+    생성 전 수집 단계: Google Places, Pexels, YouTube 정보와 검증된 이미지
+    - 파이프라인 모드에서는 앞 여행지를 생성/발행하는 동안 백그라운드 스레드에서 실행
+    :return: 수집 결과 dict (발행할 수 없는 여행지면 None)
+    """
     category_name = CATEGORY_ID_TO_NAME.get(current_category_id, "")
-    print(f"\n{'='*15} '{place_name}' ({category_name}) 처리 시작 {'='*15}")
+    print(f"[⚙️] '{place_name}' ({category_name}): 장소/이미지/영상 정보 수집 시작...")
     try:
         place_details = get_google_place_details(cfg, place_name, category_name)
         if not place_details:
             print(f"[⚠️] '{place_name} ({category_name})': Google Places 정보를 가져오지 못해 건너뜁니다.")
-            return False
+            return None
 
         pexels_photos_data = search_pexels_images(cfg, place_name, category_name)
         google_photos_data = place_details.get('images', [])
         all_photos_data = pexels_photos_data + google_photos_data
         if not all_photos_data:
             print(f"[⚠️] '{place_name} ({category_name})': 수집된 이미지가 없어 건너뜁니다.")
-            return False
+            return None
 
-        print(f"[⚙️] '{place_name}': 수집된 {len(all_photos_data)}개 이미지의 URL 추적 및 최종 검증...")
-        validated_images_data = []
-        for image_data in all_photos_data:
-            final_url = get_final_redirected_url(image_data['url'])
-            if final_url and validate_image_url(final_url):
-                image_data['url'] = final_url
-                validated_images_data.append(image_data)
-            time.sleep(0.1)
+        validated_images_data = validate_images_concurrently(all_photos_data, place_name)
 
         if not validated_images_data:
             print(f"[❌] '{place_name}': 유효한 이미지가 없어 최종 중단합니다.")
+            return None
+        print(f"[✅] '{place_name}': 최종 유효 이미지 {len(validated_images_data)}개 확보.")
+
+        video_id, channel_title = search_youtube_video(place_name, category_name, cfg["google_places_api_key"])
+
+        return {
+            'place_details': place_details,
+            'pexels_photos_data': pexels_photos_data,
+            'google_photos_data': google_photos_data,
+            'validated_images_data': validated_images_data,
+            'video_id': video_id,
+            'channel_title': channel_title,
+        }
+    except Exception as e:
+        print(f"[❌] '{place_name} ({category_name})' 정보 수집 중 예기치 않은 오류 발생: {e}")
+        traceback.print_exc()
+        return None
+
+def process_single_place(cfg, place_name, current_category_id, assets=None):
+    """
+    여행지 1곳 처리: (수집) → 콘텐츠 생성 → SEO 메타데이터 → 발행
+    :param assets: prefetch_place_assets 결과 (None이면 여기서 수집)
+    :return: 발행 성공 여부
+    """
+    category_name = CATEGORY_ID_TO_NAME.get(current_category_id, "")
+    print(f"\n{'='*15} '{place_name}' ({category_name}) 처리 시작 {'='*15}")
+    try:
+        if assets is None:
+            assets = prefetch_place_assets(cfg, place_name, current_category_id)
+        if not assets:
             return False
-        print(f"[✅] 최종 유효 이미지 {len(validated_images_data)}개 확보.")
+
+        place_details = assets['place_details']
+        pexels_photos_data = assets['pexels_photos_data']
+        google_photos_data = assets['google_photos_data']
+        validated_images_data = assets['validated_images_data']
+        video_id, channel_title = assets['video_id'], assets['channel_title']
 
         featured_image_data = validated_images_data[0]
         gallery_images_urls = [item['url'] for item in validated_images_data[1:]]
@@ -616,20 +909,34 @@ def process_single_place(cfg, place_name, current_category_id):
         raw_content_full, table_html, raw_content_body, faq_html, qas_data = None, "", "", "", []
         for i in range(3):
             print(f"[🤖] 콘텐츠 생성 시도 ({i+1}/3)...")
-            raw_content_full = generate_gemini_content(place_name, place_details, validated_images_data)
+            # 재시도는 캐시를 건너뛰고 새로 생성 (같은 캐시 응답이 반복되지 않도록)
+            raw_content_full = generate_gemini_content(place_name, place_details, validated_images_data, bypass_cache=i > 0)
             if raw_content_full:
                 table_html, content_after_table = extract_table_data_and_format_html(raw_content_full, place_name)
                 faq_html, raw_content_body, qas_data = extract_faq_data_and_format_html(content_after_table)
-                if table_html and faq_html and raw_content_body:
-                    print(f"[✅] 시도 {i+1}/3: 테이블 및 FAQ 데이터 생성 성공."); break
-            print(f"[⚠️] 시도 {i+1}/3: 테이블 또는 FAQ 데이터가 누락되어 재시도합니다...")
+                if raw_content_body: break
+            print(f"[⚠️] 시도 {i+1}/3: 본문이 생성되지 않아 재시도합니다...")
             if i < 2: time.sleep(3)
 
+        # 테이블/FAQ가 누락된 경우 전체를 다시 만들지 않고 누락된 섹션만 보완
+        for i in range(2):
+            missing_sections = [name for name, section_html in (("table", table_html), ("faq", faq_html)) if not section_html]
+            if not missing_sections or not raw_content_body: break
+            print(f"[⚠️] 보완 시도 {i+1}/2: 누락된 섹션 {', '.join(missing_sections)}")
+            section_text = generate_missing_sections(place_name, place_details, raw_content_body, missing_sections)
+            if not section_text: continue
+            if not table_html:
+                table_html, _ = extract_table_data_and_format_html(section_text, place_name)
+            if not faq_html:
+                faq_html, _, qas_data = extract_faq_data_and_format_html(section_text)
+
+        if table_html and faq_html and raw_content_body:
+            print(f"[✅] 테이블 및 FAQ 데이터 생성 성공.")
+
         if not raw_content_full or not raw_content_body:
             print(f"[❌] '{place_name}': 콘텐츠 생성에 최종 실패하여 중단합니다.")
             return False
 
-        video_id, channel_title = search_youtube_video(place_name, category_name, cfg["google_places_api_key"])
         youtube_html = create_youtube_embed_html(video_id, place_name)
         maps_html = create_Maps_html(place_name, place_details.get('place_id'), cfg["google_places_api_key"])
         gallery_html = create_gallery_html(gallery_images_urls, place_name)
@@ -638,9 +945,10 @@ def process_single_place(cfg, place_name, current_category_id):
         # 1. 본문 HTML을 먼저 생성합니다.
         body_html_content = parse_and_format_html(raw_content_body, featured_image_data, place_name, table_html, gallery_html, maps_html, youtube_html)
 
-        # 2. 생성된 본문을 기반으로 SEO용 요약본과 최종 제목을 생성합니다.
+        # 2. 생성된 본문을 기반으로 SEO용 요약본과 제목/키프레이즈/메타 설명/태그를 한 번에 생성합니다.
         summary_for_seo = "".join(re.findall(r'<p>(.*?)</p>', body_html_content, re.DOTALL))[:500]
-        title = generate_dedicated_title(place_name, summary_for_seo)
+        seo_metadata = generate_seo_metadata(place_name, summary_for_seo)
+        title = seo_metadata["title"]
 
         # 3. 나머지 부가 정보들을 생성하고 최종 콘텐츠를 조립합니다.
         youtube_data_for_source = {"video_id": video_id, "channel_title": channel_title}
@@ -648,9 +956,9 @@ def process_single_place(cfg, place_name, current_category_id):
         faq_schema_html = create_faq_schema_html(qas_data, place_name)
         final_html_content = body_html_content + faq_html + sources_html + faq_schema_html
 
-        focus_keyphrase = generate_focus_keyphrase(place_name, summary_for_seo)
-        meta_description = generate_meta_description(focus_keyphrase, place_name, summary_for_seo)
-        tags = generate_tags(place_name, summary_for_seo)
+        focus_keyphrase = seo_metadata["focus_keyphrase"]
+        meta_description = seo_metadata["meta_description"]
+        tags = seo_metadata["tags"]
         tag_ids = ensure_tags_on_wordpress(cfg, tags, place_name)
 
         final_post_data = {
@@ -664,8 +972,7 @@ def process_single_place(cfg, place_name, current_category_id):
             print(f"[❌] '{place_name}': 최종 콘텐츠(제목 또는 본문)가 비어있어 발행을 중단합니다.")
             return False
 
-        post_to_wordpress(cfg, final_post_data)
-        return True
+        return post_to_wordpress(cfg, final_post_data)
 
     except Exception as e:
         print(f"[❌] '{place_name} ({category_name})' 처리 중 예기치 않은 최상위 오류 발생: {e}")
@@ -697,6 +1004,24 @@ def append_to_published_log(log_file, place_name):
     except Exception as e:
         print(f"[❌] 발행 기록 파일 '{log_file}'에 쓰는 중 오류 발생: {e}")
 
+def iter_round_robin_places(unpublished_by_category, active_categories):
+    """
+    카테고리를 번갈아 가며 발행 대상 여행지를 순서대로 반환 (소진된 카테고리는 제외)
+    :return: (category_id, place_name) 제너레이터
+    """
+    active_categories = list(active_categories)
+    category_cycler = itertools.cycle(active_categories)
+    while active_categories:
+        current_category_id = next(category_cycler)
+
+        if unpublished_by_category.get(current_category_id):
+            yield current_category_id, unpublished_by_category[current_category_id].pop(0)
+
+        if not unpublished_by_category.get(current_category_id) and current_category_id in active_categories:
+            active_categories.remove(current_category_id)
+            if not active_categories: break
+            category_cycler = itertools.cycle(active_categories)
+
 def run_automation_cycle(cfg):
     print("\n" + "="*20 + " 자동 포스팅 사이클 시작 " + "="*20)
 
@@ -728,37 +1053,51 @@ def run_automation_cycle(cfg):
     if not active_categories:
         print("[💡] 발행할 글이 있는 카테고리가 없습니다.")
     else:
-        category_cycler = itertools.cycle(active_categories)
-        max_attempts = total_unpublished_count + len(active_categories)
-        attempts = 0
+        place_iterator = iter_round_robin_places(unpublished_by_category, active_categories)
+        # 파이프라인: 순서를 유지한 채 다음 PREFETCH_AHEAD개 여행지의 수집 단계를 미리 실행
+        prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_AHEAD) if PREFETCH_AHEAD > 0 else None
+        prefetch_queue = []
+
+        def _fill_prefetch_queue():
+            # 남은 발행 수보다 많이 미리 수집하지 않음 (상한 도달 시 낭비되는 API 호출 방지)
+            queue_limit = min(PREFETCH_AHEAD + 1, MAX_POSTS_PER_RUN - succeeded_count_this_run)
+            while len(prefetch_queue) < queue_limit:
+                next_place = next(place_iterator, None)
+                if next_place is None: return
+                category_id, name = next_place
+                future = prefetch_executor.submit(prefetch_place_assets, cfg, name, category_id) if prefetch_executor else None
+                prefetch_queue.append((category_id, name, future))
 
-        while succeeded_count_this_run < MAX_POSTS_PER_RUN and attempts < max_attempts:
-            current_category_id = next(category_cycler)
-
-            if unpublished_by_category.get(current_category_id):
-                place_name = unpublished_by_category[current_category_id].pop(0)
+        try:
+            while succeeded_count_this_run < MAX_POSTS_PER_RUN:
+                # 현재 여행지와 그다음 PREFETCH_AHEAD개 여행지의 수집 작업을 채워 둠
+                _fill_prefetch_queue()
+                if not prefetch_queue: break
+                current_category_id, place_name, prefetch_future = prefetch_queue.pop(0)
 
                 print(f"\n--- 다음 대상 처리 ({succeeded_count_this_run + 1}/{MAX_POSTS_PER_RUN}) ---")
+                assets = prefetch_future.result() if prefetch_future else None
+                if prefetch_future and not assets:
+                    continue
 
-                if process_single_place(cfg, place_name, current_category_id):
+                if process_single_place(cfg, place_name, current_category_id, assets):
                     append_to_published_log(PUBLISHED_LOG_FILE, place_name)
                     succeeded_count_this_run += 1
 
-                    if sum(len(v) for v in unpublished_by_category.values()) == 0:
+                    if not prefetch_queue and sum(len(v) for v in unpublished_by_category.values()) == 0:
                         print("[💡] 발행할 모든 글을 처리했습니다.")
                         break
 
                     if succeeded_count_this_run < MAX_POSTS_PER_RUN:
                          print(f"\n--- 다음 처리까지 {POST_DELAY_SECONDS}초 대기합니다... ---")
                          time.sleep(POST_DELAY_SECONDS)
+        finally:
+            if prefetch_executor:
+                for _, _, pending in prefetch_queue:
+                    pending.cancel()
+                prefetch_executor.shutdown(wait=True)
 
-            if not unpublished_by_category.get(current_category_id) and current_category_id in active_categories:
-                active_categories.remove(current_category_id)
-                if not active_categories: break
-                category_cycler = itertools.cycle(active_categories)
-
-            attempts += 1
-
+    print_lookup_cache_stats()
     print("\n" + "="*21 + " 자동 포스팅 사이클 종료 " + "="*21)
     print(f"이번 실행에서 총 {succeeded_count_this_run}개의 글을 성공적으로 발행했습니다.")
 
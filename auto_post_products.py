@@ -9,17 +9,22 @@ AliExpress 어필리에이트 상품 자동 등록 시스템 v3.0
 import os
 import sys
 import json
-import requests
 import time
 import random
 import re
 import gc
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 import argparse
 import subprocess
 from urllib.parse import quote, unquote
 import google.generativeai as genai
 from prompt_templates import PromptTemplates
+import queue_store
+from llm_cache import generate_content_cached
+from wp_publisher import WordPressPublisher, format_timings
 
 def load_configuration():
     """환경 설정을 로드합니다 (.env 파일 우선)"""
@@ -56,14 +61,81 @@ def load_configuration():
     print("✅ 모든 필수 설정이 로드되었습니다.")
     return config
 
+QUEUE_PENDING_DIR = '/var/www/novacents/tools/queues/pending'
+DAEMON_STATUS_FILE = '/var/www/novacents/tools/cache/auto_post_daemon_status.json'
+DAEMON_POLL_INTERVAL = 5
+
+# 큐 모드 파이프라인 단계별 동시 실행 수 (Gemini 생성 / 워드프레스 발행)
+QUEUE_GENERATION_WORKERS = 3
+QUEUE_PUBLISH_WORKERS = 2
+
 def get_queue_files():
     """큐 파일 목록을 가져옵니다"""
-    queue_dir = '/var/www/novacents/tools/queues/pending'
+    queue_dir = QUEUE_PENDING_DIR
     if not os.path.exists(queue_dir):
         return []
     
     return [f for f in os.listdir(queue_dir) if f.endswith('.json')]
 
+class PipelineStage:
+    """큐 파이프라인 단계 (전용 스레드 풀 + 처리량/대기열 통계)"""
+    
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"queue-{name}")
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.started = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+    
+    def submit(self, func, *args):
+        with self._lock:
+            self.submitted += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.submitted - self.started)
+        return self.executor.submit(self._run, func, *args)
+    
+    def _run(self, func, *args):
+        with self._lock:
+            self.started += 1
+        started_at = time.monotonic()
+        try:
+            result = func(*args)
+        except Exception as e:
+            result = {'success': False, 'message': f"{self.name} 단계 오류: {str(e)}"}
+        elapsed = time.monotonic() - started_at
+        with self._lock:
+            self.busy_seconds += elapsed
+            if result.get('success'):
+                self.succeeded += 1
+            else:
+                self.failed += 1
+        return result
+    
+    def queue_depth(self):
+        """대기 중인 작업 수 (제출됐지만 아직 시작 안 됨)"""
+        with self._lock:
+            return self.submitted - self.started
+    
+    def stats(self, wall_seconds):
+        with self._lock:
+            done = self.succeeded + self.failed
+            return {
+                'workers': self.workers,
+                'succeeded': self.succeeded,
+                'failed': self.failed,
+                'queue_depth': self.submitted - self.started,
+                'max_queue_depth': self.max_queue_depth,
+                'avg_seconds': round(self.busy_seconds / done, 2) if done else 0,
+                'jobs_per_minute': round(done * 60 / wall_seconds, 2) if wall_seconds > 0 else 0
+            }
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
 class AliExpressPostingSystem:
     def __init__(self):
         """시스템 초기화"""
@@ -77,6 +149,9 @@ class AliExpressPostingSystem:
         self.wordpress_password = self.config['NOVACENTS_WP_APP_PASS']
         self.gemini_api_key = self.config['GEMINI_API_KEY']
         
+        # 워드프레스 발행기 (해외 여행지 포스팅과 공용, 세션 재사용)
+        self.wp_publisher = WordPressPublisher(self.wordpress_url, (self.wordpress_username, self.wordpress_password))
+        
         # AliExpress API 설정
         self.aliexpress_app_key = self.config['ALIEXPRESS_APP_KEY']
         self.aliexpress_secret = self.config['ALIEXPRESS_APP_SECRET']
@@ -87,10 +162,23 @@ class AliExpressPostingSystem:
         self.immediate_mode = False
         self.current_job_id = None
         
+        # 큐 저장소 (기본: queue_store 직접 접근, QUEUE_BACKEND=php면 queue_utils.php 호출)
+        self.queue_backend = self.config.get('QUEUE_BACKEND', 'python')
+        
+        # 작업 임대 (여러 워커가 같은 작업을 중복 발행하지 않도록 processing/으로 선점)
+        self.worker_id = queue_store.default_worker_id()
+        self.lease_seconds = int(self.config.get('QUEUE_LEASE_SECONDS', queue_store.DEFAULT_LEASE_SECONDS))
+        self.held_leases = set()
+        self._lease_lock = threading.Lock()
+        self._heartbeat_thread = None
+        
         # Gemini API 초기화
         genai.configure(api_key=self.gemini_api_key)
         self.gemini_model = genai.GenerativeModel('gemini-1.5-pro-latest')
         
+        # Gemini 응답 캐시 우회 여부 (LLM_CACHE_BYPASS=1 또는 --no-llm-cache)
+        self.llm_cache_bypass = self.config.get('LLM_CACHE_BYPASS') == '1'
+        
         print("🚀 AliExpress 자동 등록 시스템이 초기화되었습니다.")
 
     def call_php_function(self, function_name, *args):
@@ -131,19 +219,105 @@ class AliExpressPostingSystem:
             print(f"❌ PHP 함수 호출 실패: {e}")
             return None
     
+    def call_queue_function(self, function_name, *args):
+        """큐 저장소 함수를 호출합니다 (queue_store 우선, 실패 시 PHP 브리지로 대체)"""
+        if self.queue_backend != 'php':
+            try:
+                return getattr(queue_store, function_name)(*args)
+            except OSError as e:
+                print(f"⚠️ 큐 저장소 직접 접근 실패, PHP로 재시도합니다: {e}")
+        
+        php_function_name = {'update_queue_status_split': 'update_queue_status'}.get(function_name, function_name)
+        return self.call_php_function(php_function_name, *args)
+    
     def load_queue_split(self, queue_id):
         """분할 큐에서 특정 큐 항목을 로드합니다"""
-        return self.call_php_function('load_queue_split', queue_id)
+        return self.call_queue_function('load_queue_split', queue_id)
     
     def update_queue_status_split(self, queue_id, status, message=''):
-        """분할 큐의 상태를 업데이트합니다"""
-        return self.call_php_function('update_queue_status', queue_id, status, message)
+        """
+        분할 큐의 상태를 업데이트합니다
+        - processing: claim_job에서 선점하므로 별도 처리 없음
+        - failed: 임대를 반납하고 pending으로 되돌림 (다음 실행에서 재시도)
+        """
+        if self.queue_backend != 'php':
+            if status == 'processing':
+                return True
+            if status == 'failed':
+                return self.release_job(queue_id)
+        
+        result = self.call_queue_function('update_queue_status_split', queue_id, status)
+        self._forget_lease(queue_id)
+        return result
     
     def remove_job_from_queue(self, job_id):
         """즉시 발행 모드에서 큐에서 작업을 제거합니다"""
         if self.immediate_mode:
-            return self.call_php_function('remove_queue_split', job_id)
+            self._forget_lease(job_id)
+            return self.call_queue_function('remove_queue_split', job_id)
         return True
+    
+    def claim_job(self, queue_id):
+        """
+        pending 작업을 임대로 선점하고 데이터를 반환합니다
+        :return: 작업 데이터 (다른 워커가 이미 선점했으면 None)
+        """
+        if self.queue_backend == 'php':
+            return self.load_queue_split(queue_id)
+        
+        job_data = queue_store.claim_queue(queue_id, self.worker_id, self.lease_seconds)
+        if not job_data:
+            return None
+        
+        with self._lease_lock:
+            self.held_leases.add(job_data.get('queue_id', queue_id))
+        self._ensure_lease_heartbeat()
+        return job_data
+    
+    def release_job(self, queue_id):
+        """선점한 작업을 pending으로 되돌립니다"""
+        self._forget_lease(queue_id)
+        return queue_store.release_queue(queue_id, self.worker_id)
+    
+    def release_held_jobs(self):
+        """아직 반납하지 않은 임대를 모두 pending으로 되돌립니다 (종료 시)"""
+        with self._lease_lock:
+            held = list(self.held_leases)
+        for queue_id in held:
+            print(f"↩️ 처리하지 못한 작업 반납: {queue_id}")
+            self.release_job(queue_id)
+    
+    def _forget_lease(self, queue_id):
+        with self._lease_lock:
+            self.held_leases.discard(queue_id)
+    
+    def _ensure_lease_heartbeat(self):
+        """보유 임대를 주기적으로 연장하는 하트비트 스레드 시작"""
+        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+            return
+        
+        def heartbeat():
+            while True:
+                time.sleep(max(1, self.lease_seconds // 3))
+                with self._lease_lock:
+                    held = list(self.held_leases)
+                for queue_id in held:
+                    if not queue_store.renew_lease(queue_id, self.worker_id, self.lease_seconds):
+                        print(f"⚠️ 임대 연장 실패 (회수됨): {queue_id}")
+                        self._forget_lease(queue_id)
+        
+        self._heartbeat_thread = threading.Thread(target=heartbeat, name="queue-lease-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+    
+    def reclaim_expired_jobs(self):
+        """중단된 워커가 남긴 만료 임대를 pending으로 회수합니다"""
+        if self.queue_backend == 'php':
+            return []
+        
+        reclaimed = queue_store.reclaim_expired_leases()
+        for queue_id in reclaimed:
+            print(f"♻️ 만료된 임대 회수: {queue_id}")
+        return reclaimed
 
 
     def generate_affiliate_link(self, original_url):
@@ -202,7 +376,7 @@ class AliExpressPostingSystem:
             )
             
             # Gemini API로 콘텐츠 생성
-            response = self.gemini_model.generate_content(prompt)
+            response = generate_content_cached(self.gemini_model, prompt, bypass=self.llm_cache_bypass)
             ai_content = response.text
             
             # 기존 HTML 구조에 AI 생성 콘텐츠 결합
@@ -251,7 +425,7 @@ class AliExpressPostingSystem:
             )
             
             # Gemini API로 콘텐츠 생성
-            response = self.gemini_model.generate_content(prompt)
+            response = generate_content_cached(self.gemini_model, prompt, bypass=self.llm_cache_bypass)
             ai_content = response.text
             
             # 기존 HTML 구조에 AI 생성 콘텐츠 결합
@@ -300,7 +474,7 @@ class AliExpressPostingSystem:
             )
             
             # Gemini API로 콘텐츠 생성
-            response = self.gemini_model.generate_content(prompt)
+            response = generate_content_cached(self.gemini_model, prompt, bypass=self.llm_cache_bypass)
             ai_content = response.text
             
             # 기존 HTML 구조에 AI 생성 콘텐츠 결합
@@ -397,7 +571,7 @@ class AliExpressPostingSystem:
             )
             
             # Gemini API로 콘텐츠 생성
-            response = self.gemini_model.generate_content(prompt)
+            response = generate_content_cached(self.gemini_model, prompt, bypass=self.llm_cache_bypass)
             ai_content = response.text
             
             # 기존 HTML 구조에 AI 생성 콘텐츠 결합
@@ -438,14 +612,8 @@ class AliExpressPostingSystem:
         return content
 
     def publish_to_wordpress(self, title, content, category_id, thumbnail_url=None):
-        """워드프레스에 글을 발행합니다"""
+        """워드프레스에 글을 발행합니다 (해외 여행지 포스팅과 같은 WordPressPublisher 사용)"""
         try:
-            # 워드프레스 REST API 엔드포인트
-            wp_api_url = f"{self.wordpress_url}/wp-json/wp/v2/posts"
-            
-            # 인증 정보
-            auth = (self.wordpress_username, self.wordpress_password)
-            
             # 발행 데이터 준비
             post_data = {
                 'title': title,
@@ -455,50 +623,26 @@ class AliExpressPostingSystem:
                 'format': 'standard'
             }
             
-            # 썸네일 URL이 있으면 추가
-            if thumbnail_url:
-                post_data['meta'] = {
-                    'thumbnail_url': thumbnail_url
-                }
-            
-            # 워드프레스에 POST 요청
-            headers = {
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            }
+            # 썸네일 URL이 있으면 생성 요청에 메타로 포함 (기존과 같이 후속 요청은 보내지 않음)
+            meta = {'thumbnail_url': thumbnail_url} if thumbnail_url else None
             
-            response = requests.post(wp_api_url, json=post_data, auth=auth, headers=headers, timeout=30)
+            result = self.wp_publisher.publish(post_data, meta=meta, retry_meta=False)
+            print(f"⏱️ 워드프레스 단계별 소요 시간: {format_timings(result['timings'])}")
             
-            if response.status_code in [200, 201]:
-                post_info = response.json()
-                post_url = post_info.get('link', '')
-                post_id = post_info.get('id', '')
-                
-                print(f"✅ 워드프레스 발행 성공: {post_url}")
+            if result['success']:
+                print(f"✅ 워드프레스 발행 성공: {result['post_url']}")
                 return {
                     'success': True,
-                    'post_id': post_id,
-                    'post_url': post_url,
-                    'message': '글이 성공적으로 발행되었습니다.'
-                }
-            else:
-                error_msg = f"워드프레스 발행 실패: HTTP {response.status_code}"
-                print(f"❌ {error_msg}")
-                print(f"응답 내용: {response.text}")
-                return {
-                    'success': False,
-                    'message': error_msg,
-                    'response': response.text
+                    'post_id': result['post_id'],
+                    'post_url': result['post_url'],
+                    'message': result['message']
                 }
+            
+            print(f"❌ {result['message']}")
+            if result.get('response'):
+                print(f"응답 내용: {result['response']}")
+            return {key: value for key, value in result.items() if key in ('success', 'message', 'response')}
                 
-        except requests.exceptions.Timeout:
-            error_msg = "워드프레스 API 요청 시간 초과"
-            print(f"❌ {error_msg}")
-            return {'success': False, 'message': error_msg}
-        except requests.exceptions.RequestException as e:
-            error_msg = f"워드프레스 API 요청 실패: {str(e)}"
-            print(f"❌ {error_msg}")
-            return {'success': False, 'message': error_msg}
         except Exception as e:
             error_msg = f"워드프레스 발행 중 오류: {str(e)}"
             print(f"❌ {error_msg}")
@@ -557,51 +701,245 @@ class AliExpressPostingSystem:
         """작업 상태를 업데이트합니다 (레거시 호환)"""
         return self.update_queue_status_split(job_id, status, message)
 
-    def run_queue_mode(self):
-        """큐 모드로 실행합니다"""
+    def run_queue_mode(self, generation_workers=QUEUE_GENERATION_WORKERS, publish_workers=QUEUE_PUBLISH_WORKERS):
+        """
+        큐 모드로 실행합니다 (단계별 파이프라인)
+        - 콘텐츠 생성(Gemini) → 워드프레스 발행 → 상태 갱신 단계를 각각의 스레드 풀에서 처리
+        - 한 작업이 발행되는 동안 다음 작업의 콘텐츠 생성이 진행됨
+        """
         print("🚀 큐 모드로 실행을 시작합니다...")
         
         try:
-            # 대기 중인 큐 파일들 가져오기
+            # 중단된 워커의 작업 회수 후 대기 중인 큐 파일들 가져오기
+            self.reclaim_expired_jobs()
             queue_files = get_queue_files()
             
             if not queue_files:
                 print("📭 처리할 큐 항목이 없습니다.")
                 return
             
-            print(f"📋 총 {len(queue_files)}개의 큐 항목을 발견했습니다.")
+            print(f"📋 총 {len(queue_files)}개의 큐 항목을 발견했습니다. (생성 {generation_workers}개 / 발행 {publish_workers}개 동시 처리)")
             
-            # 각 큐 항목 처리
+            stages = {
+                'generate': PipelineStage('generate', generation_workers),
+                'publish': PipelineStage('publish', publish_workers),
+                'status': PipelineStage('status', 1)
+            }
+            started_at = time.monotonic()
+            
+            # 진행 중인 future → (단계 이름, 큐 ID)
+            in_flight = {}
             for queue_file in queue_files:
-                try:
-                    queue_id = queue_file.replace('.json', '')
-                    print(f"\n🔄 큐 항목 처리 중: {queue_id}")
+                queue_id = queue_file.replace('.json', '')
+                in_flight[stages['generate'].submit(self._pipeline_generate, queue_id)] = ('generate', queue_id)
+            
+            succeeded = 0
+            failed = 0
+            try:
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        stage_name, queue_id = in_flight.pop(future)
+                        result = future.result()
+                        
+                        if stage_name == 'generate' and result['success']:
+                            in_flight[stages['publish'].submit(self._pipeline_publish, result)] = ('publish', queue_id)
+                        elif stage_name in ('generate', 'publish'):
+                            in_flight[stages['status'].submit(self._pipeline_update_status, queue_id, result)] = ('status', queue_id)
+                        else:
+                            if result.get('job_success'):
+                                succeeded += 1
+                            else:
+                                failed += 1
+                            print(f"📊 진행: {succeeded + failed}/{len(queue_files)} "
+                                  f"(생성 대기 {stages['generate'].queue_depth()}, 발행 대기 {stages['publish'].queue_depth()})")
+            finally:
+                for stage in stages.values():
+                    stage.shutdown()
+                self.release_held_jobs()
+            
+            wall_seconds = time.monotonic() - started_at
+            print(f"\n🎉 모든 큐 처리가 완료되었습니다. (성공 {succeeded}개, 실패 {failed}개, {wall_seconds:.1f}초)")
+            for name, stage in stages.items():
+                stats = stage.stats(wall_seconds)
+                print(f"  - {name}: 성공 {stats['succeeded']} / 실패 {stats['failed']}, "
+                      f"평균 {stats['avg_seconds']}초, {stats['jobs_per_minute']}건/분, 최대 대기 {stats['max_queue_depth']}")
+            
+        except Exception as e:
+            print(f"❌ 큐 모드 실행 중 오류: {str(e)}")
+
+    def _pipeline_generate(self, queue_id):
+        """파이프라인 1단계: 큐 데이터 로드 및 콘텐츠 생성"""
+        print(f"\n🔄 큐 항목 처리 중: {queue_id}")
+        
+        job_data = self.claim_job(queue_id)
+        if not job_data:
+            print(f"⏭️ 큐 항목을 선점하지 못했습니다 (다른 워커가 처리 중이거나 로드 실패): {queue_id}")
+            return {'success': False, 'skip_status': True, 'message': '큐 항목 선점 실패'}
+        
+        job_id = job_data.get('queue_id', queue_id)
+        print(f"🔄 작업 처리 시작: {job_data.get('title', '제목 없음')} (ID: {job_id})")
+        
+        content = self.generate_wordpress_content(job_data)
+        if not content:
+            return {'success': False, 'job_id': job_id, 'message': "콘텐츠 생성에 실패했습니다."}
+        
+        return {'success': True, 'job_id': job_id, 'job_data': job_data, 'content': content}
+
+    def _pipeline_publish(self, generated):
+        """파이프라인 2단계: 워드프레스 발행"""
+        job_data = generated['job_data']
+        result = self.publish_to_wordpress(
+            job_data.get('title', '제목 없음'),
+            generated['content'],
+            job_data.get('category_id', '356'),
+            job_data.get('thumbnail_url', '')
+        )
+        result['job_id'] = generated['job_id']
+        return result
+
+    def _pipeline_update_status(self, queue_id, result):
+        """파이프라인 3단계: 큐 상태 갱신 (단일 스레드에서 순서대로 처리)"""
+        try:
+            if result.get('skip_status'):
+                return {'success': True, 'job_success': False}
+            
+            job_id = result.get('job_id', queue_id)
+            if result['success']:
+                print(f"✅ 큐 항목 처리 완료: {queue_id}")
+                self.update_queue_status_split(job_id, 'completed', f"발행 완료: {result['post_url']}")
+            else:
+                print(f"❌ 큐 항목 처리 실패: {queue_id} - {result['message']}")
+                self.update_queue_status_split(job_id, 'failed', result['message'])
+            
+            return {'success': True, 'job_success': result['success']}
+        finally:
+            gc.collect()
+
+    def process_queue_file(self, queue_file):
+        """pending 디렉토리의 큐 파일 하나를 처리합니다"""
+        try:
+            queue_id = queue_file.replace('.json', '')
+            print(f"\n🔄 큐 항목 처리 중: {queue_id}")
+            
+            # 큐 항목 선점 (임대)
+            job_data = self.claim_job(queue_id)
+            if not job_data:
+                print(f"⏭️ 큐 항목을 선점하지 못했습니다 (다른 워커가 처리 중이거나 로드 실패): {queue_id}")
+                return {'success': False, 'message': '큐 항목 선점 실패'}
+            
+            # 작업 처리
+            result = self.process_job(job_data)
+            
+            if result['success']:
+                print(f"✅ 큐 항목 처리 완료: {queue_id}")
+            else:
+                print(f"❌ 큐 항목 처리 실패: {queue_id} - {result['message']}")
+            
+            return result
+            
+        except Exception as e:
+            print(f"❌ 큐 항목 처리 중 오류: {queue_file} - {str(e)}")
+            return {'success': False, 'message': str(e)}
+
+    def _write_daemon_status(self, status_file, status):
+        """데몬 상태 파일을 원자적으로 기록합니다"""
+        try:
+            status['updated_at'] = datetime.now().isoformat()
+            tmp_file = f"{status_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(status, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, status_file)
+        except IOError as e:
+            print(f"⚠️ 데몬 상태 파일 기록 실패: {e}")
+
+    def run_daemon_mode(self, poll_interval=DAEMON_POLL_INTERVAL, status_file=DAEMON_STATUS_FILE):
+        """
+        데몬 모드로 실행합니다
+        - 초기화된 시스템(.env, Gemini 설정)을 유지한 채 pending 디렉토리를 감시
+        - 디렉토리 수정 시각이 바뀔 때만 파일 목록을 다시 읽음
+        - 실패한 큐 파일은 내용이 바뀌기 전까지 다시 시도하지 않음
+        - SIGTERM/SIGINT 수신 시 진행 중인 작업을 마치고 종료
+        """
+        print(f"🛰️ 데몬 모드로 실행을 시작합니다... (감시: {QUEUE_PENDING_DIR}, 간격: {poll_interval}초)")
+        
+        stop_event = threading.Event()
+        
+        def handle_stop(signum, frame):
+            print(f"\n⏹️ 종료 신호 수신 ({signal.Signals(signum).name}) - 현재 작업 완료 후 종료합니다.")
+            stop_event.set()
+        
+        signal.signal(signal.SIGTERM, handle_stop)
+        signal.signal(signal.SIGINT, handle_stop)
+        
+        status = {
+            'pid': os.getpid(),
+            'state': 'idle',
+            'started_at': datetime.now().isoformat(),
+            'current_job': None,
+            'processed': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'last_poll_at': None,
+            'last_job_finished_at': None
+        }
+        self._write_daemon_status(status_file, status)
+        
+        # 이미 시도한 큐 파일 {파일명: 시도 당시 수정 시각}
+        attempted = {}
+        last_dir_mtime = None
+        
+        while not stop_event.is_set():
+            status['last_poll_at'] = datetime.now().isoformat()
+            self.reclaim_expired_jobs()
+            
+            try:
+                dir_mtime = os.stat(QUEUE_PENDING_DIR).st_mtime_ns
+            except OSError:
+                dir_mtime = None
+            
+            # 디렉토리 수정 시각이 바뀐 경우에만 목록 조회 (처리 중 추가/이동된 파일은 다음 폴링에서 반영)
+            if dir_mtime is not None and dir_mtime != last_dir_mtime:
+                last_dir_mtime = dir_mtime
+                queue_files = sorted(get_queue_files())
+                
+                # 사라진 파일은 시도 기록에서 제거
+                attempted = {name: mtime for name, mtime in attempted.items() if name in queue_files}
+                
+                for queue_file in queue_files:
+                    if stop_event.is_set():
+                        break
                     
-                    # 큐 데이터 로드
-                    job_data = self.load_queue_split(queue_id)
-                    if not job_data:
-                        print(f"❌ 큐 데이터를 로드할 수 없습니다: {queue_id}")
+                    try:
+                        file_mtime = os.stat(os.path.join(QUEUE_PENDING_DIR, queue_file)).st_mtime_ns
+                    except OSError:
                         continue
                     
-                    # 작업 처리
-                    result = self.process_job(job_data)
+                    if attempted.get(queue_file) == file_mtime:
+                        continue
+                    attempted[queue_file] = file_mtime
                     
-                    if result['success']:
-                        print(f"✅ 큐 항목 처리 완료: {queue_id}")
-                    else:
-                        print(f"❌ 큐 항목 처리 실패: {queue_id} - {result['message']}")
+                    status['state'] = 'processing'
+                    status['current_job'] = queue_file
+                    self._write_daemon_status(status_file, status)
                     
-                    # 작업 간 간격
-                    time.sleep(2)
+                    result = self.process_queue_file(queue_file)
                     
-                except Exception as e:
-                    print(f"❌ 큐 항목 처리 중 오류: {queue_file} - {str(e)}")
-                    continue
-            
-            print("\n🎉 모든 큐 처리가 완료되었습니다.")
+                    status['processed'] += 1
+                    status['succeeded' if result.get('success') else 'failed'] += 1
+                    status['current_job'] = None
+                    status['state'] = 'idle'
+                    status['last_job_finished_at'] = datetime.now().isoformat()
+                    self._write_daemon_status(status_file, status)
             
-        except Exception as e:
-            print(f"❌ 큐 모드 실행 중 오류: {str(e)}")
+            self._write_daemon_status(status_file, status)
+            stop_event.wait(poll_interval)
+        
+        self.release_held_jobs()
+        status['state'] = 'stopped'
+        status['current_job'] = None
+        self._write_daemon_status(status_file, status)
+        print("👋 데몬 모드를 종료합니다.")
 
     def run_immediate_mode(self, job_data):
         """즉시 모드로 특정 작업을 실행합니다"""
@@ -626,6 +964,7 @@ class AliExpressPostingSystem:
             return {'success': False, 'message': error_msg}
         finally:
             self.immediate_mode = False
+            self.release_held_jobs()
 
 def main():
     """메인 함수"""
@@ -636,13 +975,22 @@ def main():
                            help='실행 모드 (queue: 큐 처리, immediate: 즉시 처리)')
         parser.add_argument('--queue-id', help='즉시 모드에서 처리할 큐 ID')
         parser.add_argument('--immediate-file', help='keyword_processor.php에서 전달된 임시 파일 경로')
+        parser.add_argument('--daemon', action='store_true', help='상주 모드 (pending 디렉토리 감시, SIGTERM 시 정상 종료)')
+        parser.add_argument('--poll-interval', type=float, default=DAEMON_POLL_INTERVAL, help='데몬 모드 감시 간격 (초)')
+        parser.add_argument('--status-file', default=DAEMON_STATUS_FILE, help='데몬 모드 상태 파일 경로')
+        parser.add_argument('--no-llm-cache', action='store_true', help='Gemini 응답 캐시를 사용하지 않고 항상 새로 생성')
         
         args = parser.parse_args()
         
         # 시스템 초기화
         system = AliExpressPostingSystem()
+        if args.no_llm_cache:
+            system.llm_cache_bypass = True
         
-        if args.mode == 'immediate':
+        if args.daemon:
+            # 데몬 모드 실행
+            system.run_daemon_mode(poll_interval=args.poll_interval, status_file=args.status_file)
+        elif args.mode == 'immediate':
             if args.immediate_file and os.path.exists(args.immediate_file):
                 # keyword_processor.php에서 전달된 파일 처리
                 print(f"📄 임시 파일에서 데이터 로드: {args.immediate_file}")
@@ -654,11 +1002,11 @@ def main():
                 print(f"🗑️ 임시 파일 삭제: {args.immediate_file}")
                 
             elif args.queue_id:
-                # 큐 ID로 데이터 로드
+                # 큐 ID로 작업 선점 (다른 워커가 처리 중이면 중복 발행하지 않음)
                 print(f"🔍 큐 ID로 데이터 로드: {args.queue_id}")
-                job_data = system.load_queue_split(args.queue_id)
+                job_data = system.claim_job(args.queue_id)
                 if not job_data:
-                    print(f"❌ 큐 데이터를 찾을 수 없습니다: {args.queue_id}")
+                    print(f"❌ 큐 데이터를 찾을 수 없거나 다른 워커가 처리 중입니다: {args.queue_id}")
                     return
             else:
                 print("❌ 즉시 모드에서는 --queue-id 또는 --immediate-file 인수가 필요합니다.")
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+API 응답 캐시 백엔드 모음
+SafeAPIManager의 파일 캐시 단계(메모리 → 파일 → API)를 교체 가능한 백엔드로 분리
+
+- CacheBackend: 백엔드 공통 인터페이스
+- SQLiteCacheBackend: 키 단위 조회/저장, 엔트리별 만료 시각(epoch 정수),
+  만료 엔트리는 백그라운드 스윕에서 일괄 삭제
+- BoundedMemoryCache: 메모리 단계용 네임스페이스별 LRU/TTL 캐시
+  (time.monotonic 기준 만료, 엔트리 수/대략적 바이트 상한, 히트/미스/축출 카운터)
+
+파일 위치: /var/www/novacents/tools/cache_backends.py
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class CacheBackend(ABC):
+    """
+    캐시 백엔드 공통 인터페이스 (get/set/delete/clear를 구현하지 않은 백엔드는 생성 시 TypeError)
+    - get(key): 유효한 데이터 또는 None
+    - set(key, data, ttl_seconds): 저장
+    - delete(key) / clear() / sweep_expired() / stats() / close()
+    """
+
+    @abstractmethod
+    def get(self, key):
+        pass
+
+    @abstractmethod
+    def set(self, key, data, ttl_seconds=3600):
+        pass
+
+    @abstractmethod
+    def delete(self, key):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def sweep_expired(self):
+        """만료 엔트리 일괄 삭제, 삭제된 개수 반환"""
+        return 0
+
+    def stats(self):
+        return {}
+
+    def close(self):
+        pass
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    SQLite 기반 키-값 캐시
+    - 조회는 PRIMARY KEY 인덱스 단일 행 조회 (파일 전체 로드 없음)
+    - 만료 시각은 expires_at(epoch 초 정수)으로 저장, 조회 시 비교만 수행
+    - 만료 엔트리 삭제는 조회 경로가 아닌 백그라운드 스윕 스레드에서 일괄 처리
+    """
+
+    def __init__(self, db_path, sweep_interval=300, start_sweeper=True):
+        """
+        :param db_path: SQLite 파일 경로
+        :param sweep_interval: 만료 스윕 주기 (초)
+        :param start_sweeper: 백그라운드 스윕 스레드 시작 여부
+        """
+        self.db_path = db_path
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sweeper = None
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        # 여러 프로세스(cron, PHP 호출, 모니터)가 동시에 여는 경우를 고려해 WAL + busy_timeout 사용
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " cache_key TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL,"
+            " created_at INTEGER NOT NULL,"
+            " expires_at INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at)")
+
+        if start_sweeper and sweep_interval > 0:
+            self._start_sweeper()
+
+    def _start_sweeper(self):
+        """만료 엔트리 백그라운드 스윕 스레드 시작 (데몬 스레드)"""
+        def _run():
+            while not self._stop_event.wait(self.sweep_interval):
+                try:
+                    self.sweep_expired()
+                except sqlite3.Error:
+                    pass
+
+        self._sweeper = threading.Thread(target=_run, name="cache-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def get(self, key):
+        now = int(time.time())
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, expires_at FROM cache_entries WHERE cache_key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] <= now:
+            # 만료 엔트리는 여기서 지우지 않음 (스윕에서 일괄 삭제)
+            return None
+        try:
+            return json.loads(row[0])
+        except (TypeError, ValueError):
+            return None
+
+    def set(self, key, data, ttl_seconds=3600):
+        now = int(time.time())
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (cache_key, data, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now, now + int(ttl_seconds))
+            )
+        return True
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE cache_key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    def sweep_expired(self):
+        now = int(time.time())
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        return cursor.rowcount
+
+    def stats(self):
+        now = int(time.time())
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            valid = self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE expires_at > ?", (now,)
+            ).fetchone()[0]
+        return {
+            "backend": "sqlite",
+            "path": self.db_path,
+            "total": total,
+            "valid": valid,
+        }
+
+    def close(self):
+        self._stop_event.set()
+        with self._lock:
+            self._conn.close()
+
+
+class BoundedMemoryCache:
+    """
+    네임스페이스별 상한이 있는 LRU/TTL 메모리 캐시
+    - 만료 시각은 time.monotonic() 기준 (시스템 시계 변경 영향 없음, 조회 시 문자열 파싱 없음)
+    - 엔트리 크기는 저장 시 JSON 직렬화 길이로 추정, 엔트리 수/바이트 상한을 넘으면 오래 사용하지 않은 것부터 축출
+    """
+
+    def __init__(self, namespace_limits, default_limits=(100, 4 * 1024 * 1024, 3600)):
+        """
+        :param namespace_limits: {네임스페이스: (최대 엔트리 수, 최대 바이트, TTL 초)}
+        :param default_limits: 등록되지 않은 네임스페이스에 적용할 상한
+        """
+        self.namespace_limits = dict(namespace_limits)
+        self.default_limits = default_limits
+        self._lock = threading.Lock()
+        self._namespaces = {}
+
+    def _namespace(self, namespace):
+        """네임스페이스 상태 (잠금 안에서 호출)"""
+        state = self._namespaces.get(namespace)
+        if state is None:
+            state = {
+                "entries": OrderedDict(),
+                "bytes": 0,
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "expirations": 0,
+            }
+            self._namespaces[namespace] = state
+        return state
+
+    def _limits(self, namespace):
+        return self.namespace_limits.get(namespace, self.default_limits)
+
+    @staticmethod
+    def _estimate_size(data):
+        try:
+            return len(json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8'))
+        except (TypeError, ValueError):
+            return 0
+
+    def _remove(self, state, key):
+        _, size, _ = state["entries"].pop(key)
+        state["bytes"] -= size
+
+    def get(self, namespace, key):
+        now = time.monotonic()
+        with self._lock:
+            state = self._namespace(namespace)
+            entry = state["entries"].get(key)
+            if entry is None:
+                state["misses"] += 1
+                return None
+            if entry[0] <= now:
+                self._remove(state, key)
+                state["expirations"] += 1
+                state["misses"] += 1
+                return None
+            state["entries"].move_to_end(key)
+            state["hits"] += 1
+            return entry[2]
+
+    def set(self, namespace, key, data, ttl_seconds=None):
+        """
+        저장 (단일 엔트리가 바이트 상한보다 크면 저장하지 않음)
+        :return: 저장 여부
+        """
+        max_entries, max_bytes, default_ttl = self._limits(namespace)
+        size = self._estimate_size(data)
+        if size > max_bytes:
+            return False
+
+        expires_at = time.monotonic() + (ttl_seconds or default_ttl)
+        with self._lock:
+            state = self._namespace(namespace)
+            if key in state["entries"]:
+                self._remove(state, key)
+            state["entries"][key] = (expires_at, size, data)
+            state["bytes"] += size
+
+            while len(state["entries"]) > max_entries or state["bytes"] > max_bytes:
+                oldest_key = next(iter(state["entries"]))
+                self._remove(state, oldest_key)
+                state["evictions"] += 1
+        return True
+
+    def delete(self, namespace, key):
+        with self._lock:
+            state = self._namespace(namespace)
+            if key in state["entries"]:
+                self._remove(state, key)
+
+    def clear(self, namespace=None):
+        """엔트리 삭제 (카운터는 유지)"""
+        with self._lock:
+            targets = [self._namespace(namespace)] if namespace else list(self._namespaces.values())
+            for state in targets:
+                state["entries"].clear()
+                state["bytes"] = 0
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(state["entries"]) for state in self._namespaces.values())
+
+    def stats(self):
+        """네임스페이스별 엔트리 수, 바이트, 히트/미스/축출/만료 카운터"""
+        with self._lock:
+            return {
+                namespace: {
+                    "entries": len(state["entries"]),
+                    "bytes": state["bytes"],
+                    "max_entries": self._limits(namespace)[0],
+                    "max_bytes": self._limits(namespace)[1],
+                    "hits": state["hits"],
+                    "misses": state["misses"],
+                    "evictions": state["evictions"],
+                    "expirations": state["expirations"],
+                }
+                for namespace, state in self._namespaces.items()
+            }
@@ -17,6 +17,12 @@ class CacheCleaner:
         self.cache_dir = cache_dir
         self.max_age_hours = 2  # 2시간 이상 된 캐시 삭제
         self.max_cache_size_mb = 50  # 최대 50MB 캐시 유지
+        # 자체적으로 만료를 관리하는 SQLite 캐시 파일은 삭제 대상에서 제외
+        self.preserved_suffixes = ('.db', '.db-wal', '.db-shm')
+        
+    def _is_preserved(self, filename):
+        """삭제하면 안 되는 캐시 파일 여부"""
+        return filename.endswith(self.preserved_suffixes)
         
     def clean_old_cache_files(self):
         """오래된 캐시 파일 정리"""
@@ -32,7 +38,7 @@ class CacheCleaner:
                 file_path = os.path.join(self.cache_dir, filename)
                 
                 # 파일만 처리 (디렉토리 제외)
-                if not os.path.isfile(file_path):
+                if not os.path.isfile(file_path) or self._is_preserved(filename):
                     continue
                     
                 # 파일 수정 시간 확인
@@ -68,7 +74,7 @@ class CacheCleaner:
             for filename in os.listdir(self.cache_dir):
                 file_path = os.path.join(self.cache_dir, filename)
                 
-                if os.path.isfile(file_path):
+                if os.path.isfile(file_path) and not self._is_preserved(filename):
                     file_size = os.path.getsize(file_path)
                     file_mtime = os.path.getmtime(file_path)
                     
@@ -21,57 +21,88 @@ except ImportError as e:
     print(json.dumps({"error": f"SafeAPIManager 임포트 실패: {e}"}))
     sys.exit(1)
 
+def _build_result(platform, product_url, success, affiliate_link, product_info):
+    """조회 결과 응답 생성"""
+    if success and affiliate_link:
+        return {
+            "success": True,
+            "platform": platform,
+            "affiliate_link": affiliate_link,
+            "product_info": product_info,
+            "original_url": product_url
+        }
+    else:
+        return {
+            "success": False,
+            "error": "상품 정보 조회 실패",
+            "platform": platform,
+            "original_url": product_url
+        }
+
 def get_product_info(product_url):
     """상품 정보 조회"""
+    return get_products_info([product_url])[0]
+
+def get_products_info(product_urls):
+    """
+    여러 상품 정보 조회
+    쿠팡/알리익스프레스 링크를 플랫폼별 일괄 변환 요청으로 묶어서 처리
+    :return: 입력 순서와 같은 결과 목록
+    """
+    results = {}
+    
     try:
         api_manager = SafeAPIManager(mode="production")
         
-        # 플랫폼 확인
-        if 'coupang.com' in product_url.lower():
-            platform = "쿠팡"
-            success, affiliate_link, product_info = api_manager.convert_coupang_to_affiliate_link(product_url)
-        elif 'aliexpress.com' in product_url.lower():
-            platform = "알리익스프레스"
-            success, affiliate_link, product_info = api_manager.convert_aliexpress_to_affiliate_link(product_url)
-        else:
-            return {
-                "success": False,
-                "error": "지원하지 않는 플랫폼",
-                "platform": "unknown"
-            }
+        platform_urls = {
+            "쿠팡": ([url for url in product_urls if 'coupang.com' in url.lower()],
+                   api_manager.convert_coupang_to_affiliate_links),
+            "알리익스프레스": ([url for url in product_urls if 'aliexpress.com' in url.lower() and 'coupang.com' not in url.lower()],
+                        api_manager.convert_aliexpress_to_affiliate_links),
+        }
         
-        if success and affiliate_link:
-            return {
-                "success": True,
-                "platform": platform,
-                "affiliate_link": affiliate_link,
-                "product_info": product_info,
-                "original_url": product_url
-            }
-        else:
-            return {
-                "success": False,
-                "error": "상품 정보 조회 실패",
-                "platform": platform,
-                "original_url": product_url
-            }
+        for platform, (urls, converter) in platform_urls.items():
+            if not urls:
+                continue
+            converted = converter(urls)
+            for url in urls:
+                result = converted.get(url.strip()) or {}
+                results[url] = _build_result(
+                    platform, url, result.get("success"), result.get("affiliate_link"), result.get("product_info")
+                )
+        
+        for product_url in product_urls:
+            if product_url not in results:
+                results[product_url] = {
+                    "success": False,
+                    "error": "지원하지 않는 플랫폼",
+                    "platform": "unknown"
+                }
             
     except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "original_url": product_url
-        }
+        for product_url in product_urls:
+            results.setdefault(product_url, {
+                "success": False,
+                "error": str(e),
+                "original_url": product_url
+            })
+    
+    return [results[product_url] for product_url in product_urls]
 
 def main():
     """메인 실행 함수"""
-    if len(sys.argv) != 2:
-        print(json.dumps({"error": "사용법: python3 get_product_info.py <product_url>"}))
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "사용법: python3 get_product_info.py <product_url> [<product_url> ...]"}))
         sys.exit(1)
     
-    product_url = sys.argv[1]
-    result = get_product_info(product_url)
-    print(json.dumps(result, ensure_ascii=False))
+    product_urls = sys.argv[1:]
+    results = get_products_info(product_urls)
+    
+    # 단일 URL 호출은 기존과 동일하게 객체 하나만 출력
+    if len(product_urls) == 1:
+        print(json.dumps(results[0], ensure_ascii=False))
+    else:
+        print(json.dumps(results, ensure_ascii=False))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
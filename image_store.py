@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이미지 바이트 저장소 (내용 주소 기반)
+검증기, Gemini 프롬프트 구성, 갤러리 생성이 같은 이미지를 다시 내려받지 않도록 공유
+
+- 메타데이터(SQLite): 최종 URL → MIME 타입, 가로/세로, 검증 결과, 내용 해시
+- 요청 URL → 최종 URL 별칭 기록 (리다이렉트 URL로 조회해도 같은 엔트리 사용)
+- 바이트는 SHA-256 해시 경로(images/<해시 앞 2자리>/<해시>)에 한 번만 저장, 읽기는 mmap
+- 저장 바이트 총합이 상한을 넘으면 오래 사용하지 않은 파일부터 삭제 (검증 결과는 유지)
+- URL의 key 쿼리 파라미터(Google API 키 등)는 제거한 형태로만 저장
+
+파일 위치: /var/www/novacents/tools/image_store.py
+"""
+
+import os
+import mmap
+import time
+import sqlite3
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_STORE_DIR = '/var/www/novacents/tools/cache/image_store'
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+DEFAULT_VERDICT_TTL_SECONDS = 7 * 24 * 3600
+
+# 저장 키에서 제거할 쿼리 파라미터 (디스크에 API 키를 남기지 않음)
+SECRET_QUERY_PARAMS = ('key',)
+
+
+def store_key(url):
+    """URL → 저장 키 (SECRET_QUERY_PARAMS 제거, 나머지는 그대로)"""
+    if not url:
+        return url
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not any(name in SECRET_QUERY_PARAMS for name, _ in query):
+        return url
+    kept = [(name, value) for name, value in query if name not in SECRET_QUERY_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(kept)))
+
+
+class ImageStore:
+    """
+    SQLite 인덱스 + 해시 경로 파일로 구성된 이미지 저장소
+    - record_verdict: 바이트 없이 검증 결과/크기만 기록 (헤더만 읽은 검증기)
+    - put: 바이트 저장 (같은 내용은 한 번만 저장)
+    - get_bytes / open_bytes: mmap으로 읽기
+    """
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES, verdict_ttl_seconds=DEFAULT_VERDICT_TTL_SECONDS):
+        """
+        :param store_dir: 저장소 디렉토리 (index.db와 바이트 파일)
+        :param max_bytes: 바이트 파일 총 크기 상한
+        :param verdict_ttl_seconds: 검증 결과 유효 기간 (초)
+        """
+        self.store_dir = store_dir
+        self.blob_dir = os.path.join(store_dir, 'blobs')
+        self.max_bytes = max_bytes
+        self.verdict_ttl_seconds = verdict_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(os.path.join(store_dir, 'index.db'), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS images ("
+            " url TEXT PRIMARY KEY,"
+            " sha256 TEXT,"
+            " mime_type TEXT,"
+            " width INTEGER,"
+            " height INTEGER,"
+            " valid INTEGER NOT NULL,"
+            " checked_at INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_aliases ("
+            " url TEXT PRIMARY KEY,"
+            " final_url TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " sha256 TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " accessed_at INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_blobs_accessed ON blobs(accessed_at)")
+        # 키 제거 이전에 원본 URL로 저장된 항목 정리 (검증 결과 캐시일 뿐이라 다시 확인하면 됨)
+        self._conn.execute("DELETE FROM url_aliases WHERE url LIKE '%key=%' OR final_url LIKE '%key=%'")
+        self._conn.execute("DELETE FROM images WHERE url LIKE '%key=%'")
+
+    def _blob_path(self, sha256):
+        return os.path.join(self.blob_dir, sha256[:2], sha256)
+
+    def _resolve(self, url):
+        """저장 키로 변환 후 별칭이 있으면 최종 URL로 변환 (잠금 안에서 호출)"""
+        url = store_key(url)
+        row = self._conn.execute("SELECT final_url FROM url_aliases WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else url
+
+    def lookup(self, url):
+        """
+        URL(요청 URL 또는 최종 URL)의 기록 조회
+        :return: {'url', 'sha256', 'mime_type', 'width', 'height', 'valid'} 또는 None (없거나 만료)
+        """
+        now = int(time.time())
+        with self._lock:
+            final_url = self._resolve(url)
+            row = self._conn.execute(
+                "SELECT sha256, mime_type, width, height, valid FROM images WHERE url = ? AND checked_at > ?",
+                (final_url, now - self.verdict_ttl_seconds)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return {
+            # 리다이렉트가 없던 URL은 키가 포함된 호출자 URL을 그대로 돌려줌
+            'url': url if final_url == store_key(url) else final_url,
+            'sha256': row[0],
+            'mime_type': row[1],
+            'width': row[2],
+            'height': row[3],
+            'valid': bool(row[4]),
+        }
+
+    def record_verdict(self, url, final_url, valid, mime_type=None, width=None, height=None):
+        """바이트 없이 검증 결과 기록 (이미 저장된 바이트 해시는 유지)"""
+        now = int(time.time())
+        url = store_key(url)
+        final_url = store_key(final_url) or url
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO images (url, sha256, mime_type, width, height, valid, checked_at)"
+                " VALUES (?, NULL, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET mime_type = excluded.mime_type, width = excluded.width,"
+                " height = excluded.height, valid = excluded.valid, checked_at = excluded.checked_at",
+                (final_url, mime_type, width, height, int(bool(valid)), now)
+            )
+            if url != final_url:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO url_aliases (url, final_url) VALUES (?, ?)", (url, final_url)
+                )
+
+    def put(self, url, data, mime_type, width=None, height=None, valid=True):
+        """
+        이미지 바이트 저장 (같은 내용은 파일 하나를 공유)
+        :return: 내용 SHA-256
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(sha256)
+        now = int(time.time())
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs (sha256, size, accessed_at) VALUES (?, ?, ?)",
+                (sha256, len(data), now)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO images (url, sha256, mime_type, width, height, valid, checked_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._resolve(url), sha256, mime_type, width, height, int(bool(valid)), now)
+            )
+            self._evict()
+        return sha256
+
+    def open_bytes(self, url):
+        """
+        저장된 바이트를 읽기 전용 mmap으로 열기 (호출 측에서 close)
+        :return: (mmap, mime_type) 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, mime_type FROM images WHERE url = ? AND sha256 IS NOT NULL", (self._resolve(url),)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE blobs SET accessed_at = ? WHERE sha256 = ?", (int(time.time()), row[0]))
+
+        try:
+            with open(self._blob_path(row[0]), 'rb') as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), row[1]
+        except (OSError, ValueError):
+            # 파일이 삭제되었거나 비어 있으면 없는 것으로 처리
+            return None
+
+    def get_bytes(self, url):
+        """
+        저장된 바이트 조회
+        :return: (bytes, mime_type) 또는 None
+        """
+        opened = self.open_bytes(url)
+        if opened is None:
+            return None
+        mapped, mime_type = opened
+        try:
+            return mapped[:], mime_type
+        finally:
+            mapped.close()
+
+    def _evict(self):
+        """바이트 총합이 상한을 넘으면 오래 사용하지 않은 파일부터 삭제 (잠금 안에서 호출)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for sha256, size in self._conn.execute(
+            "SELECT sha256, size FROM blobs ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._blob_path(sha256))
+            except FileNotFoundError:
+                pass
+            self._conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+            self._conn.execute("UPDATE images SET sha256 = NULL WHERE sha256 = ?", (sha256,))
+            total -= size
+
+    def stats(self):
+        with self._lock:
+            images, valid = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(valid), 0) FROM images"
+            ).fetchone()
+            blobs, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+        return {
+            "images": images,
+            "valid": valid,
+            "blobs": blobs,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store():
+    """프로세스 공용 저장소 인스턴스"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ImageStore()
+        return _default_store
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gemini 응답 캐시 (내용 주소 기반)
+같은 모델 + 같은 프롬프트 + 같은 생성 설정이면 API를 다시 호출하지 않고 저장된 응답 사용
+
+- 키: 모델명 + 정규화한 프롬프트 + generation_config의 SHA-256 (이미지 파트는 바이트 내용 해시)
+- 엔트리별 TTL, 전체 크기 상한 초과 시 오래 사용하지 않은 응답부터 삭제
+- 우회: generate_content_cached(..., bypass=True) 또는 환경변수 LLM_CACHE_BYPASS=1
+- validate 함수를 넘기면 검증을 통과한 응답만 저장 (재시도가 같은 불량 응답을 받지 않도록)
+
+파일 위치: /var/www/novacents/tools/llm_cache.py
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+DEFAULT_CACHE_DB = '/var/www/novacents/tools/cache/llm_cache.db'
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+class CachedResponse:
+    """캐시된 응답 (generate_content 응답처럼 .text 제공)"""
+
+    def __init__(self, text):
+        self.text = text
+
+
+def _normalize_text(text):
+    """줄바꿈 통일, 줄 끝 공백 및 앞뒤 공백 제거"""
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = re.sub(r'[ \t]+\n', '\n', text)
+    return text.strip()
+
+
+def _normalize_part(part):
+    """프롬프트 파트를 키 계산용 값으로 변환 (바이너리는 내용 해시)"""
+    if isinstance(part, str):
+        return _normalize_text(part)
+    if isinstance(part, (bytes, bytearray)):
+        return {"sha256": hashlib.sha256(part).hexdigest()}
+    if isinstance(part, dict):
+        normalized = {}
+        for key, value in sorted(part.items()):
+            if isinstance(value, (bytes, bytearray)):
+                normalized[key] = {"sha256": hashlib.sha256(value).hexdigest()}
+            else:
+                normalized[key] = _normalize_part(value) if isinstance(value, (str, dict, list, tuple)) else value
+        return normalized
+    if isinstance(part, (list, tuple)):
+        return [_normalize_part(item) for item in part]
+    return repr(part)
+
+
+def make_cache_key(model_name, prompt, generation_config=None):
+    """모델 + 정규화 프롬프트 + 생성 설정 해시"""
+    payload = {
+        "model": model_name,
+        "prompt": _normalize_part(prompt),
+        "config": _normalize_part(generation_config or {}),
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite 기반 LLM 응답 캐시
+    - 조회 시 accessed_at 갱신, 저장 시 만료 엔트리 정리 후 크기 상한까지 LRU 삭제
+    """
+
+    def __init__(self, db_path=DEFAULT_CACHE_DB, ttl_seconds=DEFAULT_TTL_SECONDS, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        :param db_path: SQLite 파일 경로
+        :param ttl_seconds: 기본 TTL (초)
+        :param max_bytes: 저장 응답 총 크기 상한 (바이트)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            " cache_key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " response TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at INTEGER NOT NULL,"
+            " expires_at INTEGER NOT NULL,"
+            " accessed_at INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_expires ON llm_responses(expires_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_accessed ON llm_responses(accessed_at)")
+
+    def get(self, key):
+        now = int(time.time())
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_responses WHERE cache_key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE llm_responses SET accessed_at = ? WHERE cache_key = ?", (now, key))
+            self.hits += 1
+        return row[0]
+
+    def set(self, key, model_name, text, ttl_seconds=None):
+        now = int(time.time())
+        size = len(text.encode('utf-8'))
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses"
+                " (cache_key, model, response, size, created_at, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model_name, text, size, now, now + int(ttl_seconds or self.ttl_seconds), now)
+            )
+            self._evict(now)
+        return True
+
+    def _evict(self, now):
+        """만료 엔트리 삭제 후 크기 상한을 넘으면 오래 사용하지 않은 순서로 삭제 (잠금 안에서 호출)"""
+        self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT cache_key, size FROM llm_responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+
+    def stats(self):
+        now = int(time.time())
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses WHERE expires_at > ?", (now,)
+            ).fetchone()
+        return {
+            "entries": count,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """프로세스 공용 캐시 인스턴스"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMResponseCache()
+        return _default_cache
+
+
+def _model_name(model):
+    return getattr(model, 'model_name', None) or repr(model)
+
+
+def generate_content_cached(model, prompt, generation_config=None, bypass=False, validate=None, ttl_seconds=None, cache=None):
+    """
+    model.generate_content 캐시 래퍼
+    :param model: genai.GenerativeModel
+    :param prompt: 프롬프트 문자열 또는 파트 목록
+    :param generation_config: generate_content에 전달할 생성 설정
+    :param bypass: True면 캐시 조회/저장 모두 생략
+    :param validate: 응답 텍스트 검증 함수 (False면 저장하지 않음)
+    :param ttl_seconds: 이 응답의 TTL (기본값은 캐시 설정)
+    :param cache: 사용할 캐시 (기본: 프로세스 공용 캐시)
+    :return: .text를 가진 응답 객체
+    """
+    bypass = bypass or os.environ.get('LLM_CACHE_BYPASS') == '1'
+
+    if generation_config is not None:
+        call = lambda: model.generate_content(prompt, generation_config=generation_config)
+    else:
+        call = lambda: model.generate_content(prompt)
+
+    if bypass:
+        return call()
+
+    try:
+        cache = cache or get_default_cache()
+    except (OSError, sqlite3.Error):
+        # 캐시 파일을 열 수 없는 환경(권한 등)에서는 캐시 없이 호출
+        return call()
+    model_name = _model_name(model)
+    key = make_cache_key(model_name, prompt, generation_config)
+
+    try:
+        cached_text = cache.get(key)
+    except sqlite3.Error:
+        cached_text = None
+    if cached_text is not None:
+        return CachedResponse(cached_text)
+
+    response = call()
+    text = response.text
+    if text and (validate is None or validate(text)):
+        try:
+            cache.set(key, model_name, text, ttl_seconds)
+        except sqlite3.Error:
+            pass
+    return response
@@ -17,6 +17,8 @@ import urllib.parse
 import urllib.request
 import re
 from datetime import datetime
+from decimal import ROUND_DOWN
+from product_record import parse_minor_units
 
 # 🔥 조용한 모드 감지 (PHP에서 호출할 때는 로그 출력 안함)
 QUIET_MODE = os.environ.get('QUIET_MODE', '0') == '1'
@@ -276,16 +278,9 @@ class EnhancedAliexpressAnalyzer:
             safe_log(f"📝 상품명: {title[:50]}... (한국어: {'✅' if has_korean else '❌'})")
             
             # 🔥 가격 처리
-            price_str = product.get('target_sale_price', '0')
-            try:
-                if isinstance(price_str, str) and ',' in price_str:
-                    price_clean = price_str.replace(',', '')
-                else:
-                    price_clean = str(price_str)
-                price_krw = int(float(price_clean))
-                price_display = f"₩{price_krw:,}"
-            except:
-                price_display = "가격 정보 없음"
+            # 원 미만은 기존과 같이 버림
+            price_krw = parse_minor_units(product.get('target_sale_price', '0'), "KRW", rounding=ROUND_DOWN)
+            price_display = f"₩{price_krw:,}" if price_krw is not None else "가격 정보 없음"
             
             safe_log(f"💰 가격: {price_display}")
             
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+글별 상품 링크 캐시 (상품 모니터링용)
+전체 글 크롤링 결과를 JSON 상태 파일 하나에 쌓지 않고 글 단위 행으로 저장
+
+- 글 ID → 제목, URL, 발행일, 수정 시각, 내용 해시, 추출 링크 (SQLite, 글마다 행 단위 갱신)
+- 내용 해시가 같으면 링크 재추출 생략 (ProductMonitor.collect_post_links)
+- 모니터링 대상 순회는 커서로 나눠 읽기 (전체 글을 한 번에 메모리에 올리지 않음)
+
+파일 위치: /var/www/novacents/tools/post_link_store.py
+"""
+
+import os
+import json
+import sqlite3
+import threading
+
+ITER_BATCH_SIZE = 500
+
+
+class PostLinkStore:
+    """
+    글별 추출 링크 저장소
+    - get(post_id) / upsert(post_id, entry) / delete(post_ids)
+    - iter_posts(): (post_meta, links) 제너레이터 (발행일 최신순)
+    """
+
+    def __init__(self, db_path):
+        """
+        :param db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " post_id TEXT PRIMARY KEY,"
+            " post_title TEXT,"
+            " post_url TEXT,"
+            " post_date TEXT,"
+            " modified TEXT,"
+            " content_hash TEXT,"
+            " links TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_date ON posts(post_date)")
+
+    def get(self, post_id):
+        """
+        :return: {'post_title', 'post_url', 'post_date', 'modified', 'content_hash', 'links'} 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT post_title, post_url, post_date, modified, content_hash, links FROM posts WHERE post_id = ?",
+                (str(post_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'post_title': row[0],
+            'post_url': row[1],
+            'post_date': row[2],
+            'modified': row[3],
+            'content_hash': row[4],
+            'links': json.loads(row[5]),
+        }
+
+    def upsert(self, post_id, entry):
+        """글 하나 저장 (entry는 get()과 같은 키)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO posts (post_id, post_title, post_url, post_date, modified, content_hash, links)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(post_id), entry.get('post_title'), entry.get('post_url'), entry.get('post_date'),
+                    entry.get('modified'), entry.get('content_hash'),
+                    json.dumps(entry.get('links') or [], ensure_ascii=False)
+                )
+            )
+
+    def delete(self, post_ids):
+        """글 삭제, 삭제된 개수 반환"""
+        post_ids = [str(post_id) for post_id in post_ids]
+        if not post_ids:
+            return 0
+        with self._lock:
+            cursor = self._conn.executemany("DELETE FROM posts WHERE post_id = ?", [(post_id,) for post_id in post_ids])
+            return cursor.rowcount
+
+    def prune_before(self, post_date):
+        """발행일이 post_date 이전인 글 삭제 (모니터링 기간이 지난 글), 삭제된 ID 목록 반환"""
+        with self._lock:
+            post_ids = [row[0] for row in self._conn.execute(
+                "SELECT post_id FROM posts WHERE post_date < ?", (post_date,)
+            ).fetchall()]
+            self._conn.execute("DELETE FROM posts WHERE post_date < ?", (post_date,))
+        return post_ids
+
+    def iter_post_ids(self, batch_size=ITER_BATCH_SIZE):
+        """저장된 글 ID를 batch_size개씩 나눠 반환 (ID 순)"""
+        last_id = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT post_id FROM posts WHERE post_id > ? ORDER BY post_id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [row[0] for row in rows]
+
+    def iter_posts(self, batch_size=ITER_BATCH_SIZE):
+        """
+        저장된 글 순회 (발행일 최신순, batch_size개씩 읽음)
+        :return: (post_meta, links) 제너레이터
+        """
+        last = None
+        while True:
+            with self._lock:
+                if last is None:
+                    rows = self._conn.execute(
+                        "SELECT post_id, post_title, post_url, post_date, links FROM posts"
+                        " ORDER BY post_date DESC, post_id DESC LIMIT ?", (batch_size,)
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT post_id, post_title, post_url, post_date, links FROM posts"
+                        " WHERE post_date < ? OR (post_date = ? AND post_id < ?)"
+                        " ORDER BY post_date DESC, post_id DESC LIMIT ?", (last[0], last[0], last[1], batch_size)
+                    ).fetchall()
+            if not rows:
+                return
+            last = (rows[-1][3], rows[-1][0])
+            for post_id, post_title, post_url, post_date, links in rows:
+                post_meta = {
+                    "post_id": post_id,
+                    "post_title": post_title,
+                    "post_url": post_url,
+                    "post_date": post_date
+                }
+                yield post_meta, json.loads(links)
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -22,72 +22,94 @@ import iop
 
 def analyze_coupang_product_v2(url):
     """쿠팡 상품 분석 (올바른 워크플로)"""
+    return analyze_coupang_products_v2([url])[0]
+
+def analyze_coupang_products_v2(urls):
+    """
+    쿠팡 상품 여러 개 분석 (올바른 워크플로)
+    딥링크 변환은 일괄 API 요청 하나로 묶어서 처리
+    :return: 입력 순서와 같은 결과 목록
+    """
+    results = {}
+    
     try:
         # SafeAPIManager 초기화
         api_manager = SafeAPIManager(mode="production")
         
         # 상품 ID 추출
-        product_id_match = re.search(r'/products/(\d+)', url)
-        if not product_id_match:
-            return {
-                "success": False,
-                "message": "유효한 쿠팡 상품 URL이 아닙니다.",
-                "url": url
-            }
+        product_ids = {}
+        for url in urls:
+            product_id_match = re.search(r'/products/(\d+)', url)
+            if not product_id_match:
+                results[url] = {
+                    "success": False,
+                    "message": "유효한 쿠팡 상품 URL이 아닙니다.",
+                    "url": url
+                }
+            else:
+                product_ids[url] = product_id_match.group(1)
         
-        product_id = product_id_match.group(1)
+        # 1단계: 딥링크 일괄 변환 (가장 중요)
+        converted = api_manager.convert_coupang_to_affiliate_links(list(product_ids.keys())) if product_ids else {}
         
-        # 1단계: 딥링크 변환 (가장 중요)
-        convert_success, affiliate_link, product_info = api_manager.convert_coupang_to_affiliate_link(url)
-        
-        if not convert_success:
-            return {
-                "success": False,
-                "message": "쿠팡 링크 변환에 실패했습니다.",
+        for url, product_id in product_ids.items():
+            result = converted.get(url.strip()) or {}
+            convert_success = result.get("success", False)
+            affiliate_link = result.get("affiliate_link")
+            product_info = result.get("product_info")
+            
+            if not convert_success:
+                results[url] = {
+                    "success": False,
+                    "message": "쿠팡 링크 변환에 실패했습니다.",
+                    "product_id": product_id,
+                    "url": url
+                }
+                continue
+            
+            # 2단계: 상품 정보 확인 및 보완
+            if not product_info:
+                # 링크 변환에서 상품 정보를 못 가져온 경우
+                # 웹 스크래핑이나 다른 방법으로 보완 가능
+                product_info = {
+                    "title": f"쿠팡 상품 (ID: {product_id})",
+                    "price": "가격 정보를 가져올 수 없습니다",
+                    "image_url": "이미지 정보를 가져올 수 없습니다",
+                    "category": "카테고리 정보를 가져올 수 없습니다"
+                }
+            
+            results[url] = {
+                "success": True,
+                "platform": "쿠팡",
                 "product_id": product_id,
-                "url": url
-            }
-        
-        # 2단계: 상품 정보 확인 및 보완
-        if not product_info:
-            # 링크 변환에서 상품 정보를 못 가져온 경우
-            # 웹 스크래핑이나 다른 방법으로 보완 가능
-            product_info = {
-                "title": f"쿠팡 상품 (ID: {product_id})",
-                "price": "가격 정보를 가져올 수 없습니다",
-                "image_url": "이미지 정보를 가져올 수 없습니다",
-                "category": "카테고리 정보를 가져올 수 없습니다"
+                "original_url": url,
+                "affiliate_url": affiliate_link,
+                "product_info": {
+                    "title": product_info.get("title", product_info.get("productName", "상품명 없음")),
+                    "price": product_info.get("price", product_info.get("productPrice", "가격 정보 없음")),
+                    "original_price": product_info.get("original_price", "원가 정보 없음"),
+                    "discount_rate": product_info.get("discount_rate", "할인 정보 없음"),
+                    "image_url": product_info.get("image_url", product_info.get("productImage", "이미지 없음")),
+                    "rating": product_info.get("rating", "평점 정보 없음"),
+                    "review_count": product_info.get("review_count", "리뷰 정보 없음"),
+                    "brand_name": product_info.get("brand_name", "브랜드 정보 없음"),
+                    "category_name": product_info.get("category_name", product_info.get("categoryName", "카테고리 정보 없음")),
+                    "is_rocket": product_info.get("is_rocket", product_info.get("isRocket", False)),
+                    "is_free_shipping": product_info.get("is_free_shipping", False)
+                },
+                "conversion_method": "딥링크 API 변환 성공",
+                "analyzed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
         
-        return {
-            "success": True,
-            "platform": "쿠팡",
-            "product_id": product_id,
-            "original_url": url,
-            "affiliate_url": affiliate_link,
-            "product_info": {
-                "title": product_info.get("title", product_info.get("productName", "상품명 없음")),
-                "price": product_info.get("price", product_info.get("productPrice", "가격 정보 없음")),
-                "original_price": product_info.get("original_price", "원가 정보 없음"),
-                "discount_rate": product_info.get("discount_rate", "할인 정보 없음"),
-                "image_url": product_info.get("image_url", product_info.get("productImage", "이미지 없음")),
-                "rating": product_info.get("rating", "평점 정보 없음"),
-                "review_count": product_info.get("review_count", "리뷰 정보 없음"),
-                "brand_name": product_info.get("brand_name", "브랜드 정보 없음"),
-                "category_name": product_info.get("category_name", product_info.get("categoryName", "카테고리 정보 없음")),
-                "is_rocket": product_info.get("is_rocket", product_info.get("isRocket", False)),
-                "is_free_shipping": product_info.get("is_free_shipping", False)
-            },
-            "conversion_method": "딥링크 API 변환 성공",
-            "analyzed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
     except Exception as e:
-        return {
-            "success": False,
-            "message": f"쿠팡 상품 분석 중 오류: {str(e)}",
-            "url": url
-        }
+        for url in urls:
+            results.setdefault(url, {
+                "success": False,
+                "message": f"쿠팡 상품 분석 중 오류: {str(e)}",
+                "url": url
+            })
+    
+    return [results[url] for url in urls]
 
 def analyze_aliexpress_product_v2(url):
     """알리익스프레스 상품 분석 (올바른 워크플로)"""
@@ -159,14 +181,17 @@ def analyze_aliexpress_product_v2(url):
         }
 
 def main():
-    if len(sys.argv) != 3:
-        print(json.dumps({"success": False, "message": "Usage: python3 product_analyzer_v2.py <platform> <url>"}))
+    if len(sys.argv) < 3:
+        print(json.dumps({"success": False, "message": "Usage: python3 product_analyzer_v2.py <platform> <url> [<url> ...]"}))
         sys.exit(1)
     
     platform = sys.argv[1].lower()
     url = sys.argv[2]
     
-    if platform == "coupang":
+    if platform == "coupang" and len(sys.argv) > 3:
+        # 여러 쿠팡 URL은 딥링크 일괄 변환으로 처리
+        result = analyze_coupang_products_v2(sys.argv[2:])
+    elif platform == "coupang":
         result = analyze_coupang_product_v2(url)
     elif platform == "aliexpress":
         result = analyze_aliexpress_product_v2(url)
@@ -15,6 +15,10 @@ import time
 import json
 import requests
 import re
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -30,6 +34,236 @@ except ImportError as e:
     print(f"[❌] SafeAPIManager 임포트 실패: {e}")
     sys.exit(1)
 
+from post_link_store import PostLinkStore
+
+class LinkCheckEngine:
+    """
+    asyncio 기반 동시 링크 상태 확인 엔진
+    - 플랫폼별 동시 실행 수 제한 (세마포어)
+    - 호스트별 최소 요청 간격 (쿠팡 API는 캐시에 없을 때만 남은 쿼터 확인 후 호출)
+    - 여러 글에 중복된 링크는 한 번만 확인
+    - 실제 확인 로직(SafeAPIManager, HTTP HEAD)은 스레드 풀에서 실행
+    """
+    
+    # 플랫폼별 동시 확인 수 (쿠팡은 시간당 쿼터가 작아 순차 처리)
+    PLATFORM_CONCURRENCY = {"쿠팡": 1, "알리익스프레스": 4, "기타": 4}
+    
+    # 호스트별 요청 시작 간격 (초)
+    HOST_MIN_INTERVAL = {"api-gateway.coupang.com": 1.0}
+    DEFAULT_HOST_INTERVAL = 0.2
+    
+    def __init__(self, monitor, platform_concurrency=None):
+        """
+        :param monitor: ProductMonitor 인스턴스 (check_product_link_status 제공)
+        :param platform_concurrency: 플랫폼별 동시 실행 수 재정의
+        """
+        self.monitor = monitor
+        self.platform_concurrency = dict(self.PLATFORM_CONCURRENCY)
+        if platform_concurrency:
+            self.platform_concurrency.update(platform_concurrency)
+        self.deferred_links = []
+    
+    @staticmethod
+    def platform_of(link):
+        """링크의 플랫폼 이름"""
+        lowered = link.lower()
+        if 'coupang.com' in lowered:
+            return "쿠팡"
+        if 'aliexpress.com' in lowered:
+            return "알리익스프레스"
+        return "기타"
+    
+    def _rate_limit_host(self, link):
+        """링크 확인 시 실제로 호출되는 호스트 (쿠팡 상품 링크는 API 호스트)"""
+        if self.platform_of(link) == "쿠팡" and self.monitor.api_manager.extract_coupang_product_id(link):
+            return "api-gateway.coupang.com"
+        return urlsplit(link).netloc.lower()
+    
+    def _needs_coupang_api(self, link):
+        """쿠팡 링크 확인에 실제 API 호출이 필요한지 (검색 결과가 캐시에 있으면 불필요)"""
+        api_manager = self.monitor.api_manager
+        product_id = api_manager.extract_coupang_product_id(link)
+        return not (product_id and api_manager.is_search_cached(product_id, limit=1))
+    
+    def run(self, links):
+        """
+        링크 목록을 동시에 확인
+        :param links: 상품 링크 목록 (중복 허용)
+        :return: {link: (platform, status, details)} - 쿼터 부족으로 미룬 링크는 제외
+        """
+        unique_links = list(dict.fromkeys(link.strip() for link in links if link and link.strip()))
+        self.deferred_links = []
+        
+        if not unique_links:
+            return {}
+        
+        print(f"[⚡] 링크 동시 확인 시작: 고유 링크 {len(unique_links)}개 (전체 {len(links)}개)")
+        return asyncio.run(self._check_all(unique_links))
+    
+    async def _check_all(self, links):
+        loop = asyncio.get_running_loop()
+        semaphores = {
+            platform: asyncio.Semaphore(max(1, limit))
+            for platform, limit in self.platform_concurrency.items()
+        }
+        host_locks = {}
+        host_next_start = {}
+        results = {}
+        
+        async def wait_for_host_slot(host):
+            lock = host_locks.setdefault(host, asyncio.Lock())
+            async with lock:
+                interval = self.HOST_MIN_INTERVAL.get(host, self.DEFAULT_HOST_INTERVAL)
+                delay = host_next_start.get(host, 0) - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                host_next_start[host] = loop.time() + interval
+        
+        async def check_one(executor, link):
+            platform = self.platform_of(link)
+            host = self._rate_limit_host(link)
+            
+            async with semaphores[platform]:
+                # 쿠팡 API 호출이 필요한 링크만 남은 쿼터 확인 (캐시로 응답 가능한 링크는 미루지 않음)
+                needs_api = True
+                if host == "api-gateway.coupang.com":
+                    needs_api = await loop.run_in_executor(executor, self._needs_coupang_api, link)
+                    if needs_api and self.monitor.api_manager.get_remaining_api_calls("search") <= 0:
+                        self.deferred_links.append(link)
+                        return
+                
+                if needs_api:
+                    await wait_for_host_slot(host)
+                results[link] = await loop.run_in_executor(executor, self.monitor.check_product_link_status, link)
+        
+        max_workers = sum(self.platform_concurrency.values())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            await asyncio.gather(*(check_one(executor, link) for link in links))
+        
+        if self.deferred_links:
+            print(f"[⏸️] API 호출 제한으로 다음 실행으로 미룬 링크: {len(self.deferred_links)}개")
+        
+        return results
+
+
+class RecheckScheduler:
+    """
+    모니터링 링크 재확인 스케줄러 (product_monitor.json 항목의 next_check 기반)
+    - 안정적으로 available인 링크는 확인 간격을 지수적으로 늘림
+    - 상태가 바뀌었거나 실패한 링크, 여러 글에 쓰인 링크는 더 자주 확인
+    - 실행마다 확인 시점이 된 링크만 API 예산 내에서 처리
+    """
+    
+    BASE_INTERVAL_HOURS = 6
+    MAX_INTERVAL_HOURS = 24 * 14
+    CHANGED_INTERVAL_HOURS = 2
+    FAILING_INTERVAL_HOURS = 1
+    
+    # 이 개수 이상의 글에 쓰인 링크는 확인 간격 절반
+    HIGH_TRAFFIC_POST_COUNT = 2
+    
+    FAILING_STATUSES = ("unavailable", "http_error", "error")
+    
+    def __init__(self, monitor_data, api_budget=None):
+        """
+        :param monitor_data: product_monitor.json 데이터 {link_key: 상태}
+        :param api_budget: 이번 실행에서 사용할 쿠팡 API 호출 수 (None이면 제한 없음)
+        """
+        self.monitor_data = monitor_data
+        self.api_budget = api_budget
+    
+    @staticmethod
+    def link_key(post_id, link_index):
+        return f"{post_id}_{link_index}"
+    
+    def _is_due(self, entry, now):
+        next_check = entry.get("next_check")
+        if not next_check:
+            return True
+        try:
+            return datetime.fromisoformat(next_check) <= now
+        except ValueError:
+            return True
+    
+    def _priority(self, entries):
+        """정렬 키 (작을수록 먼저): 미확인 → 실패 → 많은 글에 쓰임 → 오래 지연된 순"""
+        if not all(entries):
+            return (0,)
+        failing = any(entry.get("status") in self.FAILING_STATUSES for entry in entries)
+        overdue = min(entry.get("next_check") or "" for entry in entries)
+        return (1, 0 if failing else 1, -len(entries), overdue)
+    
+    def select_due_links(self, post_links, api_cost, now=None):
+        """
+        이번 실행에서 확인할 링크 선택
+        :param post_links: [(post_meta, product_links)]
+        :param api_cost: 링크 → 쿠팡 API 호출 필요 여부(0/1) 함수
+        :return: (확인할 링크 set, 아직 때가 아닌 링크 수, 예산 초과로 미룬 링크 수)
+        """
+        now = now or datetime.now()
+        entries_by_link = {}
+        for post_meta, product_links in post_links:
+            for i, link in enumerate(product_links, 1):
+                entry = self.monitor_data.get(self.link_key(post_meta['post_id'], i))
+                entries = entries_by_link.setdefault(link.strip(), [])
+                if entry and entry.get("product_url") == link:
+                    entries.append(entry)
+                else:
+                    # 새 링크이거나 같은 위치의 링크가 바뀐 경우 즉시 확인
+                    entries.append({})
+        
+        due = []
+        not_due = 0
+        for link, entries in entries_by_link.items():
+            if any(not entry or self._is_due(entry, now) for entry in entries):
+                due.append(link)
+            else:
+                not_due += 1
+        
+        due.sort(key=lambda link: self._priority(entries_by_link[link]))
+        
+        selected = set()
+        over_budget = 0
+        spent = 0
+        for link in due:
+            cost = api_cost(link)
+            if self.api_budget is not None and cost and spent + cost > self.api_budget:
+                over_budget += 1
+                continue
+            spent += cost
+            selected.add(link)
+        
+        return selected, not_due, over_budget
+    
+    def schedule(self, entry, previous_entry, post_count=1, now=None):
+        """
+        확인 결과에 따라 다음 확인 시각 설정
+        :param entry: 방금 갱신된 모니터링 항목 (next_check, stable_count 추가)
+        :param previous_entry: 갱신 전 항목 (없으면 빈 딕셔너리)
+        :param post_count: 이 링크가 쓰인 글 수
+        """
+        now = now or datetime.now()
+        status = entry.get("status")
+        previous_status = previous_entry.get("status")
+        
+        if status in self.FAILING_STATUSES:
+            stable_count = 0
+            hours = self.FAILING_INTERVAL_HOURS
+        elif previous_status and previous_status != status:
+            stable_count = 0
+            hours = self.CHANGED_INTERVAL_HOURS
+        else:
+            stable_count = previous_entry.get("stable_count", 0) + 1 if status == "available" else 0
+            hours = min(self.BASE_INTERVAL_HOURS * (2 ** stable_count), self.MAX_INTERVAL_HOURS)
+        
+        if post_count >= self.HIGH_TRAFFIC_POST_COUNT:
+            hours = max(self.FAILING_INTERVAL_HOURS, hours / 2)
+        
+        entry["stable_count"] = stable_count
+        entry["next_check"] = (now + timedelta(hours=hours)).isoformat()
+        return entry
+
+
 class ProductMonitor:
     """
     상품 모니터링 시스템
@@ -45,6 +279,21 @@ class ProductMonitor:
         self.monitor_data_file = "/var/www/novacents/tools/cache/product_monitor.json"
         self.alert_log_file = "/var/www/novacents/tools/cache/alert_log.json"
         
+        # 증분 모니터링 상태 (수정 시각 커서 + 크롤링 체크포인트)
+        self.monitor_state_file = "/var/www/novacents/tools/cache/product_monitor_state.json"
+        self.archive_state_file = "/var/www/novacents/tools/cache/product_monitor_archive_state.json"
+        
+        # 글별 추출 링크 캐시 (글 단위 행으로 갱신)
+        self.monitor_posts_db = "/var/www/novacents/tools/cache/product_monitor_posts.db"
+        self.archive_posts_db = "/var/www/novacents/tools/cache/product_monitor_archive_posts.db"
+        self.post_link_stores = {}
+        
+        # 일괄 조회한 알리익스프레스 상품 상세 정보 {product_id: 상품 정보 또는 None}
+        self.aliexpress_details = {}
+        
+        # HTTP 상태 확인용 공유 세션 (동시 확인 시 커넥션 재사용)
+        self.http_session = requests.Session()
+        
         # 캐시 디렉토리 생성
         cache_dir = os.path.dirname(self.monitor_data_file)
         if not os.path.exists(cache_dir):
@@ -122,49 +371,261 @@ class ProductMonitor:
             print(f"[❌] 텔레그램 메시지 발송 오류: {e}")
             return False
     
-    def get_published_posts(self, days_back=7, limit=50):
+    # 모니터링에 필요한 글 필드만 요청 (응답 크기 축소)
+    POST_FIELDS = "id,date,modified,link,title,content"
+    
+    # 전체 글 크롤링 시 페이지당 글 수 (WordPress REST API 최대값)
+    CRAWL_PER_PAGE = 100
+    
+    # 삭제/발행 취소된 글 정리 주기 (증분 조회 시, 전체 조회는 매번 정리)
+    RECONCILE_INTERVAL_HOURS = 24
+    
+    def _wp_auth_headers(self):
+        """WordPress REST API 기본 인증 헤더"""
+        import base64
+        credentials = f"{self.config['wp_user']}:{self.config['wp_app_pass']}"
+        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+        return {
+            'Authorization': f'Basic {encoded_credentials}',
+            'Content-Type': 'application/json'
+        }
+    
+    def _post_query_params(self, days_back=None, position=None, after=None):
+        """글 조회 공통 파라미터 (수정 시각 오름차순, position 이후 수정된 글만)"""
+        params = {
+            'status': 'publish',
+            '_fields': self.POST_FIELDS,
+            'orderby': 'modified'
+        }
+        
+        if after:
+            params['after'] = after
+        elif days_back is not None:
+            params['after'] = (datetime.now() - timedelta(days=days_back)).isoformat()
+        
+        if position:
+            # modified_after는 초 단위 초과 비교라 1초 앞을 기준으로 같은 수정 시각의 글을 포함하고, 이미 본 글은 제외
+            params['modified_after'] = (datetime.fromisoformat(position['modified']) - timedelta(seconds=1)).isoformat()
+            if position['ids']:
+                params['exclude'] = ','.join(str(post_id) for post_id in position['ids'])
+        
+        return params
+    
+    def iter_published_post_pages(self, days_back=None, position=None, per_page=None, after=None):
         """
-        최근 발행된 글 목록 조회
-        :param days_back: 몇 일 전까지 조회할지
-        :param limit: 최대 조회 개수
-        :return: 글 목록
+        발행된 글을 수정 시각 오름차순으로 페이지 단위 순회 (전체 글을 메모리에 올리지 않음)
+        - 오프셋 대신 마지막으로 본 수정 시각 이후를 매번 1페이지로 조회
+          (크롤링 중 글이 수정되어도 아직 보지 않은 글이 앞 페이지로 밀려 누락되지 않음, 수정된 글은 뒤에서 다시 조회)
+        - 받은 글이 per_page보다 적으면 완료
+        :param days_back: 몇 일 전까지 조회할지 (None이면 전체 기간)
+        :param position: {"modified": 마지막으로 본 수정 시각, "ids": 그 시각에 본 글 ID} - None이면 처음부터
+        :param per_page: 페이지당 글 수
+        :param after: 발행일 하한 (지정 시 days_back 대신 사용 - 체크포인트와 같은 조회 범위 유지)
+        :return: (position, posts, done) 제너레이터 - position은 이 페이지까지 본 위치, 조회 실패 시 중단
         """
-        try:
-            # WordPress REST API 엔드포인트
-            api_url = f"{self.config['wp_url']}/wp-json/wp/v2/posts"
+        api_url = f"{self.config['wp_url']}/wp-json/wp/v2/posts"
+        headers = self._wp_auth_headers()
+        per_page = per_page or self.CRAWL_PER_PAGE
+        
+        while True:
+            params = self._post_query_params(days_back=days_back, position=position, after=after)
+            params['per_page'] = per_page
+            params['order'] = 'asc'
+            try:
+                response = self.http_session.get(api_url, headers=headers, params=params, timeout=30)
+            except Exception as e:
+                print(f"[❌] WordPress 글 조회 오류: {e}")
+                return
             
-            # 기본 인증 헤더
-            import base64
-            credentials = f"{self.config['wp_user']}:{self.config['wp_app_pass']}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
-            headers = {
-                'Authorization': f'Basic {encoded_credentials}',
-                'Content-Type': 'application/json'
-            }
+            if response.status_code != 200:
+                print(f"[❌] WordPress 글 조회 실패: {response.status_code}")
+                return
             
-            # 최근 글 조회 파라미터
-            since_date = (datetime.now() - timedelta(days=days_back)).isoformat()
-            params = {
-                'after': since_date,
-                'per_page': limit,
-                'status': 'publish',
-                'orderby': 'date',
-                'order': 'desc'
-            }
+            posts = response.json()
+            for post in posts:
+                modified = post.get('modified')
+                if not modified:
+                    continue
+                if position and modified == position['modified']:
+                    position = {"modified": modified, "ids": position['ids'] + [post['id']]}
+                elif not position or modified > position['modified']:
+                    position = {"modified": modified, "ids": [post['id']]}
             
-            response = requests.get(api_url, headers=headers, params=params, timeout=30)
+            done = len(posts) < per_page
+            print(f"[✅] WordPress 글 조회: {len(posts)}개 ({position['modified'] if position else '-'}까지)")
             
-            if response.status_code == 200:
-                posts = response.json()
-                print(f"[✅] WordPress 글 조회 성공: {len(posts)}개")
-                return posts
-            else:
-                print(f"[❌] WordPress 글 조회 실패: {response.status_code}")
-                return []
-                
+            yield position, posts, done
+            
+            if done:
+                return
+    
+    def _load_monitor_state(self, state_file=None):
+        """증분 모니터링 상태 로드"""
+        state = self._load_json_file(state_file or self.monitor_state_file, {})
+        
+        # 이전 형식: 수정 시각 문자열 커서, 페이지 번호 체크포인트
+        legacy_cursor = state.pop("modified_after", None)
+        state.setdefault("cursor", {"modified": legacy_cursor, "ids": []} if legacy_cursor else None)
+        if not (state.get("crawl") and "position" in state["crawl"]):
+            state["crawl"] = None
+        return state
+    
+    def get_post_link_store(self, all_posts=False):
+        """모니터링 범위별 글 링크 캐시 (최근 글 / 전체 글)"""
+        db_path = self.archive_posts_db if all_posts else self.monitor_posts_db
+        if db_path not in self.post_link_stores:
+            self.post_link_stores[db_path] = PostLinkStore(db_path)
+        return self.post_link_stores[db_path]
+    
+    def _migrate_cached_posts(self, state, state_file, store):
+        """상태 파일에 글별 링크를 쌓던 이전 형식이면 캐시 DB로 옮기고 상태 파일에서 제거"""
+        cached_posts = state.pop("posts", None)
+        if cached_posts is None:
+            return
+        for post_id, item in cached_posts.items():
+            store.upsert(post_id, item)
+        self._save_json_file(state_file, state)
+        print(f"[🔄] 상태 파일의 글 링크 캐시 {len(cached_posts)}개를 {store.db_path}로 이전")
+    
+    @staticmethod
+    def _content_hash(content):
+        """글 내용 해시 (링크 재추출 필요 여부 판단용)"""
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+    
+    def find_unpublished_post_ids(self, post_ids):
+        """
+        캐시된 글 중 더 이상 발행 상태가 아닌 글 ID 조회 (삭제, 비공개/임시글 전환)
+        - 캐시된 ID를 include로 지정해 ID 필드만 조회 (전체 목록을 오프셋으로 훑을 때처럼 조회 중 삭제로 글이 밀려 잘못 제거되지 않음)
+        :param post_ids: 확인할 글 ID 목록 (최대 CRAWL_PER_PAGE개)
+        :return: 발행 글 목록에 없는 ID 목록, 조회 실패 시 None
+        """
+        api_url = f"{self.config['wp_url']}/wp-json/wp/v2/posts"
+        params = {
+            'status': 'publish',
+            '_fields': 'id',
+            'include': ','.join(str(post_id) for post_id in post_ids),
+            'per_page': len(post_ids)
+        }
+        try:
+            response = self.http_session.get(api_url, headers=self._wp_auth_headers(), params=params, timeout=30)
         except Exception as e:
-            print(f"[❌] WordPress 글 조회 오류: {e}")
-            return []
+            print(f"[⚠️] 글 발행 상태 확인 오류: {e}")
+            return None
+        
+        if response.status_code != 200:
+            print(f"[⚠️] 글 발행 상태 확인 실패: {response.status_code}")
+            return None
+        
+        published = {str(post['id']) for post in response.json()}
+        return [post_id for post_id in post_ids if str(post_id) not in published]
+    
+    def reconcile_post_links(self, store):
+        """
+        캐시된 글 중 삭제되었거나 발행 취소된 글 제거 (수정 시각 커서로는 삭제를 알 수 없음)
+        - 확인에 실패한 묶음은 건너뛰고 다음 정리 때 다시 확인
+        :return: 제거된 글 ID 목록
+        """
+        removed_post_ids = []
+        for post_ids in store.iter_post_ids(batch_size=self.CRAWL_PER_PAGE):
+            missing = self.find_unpublished_post_ids(post_ids)
+            if missing:
+                store.delete(missing)
+                removed_post_ids.extend(missing)
+        
+        print(f"[🧹] 삭제/발행 취소된 글 {len(removed_post_ids)}개를 캐시에서 제거")
+        return removed_post_ids
+    
+    def collect_post_links(self, days_back=7, incremental=True, all_posts=False):
+        """
+        모니터링 대상 글과 상품 링크 수집
+        - 마지막 실행 이후 수정된 글만 조회 (수정 시각 커서)
+        - 글 ID + 내용 해시가 같으면 링크 재추출 생략
+        - 변경되지 않은 글은 캐시된 링크로 계속 모니터링
+        - 글별 링크는 PostLinkStore에 글 단위로 저장, 상태 파일에는 커서와 체크포인트만 저장
+        - 페이지마다 체크포인트를 저장해 중단되어도 다음 실행에서 이어서 조회
+        - 전체 조회 시 또는 하루에 한 번 삭제/발행 취소된 글을 캐시에서 제거
+        :param days_back: 몇 일 전까지 모니터링할지 (all_posts=True면 무시)
+        :param incremental: False면 커서를 무시하고 기간 내 글 전체 조회
+        :param all_posts: True면 전체 발행 글 대상 (별도 상태 파일/캐시 DB 사용)
+        :return: (PostLinkStore, 삭제/발행 취소로 제거된 글 ID 목록) - iter_posts()로 (post_meta, product_links) 순회
+        """
+        state_file = self.archive_state_file if all_posts else self.monitor_state_file
+        state = self._load_monitor_state(state_file)
+        store = self.get_post_link_store(all_posts)
+        self._migrate_cached_posts(state, state_file, store)
+        cursor = state["cursor"] if incremental else None
+        
+        # 발행일 하한은 크롤링 시작 시 고정 (재개할 때 같은 조회 범위로 이어감)
+        after = None if all_posts else (datetime.now() - timedelta(days=days_back)).isoformat()
+        
+        # 진행 중이던 크롤링이 있으면 마지막으로 본 위치부터 재개 (전체 조회 요청 시 증분 크롤링은 재개하지 않음)
+        crawl = state["crawl"]
+        position = cursor
+        if crawl and (crawl["after"] is None) == all_posts and (incremental or not crawl["incremental"]):
+            after = crawl["after"]
+            position = crawl["position"]
+            print(f"[⏯️] 체크포인트에서 재개: {position['modified'] if position else '-'} 이후 수정된 글")
+        elif cursor:
+            print(f"[🔄] 증분 조회: {cursor['modified']} 이후 수정된 글")
+        
+        reused = 0
+        parsed = 0
+        fetched = 0
+        completed = False
+        for position, posts, done in self.iter_published_post_pages(position=position, after=after):
+            for post in posts:
+                post_id = str(post['id'])
+                content = post['content']['rendered']
+                content_hash = self._content_hash(content)
+                cached = store.get(post_id)
+                
+                if cached and cached.get("content_hash") == content_hash:
+                    links = cached["links"]
+                    reused += 1
+                else:
+                    links = self.extract_product_links_from_content(content)
+                    parsed += 1
+                
+                store.upsert(post_id, {
+                    "post_title": post['title']['rendered'],
+                    "post_url": post['link'],
+                    "post_date": post['date'],
+                    "modified": post.get('modified'),
+                    "content_hash": content_hash,
+                    "links": links
+                })
+            
+            fetched += len(posts)
+            completed = done
+            state["crawl"] = None if done else {
+                "incremental": incremental,
+                "after": after,
+                "position": position
+            }
+            if done:
+                # 다음 실행 커서는 서버 기준 마지막 수정 시각 (크롤링 완료 후 반영)
+                state["cursor"] = position
+            self._save_json_file(state_file, state)
+        
+        if not completed:
+            print(f"[⚠️] 글 조회가 완료되지 않았습니다 - 다음 실행에서 이어서 조회합니다")
+        
+        removed_post_ids = []
+        reconciled_at = state.get("reconciled_at")
+        if (not incremental or not reconciled_at
+                or datetime.now() - datetime.fromisoformat(reconciled_at) >= timedelta(hours=self.RECONCILE_INTERVAL_HOURS)):
+            removed_post_ids = self.reconcile_post_links(store)
+            state["reconciled_at"] = datetime.now().isoformat()
+            self._save_json_file(state_file, state)
+        
+        # 모니터링 기간이 지난 글은 캐시에서 제거
+        if not all_posts:
+            since_date = (datetime.now() - timedelta(days=days_back)).isoformat()
+            store.prune_before(since_date)
+        
+        print(f"[📋] 변경된 글 {fetched}개 (링크 추출 {parsed}개, 캐시 재사용 {reused}개), 모니터링 대상 {store.count()}개")
+        
+        return store, removed_post_ids
     
     def extract_product_links_from_content(self, content):
         """
@@ -244,7 +705,7 @@ class ProductMonitor:
                         }
             
             # API로 확인할 수 없는 경우 HTTP 상태 확인
-            response = requests.head(product_url, timeout=10, allow_redirects=True)
+            response = self.http_session.head(product_url, timeout=10, allow_redirects=True)
             if response.status_code == 200:
                 return "쿠팡", "unknown", {"http_status": "200", "note": "HTTP는 정상이지만 상품 상태 미확인"}
             else:
@@ -259,8 +720,11 @@ class ProductMonitor:
             # 알리익스프레스 상품 ID 추출
             product_id = self.api_manager.extract_aliexpress_product_id(product_url)
             if product_id:
-                # API로 상품 상세 정보 조회 시도
-                product_info = self.api_manager._get_aliexpress_product_details(product_id)
+                # 일괄 조회 결과 우선 사용, 없으면 단건 조회
+                if product_id in self.aliexpress_details:
+                    product_info = self.aliexpress_details[product_id]
+                else:
+                    product_info = self.api_manager._get_aliexpress_product_details(product_id)
                 if product_info:
                     return "알리익스프레스", "available", {
                         "title": product_info.get('title', 'N/A'),
@@ -274,7 +738,7 @@ class ProductMonitor:
                     }
             
             # HTTP 상태 확인
-            response = requests.head(product_url, timeout=10, allow_redirects=True)
+            response = self.http_session.head(product_url, timeout=10, allow_redirects=True)
             if response.status_code == 200:
                 return "알리익스프레스", "unknown", {"http_status": "200", "note": "HTTP는 정상이지만 상품 상태 미확인"}
             else:
@@ -283,21 +747,60 @@ class ProductMonitor:
         except Exception as e:
             return "알리익스프레스", "error", {"error": str(e)}
     
-    def monitor_posts(self, days_back=7):
+    def prefetch_aliexpress_details(self, product_links):
+        """
+        알리익스프레스 링크들의 상품 상세 정보를 product.detail 일괄 호출로 미리 조회
+        :param product_links: 상품 링크 목록
+        """
+        product_ids = []
+        for link in product_links:
+            if 'aliexpress.com' not in link.lower():
+                continue
+            product_id = self.api_manager.extract_aliexpress_product_id(link)
+            if product_id and product_id not in product_ids and product_id not in self.aliexpress_details:
+                product_ids.append(product_id)
+        
+        if not product_ids:
+            return
+        
+        print(f"[📦] 알리익스프레스 상품 {len(product_ids)}개 일괄 조회")
+        self.aliexpress_details.update(self.api_manager.get_aliexpress_product_details_batch(product_ids))
+    
+    def _coupang_api_cost(self, link):
+        """링크 확인에 쿠팡 API 호출이 필요한지 (1/0)"""
+        if 'coupang.com' in link.lower() and self.api_manager.extract_coupang_product_id(link):
+            return 1
+        return 0
+    
+    def monitor_posts(self, days_back=7, incremental=True, api_budget=None, all_posts=False):
         """
         발행된 글들의 상품 상태 모니터링
         :param days_back: 몇 일 전까지 모니터링할지
+        :param incremental: 변경된 글만 조회하고 나머지는 캐시된 링크 사용
+        :param api_budget: 이번 실행의 쿠팡 API 호출 예산 (None이면 현재 남은 시간당 호출 수)
+        :param all_posts: True면 기간 제한 없이 전체 발행 글 모니터링
         :return: 모니터링 결과
         """
-        print(f"\n[🔍] 상품 모니터링 시작 (최근 {days_back}일)")
+        if all_posts:
+            print(f"\n[🔍] 상품 모니터링 시작 (전체 글)")
+        else:
+            print(f"\n[🔍] 상품 모니터링 시작 (최근 {days_back}일)")
         print("=" * 60)
         
         # 기존 모니터링 데이터 로드
         monitor_data = self._load_json_file(self.monitor_data_file, {})
         
-        # 발행된 글 조회
-        posts = self.get_published_posts(days_back=days_back)
-        if not posts:
+        # 1단계: 글별 상품 링크 수집 (변경된 글만 조회/추출)
+        store, removed_post_ids = self.collect_post_links(days_back=days_back, incremental=incremental, all_posts=all_posts)
+        
+        # 삭제/발행 취소된 글의 링크 모니터링 데이터 제거
+        if removed_post_ids:
+            removed = set(str(post_id) for post_id in removed_post_ids)
+            for link_key in [key for key, entry in monitor_data.items() if str(entry.get("post_id")) in removed]:
+                del monitor_data[link_key]
+            self._save_json_file(self.monitor_data_file, monitor_data)
+        
+        if not store.count():
             print("[⚠️] 조회할 글이 없습니다")
             return
         
@@ -305,90 +808,54 @@ class ProductMonitor:
         checked_posts = 0
         total_links = 0
         
-        for post in posts:
-            post_id = str(post['id'])
-            post_title = post['title']['rendered']
-            post_url = post['link']
-            post_date = post['date']
-            
-            print(f"\n[📄] 글 분석: {post_title}")
-            print(f"    ID: {post_id}, 날짜: {post_date}")
-            
-            # 글 내용에서 상품 링크 추출
-            content = post['content']['rendered']
-            product_links = self.extract_product_links_from_content(content)
+        post_links = []
+        for post_meta, product_links in store.iter_posts():
+            if not all_posts:
+                print(f"\n[📄] 글 분석: {post_meta['post_title']}")
+                print(f"    ID: {post_meta['post_id']}, 날짜: {post_meta['post_date']}")
             
             if not product_links:
-                print(f"    ℹ️ 상품 링크가 없습니다")
+                if not all_posts:
+                    print(f"    ℹ️ 상품 링크가 없습니다")
                 continue
             
-            print(f"    🔗 발견된 상품 링크: {len(product_links)}개")
+            if not all_posts:
+                print(f"    🔗 발견된 상품 링크: {len(product_links)}개")
             checked_posts += 1
             total_links += len(product_links)
-            
-            # 각 상품 링크 상태 확인
+            post_links.append((post_meta, product_links))
+        
+        # 2단계: 확인 시점이 된 링크만 API 예산 내에서 선택
+        if api_budget is None:
+            api_budget = self.api_manager.get_remaining_api_calls()
+        scheduler = RecheckScheduler(monitor_data, api_budget=api_budget)
+        due_links, not_due, over_budget = scheduler.select_due_links(post_links, self._coupang_api_cost)
+        print(f"\n[🗓️] 재확인 대상 링크: {len(due_links)}개 (대기 {not_due}개, 예산 초과 {over_budget}개, 쿠팡 API 예산 {api_budget}회)")
+        
+        post_count_by_link = {}
+        for _, links in post_links:
+            for link in set(link.strip() for link in links):
+                post_count_by_link[link] = post_count_by_link.get(link, 0) + 1
+        
+        # 3단계: 알리익스프레스 상품 정보 일괄 조회 후 대상 링크 동시 확인 (중복 링크는 1회)
+        self.prefetch_aliexpress_details(list(due_links))
+        
+        engine = LinkCheckEngine(self)
+        link_results = engine.run(list(due_links))
+        
+        # 4단계: 결과를 글/링크 단위 모니터링 데이터에 병합하고 다음 확인 시각 설정
+        checked_links = 0
+        for post_meta, product_links in post_links:
             for i, link in enumerate(product_links, 1):
-                print(f"    [{i}/{len(product_links)}] 상품 확인 중...")
-                
-                platform, status, details = self.check_product_link_status(link)
-                
-                # 모니터링 데이터 업데이트
-                link_key = f"{post_id}_{i}"
-                current_status = {
-                    "post_id": post_id,
-                    "post_title": post_title,
-                    "post_url": post_url,
-                    "link_index": i,
-                    "product_url": link,
-                    "platform": platform,
-                    "status": status,
-                    "details": details,
-                    "last_checked": datetime.now().isoformat(),
-                    "check_count": monitor_data.get(link_key, {}).get("check_count", 0) + 1
-                }
-                
-                # 이전 상태와 비교
-                previous_status = monitor_data.get(link_key, {}).get("status")
-                
-                if previous_status and previous_status != status:
-                    # 상태 변경 감지
-                    if status in ["unavailable", "http_error", "error"]:
-                        alert = {
-                            "type": "status_changed",
-                            "post_title": post_title,
-                            "post_url": post_url,
-                            "product_url": link,
-                            "platform": platform,
-                            "previous_status": previous_status,
-                            "current_status": status,
-                            "details": details,
-                            "detected_at": datetime.now().isoformat()
-                        }
-                        alerts.append(alert)
-                        print(f"        🚨 상태 변경 감지: {previous_status} → {status}")
-                
-                # 새로운 문제 상품 감지
-                elif not previous_status and status in ["unavailable", "http_error", "error"]:
-                    alert = {
-                        "type": "new_issue",
-                        "post_title": post_title,
-                        "post_url": post_url,
-                        "product_url": link,
-                        "platform": platform,
-                        "status": status,
-                        "details": details,
-                        "detected_at": datetime.now().isoformat()
-                    }
-                    alerts.append(alert)
-                    print(f"        ⚠️ 문제 상품 발견: {status}")
-                
-                # 모니터링 데이터 저장
-                monitor_data[link_key] = current_status
-                
-                print(f"        ✅ {platform}: {status}")
-                
-                # API 제한 고려 대기
-                time.sleep(1)
+                result = link_results.get(link.strip())
+                if result is None:
+                    # 확인 시점이 아니거나 쿼터 부족으로 미룬 링크는 기존 상태 유지
+                    continue
+                link_key = RecheckScheduler.link_key(post_meta['post_id'], i)
+                previous_entry = dict(monitor_data.get(link_key, {}))
+                self._merge_link_result(monitor_data, alerts, post_meta, i, link, result)
+                scheduler.schedule(monitor_data[link_key], previous_entry, post_count_by_link.get(link.strip(), 1))
+                checked_links += 1
         
         # 모니터링 데이터 저장
         self._save_json_file(self.monitor_data_file, monitor_data)
@@ -402,15 +869,81 @@ class ProductMonitor:
         print(f"🏆 모니터링 완료")
         print(f"📊 결과 요약:")
         print(f"  📄 확인된 글: {checked_posts}개")
-        print(f"  🔗 확인된 링크: {total_links}개")
+        print(f"  🔗 확인된 링크: {checked_links}개 (전체 {total_links}개)")
         print(f"  🚨 발견된 알림: {len(alerts)}개")
         
         return {
             "checked_posts": checked_posts,
             "total_links": total_links,
+            "checked_links": checked_links,
             "alerts": alerts
         }
     
+    def _merge_link_result(self, monitor_data, alerts, post_meta, link_index, link, result):
+        """
+        링크 확인 결과를 모니터링 데이터에 반영하고 상태 변경/신규 문제 알림 생성
+        :param post_meta: post_id, post_title, post_url 포함 딕셔너리
+        :param result: (platform, status, details)
+        """
+        platform, status, details = result
+        post_title = post_meta['post_title']
+        post_url = post_meta['post_url']
+        
+        # 모니터링 데이터 업데이트
+        link_key = f"{post_meta['post_id']}_{link_index}"
+        current_status = {
+            "post_id": post_meta['post_id'],
+            "post_title": post_title,
+            "post_url": post_url,
+            "link_index": link_index,
+            "product_url": link,
+            "platform": platform,
+            "status": status,
+            "details": details,
+            "last_checked": datetime.now().isoformat(),
+            "check_count": monitor_data.get(link_key, {}).get("check_count", 0) + 1
+        }
+        
+        # 이전 상태와 비교
+        previous_status = monitor_data.get(link_key, {}).get("status")
+        
+        if previous_status and previous_status != status:
+            # 상태 변경 감지
+            if status in ["unavailable", "http_error", "error"]:
+                alert = {
+                    "type": "status_changed",
+                    "post_title": post_title,
+                    "post_url": post_url,
+                    "product_url": link,
+                    "platform": platform,
+                    "previous_status": previous_status,
+                    "current_status": status,
+                    "details": details,
+                    "detected_at": datetime.now().isoformat()
+                }
+                alerts.append(alert)
+                print(f"        🚨 상태 변경 감지 ({link_key}): {previous_status} → {status}")
+        
+        # 새로운 문제 상품 감지
+        elif not previous_status and status in ["unavailable", "http_error", "error"]:
+            alert = {
+                "type": "new_issue",
+                "post_title": post_title,
+                "post_url": post_url,
+                "product_url": link,
+                "platform": platform,
+                "status": status,
+                "details": details,
+                "detected_at": datetime.now().isoformat()
+            }
+            alerts.append(alert)
+            print(f"        ⚠️ 문제 상품 발견 ({link_key}): {status}")
+        
+        # 모니터링 데이터 저장
+        monitor_data[link_key] = current_status
+        
+        print(f"        ✅ {link_key} {platform}: {status}")
+    
     def _process_alerts(self, alerts):
         """알림 처리 및 텔레그램 발송"""
         print(f"\n[🚨] 알림 처리 시작: {len(alerts)}개")
@@ -499,14 +1032,28 @@ class ProductMonitor:
 
 def main():
     """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='상품 링크 모니터링')
+    parser.add_argument('--all', action='store_true', help='전체 발행 글 모니터링 (페이지 단위 크롤링, 중단 시 이어서 진행)')
+    parser.add_argument('--days', type=int, default=7, help='모니터링 기간 (일, --all 미사용 시)')
+    parser.add_argument('--full', action='store_true', help='수정 시각 커서를 무시하고 다시 조회')
+    parser.add_argument('--budget', type=int, help='이번 실행의 쿠팡 API 호출 예산')
+    args = parser.parse_args()
+    
     print("🔍 상품 모니터링 시스템 시작")
     print("=" * 60)
     
     try:
         monitor = ProductMonitor()
         
-        # 모니터링 실행 (최근 7일)
-        result = monitor.monitor_posts(days_back=7)
+        # 모니터링 실행 (기본: 최근 7일)
+        result = monitor.monitor_posts(
+            days_back=args.days,
+            incremental=not args.full,
+            api_budget=args.budget,
+            all_posts=args.all
+        )
         
         # 통계 출력
         stats = monitor.get_monitoring_stats()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+공용 상품 레코드
+쿠팡/알리익스프레스 응답 포맷터가 같은 레코드 타입을 사용하고, 표시 문자열은 필요할 때만 생성
+
+- 가격은 통화 최소 단위 정수로 저장 (KRW: 원, USD: 센트) - 하위 코드에서 문자열 재파싱 불필요
+- 평점(float), 판매량/리뷰 수(int)는 숫자로 저장
+- "$1.23 (약 1,722원)" 같은 표시 문자열은 프로퍼티/to_dict()에서 생성
+- original_data(API 원본 응답)는 레코드에 넣지 않음 (SafeAPIManager.get_original_data로 별도 조회)
+- 캐시에는 to_compact() 결과(기본값이 아닌 필드만)를 저장하고 from_compact()로 복원
+- 적용 범위: SafeAPIManager의 상품 포맷터 (쿠팡 검색/베스트/카테고리, 알리익스프레스 검색/상세)
+  real_product_analyzer.py, official_guide_analyzer.py는 PHP가 읽는 별도 JSON 형식을 출력하는
+  독립 실행 스크립트라 레코드를 쓰지 않고 가격 파서(parse_minor_units)만 공유
+
+파일 위치: /var/www/novacents/tools/product_record.py
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+# USD → KRW 환산 환율 (기존 포맷터와 동일)
+USD_TO_KRW = 1400
+
+# 통화별 최소 단위 자릿수
+CURRENCY_EXPONENT = {"KRW": 0, "USD": 2}
+
+COUPANG = "쿠팡"
+ALIEXPRESS = "알리익스프레스"
+
+# 압축 형식 표시 키 (캐시에 저장된 기존 dict 형식과 구분)
+COMPACT_MARKER = "_r"
+
+
+def parse_minor_units(value, currency="USD", rounding=ROUND_HALF_UP):
+    """
+    가격 값("1,234.56", 12.3, 15000 등)을 통화 최소 단위 정수로 변환
+    :param rounding: 최소 단위 미만 처리 (ROUND_DOWN이면 기존 int(float(...))와 같은 버림)
+    :return: 정수 또는 None (파싱 불가)
+    """
+    if value is None or value == "":
+        return None
+    scale = Decimal(10) ** CURRENCY_EXPONENT.get(currency, 2)
+    try:
+        amount = Decimal(str(value).replace(',', '').replace('$', '').replace('₩', '').strip())
+        return int((amount * scale).quantize(Decimal(1), rounding=rounding))
+    except (InvalidOperation, ValueError, OverflowError):
+        return None
+
+
+def _to_float(value):
+    try:
+        return float(str(value).replace('%', '').replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value):
+    try:
+        return int(str(value).replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+def usd_cents_to_krw(cents):
+    """USD 센트 → 원 (환율 USD_TO_KRW, 원 단위 버림)"""
+    return cents * USD_TO_KRW // 100
+
+
+class ProductRecord:
+    """
+    상품 레코드 (__slots__ - 인스턴스 dict 없음)
+    - 숫자 필드: price_minor, original_price_minor, commission_minor (currency 기준 최소 단위),
+      discount_rate(%), rating, volume
+    """
+
+    __slots__ = (
+        "platform", "product_id", "title", "currency",
+        "price_minor", "original_price_minor", "discount_rate",
+        "image_url", "video_url", "product_url", "affiliate_url",
+        "vendor", "brand_name", "shop_id", "shop_url", "category", "subcategory",
+        "rating", "volume", "commission_minor", "commission_rate",
+        "is_plus", "product_type", "is_rocket", "is_free_shipping",
+    )
+
+    DEFAULTS = {
+        "platform": "", "product_id": "", "title": "", "currency": "KRW",
+        "price_minor": None, "original_price_minor": None, "discount_rate": None,
+        "image_url": "", "video_url": "", "product_url": "", "affiliate_url": "",
+        "vendor": "", "brand_name": None, "shop_id": "", "shop_url": "", "category": "", "subcategory": "",
+        "rating": None, "volume": None, "commission_minor": None, "commission_rate": None,
+        "is_plus": False, "product_type": None, "is_rocket": None, "is_free_shipping": None,
+    }
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.pop(name, self.DEFAULTS[name]))
+        if fields:
+            raise TypeError(f"알 수 없는 상품 필드: {', '.join(fields)}")
+
+    def __repr__(self):
+        return f"ProductRecord({self.platform}, {self.product_id}, {self.title!r})"
+
+    # ------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_coupang(cls, product, vendor_field=None):
+        """
+        쿠팡 상품 응답 → 레코드
+        :param vendor_field: 판매자명 필드 (검색 목록 응답은 vendorItemName)
+        """
+        price = product.get("salesPrice") or product.get("productPrice")
+        return cls(
+            platform=COUPANG,
+            product_id=product.get("productId"),
+            title=product.get("productName"),
+            currency="KRW",
+            price_minor=parse_minor_units(price, "KRW"),
+            original_price_minor=parse_minor_units(product.get("originalPrice"), "KRW"),
+            discount_rate=_to_int(product.get("discountRate")),
+            image_url=product.get("productImage"),
+            product_url=product.get("productUrl"),
+            affiliate_url=product.get("productUrl"),
+            vendor=product.get(vendor_field) if vendor_field else COUPANG,
+            brand_name=product.get("brandName"),
+            category=product.get("categoryName") or "",
+            is_rocket=product.get("isRocket"),
+            is_free_shipping=product.get("isFreeShipping"),
+            rating=_to_float(product.get("rating")),
+            volume=_to_int(product.get("reviewCount")),
+            commission_rate="알 수 없음" if vendor_field else None,
+        )
+
+    @classmethod
+    def coupang_landing(cls, keyword, landing_url):
+        """상품 목록 없이 landingUrl만 있는 쿠팡 응답 → 레코드"""
+        return cls(
+            platform=COUPANG,
+            product_id="landing_page",
+            title=f"{keyword} 관련 상품 모음",
+            currency="KRW",
+            product_url=landing_url,
+            affiliate_url=landing_url,
+            vendor=COUPANG,
+            commission_rate="알 수 없음",
+        )
+
+    @classmethod
+    def from_aliexpress(cls, product, product_id=None):
+        """알리익스프레스 product.query / product.detail 응답 상품 → 레코드"""
+        product_id = product_id or product.get("product_id")
+        price_minor = parse_minor_units(product.get("target_sale_price", 0), "USD") or 0
+        original_price_minor = parse_minor_units(product.get("target_original_price"), "USD") or price_minor
+
+        discount_rate = None
+        if original_price_minor > 0 and original_price_minor != price_minor:
+            discount_rate = round((original_price_minor - price_minor) / original_price_minor * 100)
+
+        commission_rate = product.get("relevant_market_commission_rate")
+        return cls(
+            platform=ALIEXPRESS,
+            product_id=product_id,
+            title=product.get("product_title", "상품명 없음"),
+            currency="USD",
+            price_minor=price_minor,
+            original_price_minor=original_price_minor,
+            discount_rate=discount_rate,
+            image_url=product.get("product_main_image_url", ""),
+            video_url=product.get("product_video_url", ""),
+            product_url=f"https://www.aliexpress.com/item/{product_id}.html",
+            vendor=ALIEXPRESS,
+            shop_id=product.get("shop_id", ""),
+            shop_url=product.get("shop_url", ""),
+            category=product.get("first_level_category_name", ""),
+            subcategory=product.get("second_level_category_name", ""),
+            rating=_to_float(product.get("evaluate_rate")),
+            volume=_to_int(product.get("volume")),
+            commission_minor=parse_minor_units(product.get("30days_commission"), "USD"),
+            commission_rate=commission_rate if commission_rate and commission_rate != "0" else None,
+            is_plus=product.get("plus_product", False),
+            product_type=product.get("platform_product_type", "ALL"),
+        )
+
+    # ------------------------------------------------------------------
+    # 숫자 값
+    # ------------------------------------------------------------------
+
+    @property
+    def price_krw(self):
+        """원화 가격 (USD 상품은 USD_TO_KRW로 환산)"""
+        if self.price_minor is None:
+            return None
+        return usd_cents_to_krw(self.price_minor) if self.currency == "USD" else self.price_minor
+
+    @property
+    def original_price_krw(self):
+        if self.original_price_minor is None:
+            return None
+        return usd_cents_to_krw(self.original_price_minor) if self.currency == "USD" else self.original_price_minor
+
+    # ------------------------------------------------------------------
+    # 표시 문자열 (필요할 때만 생성)
+    # ------------------------------------------------------------------
+
+    def _money_display(self, minor):
+        if self.currency == "USD":
+            return f"${minor / 100:.2f} (약 {usd_cents_to_krw(minor):,}원)"
+        return f"{minor:,}원"
+
+    @property
+    def price_display(self):
+        return self._money_display(self.price_minor) if self.price_minor is not None else "가격 정보 없음"
+
+    @property
+    def original_price_display(self):
+        minor = self.original_price_minor if self.original_price_minor is not None else self.price_minor
+        return self._money_display(minor) if minor is not None else "가격 정보 없음"
+
+    @property
+    def discount_display(self):
+        return f"{self.discount_rate}%" if self.discount_rate and self.discount_rate > 0 else "할인 없음"
+
+    @property
+    def rating_display(self):
+        return f"{self.rating:.1f}점" if self.rating and self.rating > 0 else "평점 정보 없음"
+
+    @property
+    def volume_display(self):
+        return f"{self.volume:,}개 판매" if self.volume and self.volume > 0 else "판매량 정보 없음"
+
+    @property
+    def commission_display(self):
+        return f"${self.commission_minor / 100:.2f}" if self.commission_minor else "수수료 정보 없음"
+
+    # ------------------------------------------------------------------
+    # 변환
+    # ------------------------------------------------------------------
+
+    def to_dict(self):
+        """기존 포맷터와 같은 키 구성의 출력용 dict (표시 문자열 포함, original_data 제외)"""
+        if self.platform == ALIEXPRESS:
+            return {
+                "platform": self.platform,
+                "product_id": self.product_id,
+                "title": self.title,
+                "price": self.price_display,
+                "original_price": self.original_price_display,
+                "discount_rate": self.discount_display,
+                "currency": "USD/KRW",
+                "image_url": self.image_url,
+                "video_url": self.video_url,
+                "product_url": self.product_url,
+                "affiliate_url": self.affiliate_url,
+                "vendor": self.vendor,
+                "shop_id": self.shop_id,
+                "shop_url": self.shop_url,
+                "category": self.category,
+                "subcategory": self.subcategory,
+                "rating": self.rating_display,
+                "review_count": self.volume_display,
+                "commission": self.commission_display,
+                "commission_rate": self.commission_rate or "수수료율 정보 없음",
+                "is_plus": self.is_plus,
+                "product_type": self.product_type,
+            }
+
+        # 쿠팡: 가격은 기존과 같이 원 단위 숫자 그대로
+        result = {
+            "platform": self.platform,
+            "product_id": self.product_id,
+            "title": self.title,
+            "price": self.price_minor if self.price_minor is not None else "가격 정보 없음",
+            "currency": "KRW",
+            "image_url": self.image_url if self.image_url or self.product_id != "landing_page" else "이미지 정보 없음",
+            "product_url": self.product_url,
+            "affiliate_url": self.affiliate_url,
+            "vendor": self.vendor,
+            "rating": self.rating if self.rating is not None else "평점 정보 없음",
+            "review_count": self.volume if self.volume is not None else "리뷰 정보 없음",
+        }
+        for key, value in (
+            ("original_price", self.original_price_minor),
+            ("discount_rate", self.discount_rate),
+            ("brand_name", self.brand_name),
+            ("category_name", self.category or None),
+            ("is_rocket", self.is_rocket),
+            ("is_free_shipping", self.is_free_shipping),
+            ("commission_rate", self.commission_rate),
+        ):
+            if value is not None:
+                result[key] = value
+        return result
+
+    def to_compact(self):
+        """캐시 저장용 압축 dict (기본값과 다른 필드만)"""
+        compact = {COMPACT_MARKER: 1}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value != self.DEFAULTS[name]:
+                compact[name] = value
+        return compact
+
+    @classmethod
+    def from_compact(cls, compact):
+        return cls(**{key: value for key, value in compact.items() if key != COMPACT_MARKER})
+
+
+def is_compact_record(item):
+    return isinstance(item, dict) and item.get(COMPACT_MARKER) == 1
+
+
+def records_to_cache(records):
+    """레코드 목록 → 캐시 저장 형식"""
+    return [record.to_compact() for record in records]
+
+
+def records_from_cache(items):
+    """캐시 데이터 → 출력용 dict 목록 (기존 dict 형식 캐시 엔트리는 그대로 사용)"""
+    return [ProductRecord.from_compact(item).to_dict() if is_compact_record(item) else item for item in items]
@@ -39,6 +39,7 @@ function get_queue_summary($queues) {
     $summary = [
         'total' => count($queues),
         'pending' => 0,
+        'processing' => 0,
         'completed' => 0
     ];
     
@@ -48,6 +49,9 @@ function get_queue_summary($queues) {
                 case 'pending':
                     $summary['pending']++;
                     break;
+                case 'processing':
+                    $summary['processing']++;
+                    break;
                 case 'completed':
                     $summary['completed']++;
                     break;
@@ -94,6 +98,8 @@ if (isset($_POST['action'])) {
                 // 해당 상태의 큐 목록 가져오기
                 if ($status === 'pending') {
                     $queues = get_pending_queues_split();
+                } elseif ($status === 'processing') {
+                    $queues = get_processing_queues_split();
                 } elseif ($status === 'completed') {
                     $queues = get_completed_queues_split();
                 } else {
@@ -268,14 +274,7 @@ if (isset($_POST['action'])) {
                 exit;
                 
             case 'get_stats':
-                $pending_queues = get_pending_queues_split();
-                $completed_queues = get_completed_queues_split();
-                
-                $stats = [
-                    'total' => count($pending_queues) + count($completed_queues),
-                    'pending' => count($pending_queues), 
-                    'completed' => count($completed_queues)
-                ];
+                $stats = get_queue_stats_split();
                 
                 echo json_encode(['success' => true, 'stats' => $stats]);
                 exit;
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+분할 큐 저장소 (queue_utils.php의 Python 구현)
+queues/pending, queues/completed 분할 파일과 queue_index.json을 직접 읽고 쓰기
+
+- 파일 경로, 상태 규칙, 인덱스 항목 형식은 queue_utils.php와 동일
+- queue_index.json 읽기-수정-쓰기는 queue_index.json.lock에 flock(LOCK_EX)을 잡고 수행
+  (queue_utils.php도 같은 잠금 파일 사용)
+- 큐 파일은 임시 파일 작성 후 rename으로 교체 (읽는 쪽에서 절반만 쓰인 파일을 보지 않음)
+- 작업 임대(lease): pending → processing rename으로 원자적 선점, 임대 만료 시각은
+  processing/queue_<id>.lease에 기록하고 하트비트로 연장, 만료된 임대는 pending으로 회수
+
+파일 위치: /var/www/novacents/tools/queue_store.py
+"""
+
+import os
+import json
+import time
+import fcntl
+import socket
+from contextlib import contextmanager
+from datetime import datetime
+
+QUEUE_BASE_DIR = '/var/www/novacents/tools/queues'
+QUEUE_PENDING_DIR = os.path.join(QUEUE_BASE_DIR, 'pending')
+QUEUE_COMPLETED_DIR = os.path.join(QUEUE_BASE_DIR, 'completed')
+QUEUE_PROCESSING_DIR = os.path.join(QUEUE_BASE_DIR, 'processing')
+QUEUE_INDEX_FILE = '/var/www/novacents/tools/queue_index.json'
+QUEUE_INDEX_LOCK_FILE = QUEUE_INDEX_FILE + '.lock'
+
+# 디렉토리가 있는 상태만 허용 (processing은 claim_queue로만 진입)
+VALID_STATUSES = ('pending', 'processing', 'completed')
+
+STATUS_DIRS = {
+    'pending': QUEUE_PENDING_DIR,
+    'processing': QUEUE_PROCESSING_DIR,
+    'completed': QUEUE_COMPLETED_DIR,
+}
+
+# 기본 임대 시간 (초) - 워커는 이 시간 안에 하트비트로 연장해야 함
+DEFAULT_LEASE_SECONDS = 600
+
+
+def _now():
+    """PHP date('Y-m-d H:i:s') 형식 현재 시각"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _clean_queue_id(queue_id):
+    """'queue_' 접두사 중복 방지 (queue_utils.php와 동일)"""
+    return queue_id[6:] if queue_id.startswith('queue_') else queue_id
+
+
+def queue_file_path(queue_id, status):
+    """상태별 큐 파일 경로"""
+    return os.path.join(STATUS_DIRS[status], f"queue_{_clean_queue_id(queue_id)}.json")
+
+
+def lease_file_path(queue_id):
+    """처리 중 큐의 임대 정보 파일 경로"""
+    return os.path.join(QUEUE_PROCESSING_DIR, f"queue_{_clean_queue_id(queue_id)}.lease")
+
+
+def default_worker_id():
+    """호스트명:PID 형식 워커 ID"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _read_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def _write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 rename으로 교체"""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def index_lock():
+    """queue_index.json 배타 잠금 (queue_utils.php와 같은 잠금 파일)"""
+    with open(QUEUE_INDEX_LOCK_FILE, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def initialize_queue_directories():
+    """큐 디렉토리와 인덱스 파일 생성"""
+    for directory in (QUEUE_BASE_DIR, QUEUE_PENDING_DIR, QUEUE_PROCESSING_DIR, QUEUE_COMPLETED_DIR):
+        os.makedirs(directory, 0o755, exist_ok=True)
+
+    if not os.path.exists(QUEUE_INDEX_FILE):
+        with index_lock():
+            if not os.path.exists(QUEUE_INDEX_FILE):
+                _write_json_atomic(QUEUE_INDEX_FILE, {'queues': []})
+    return True
+
+
+def load_queue_split(queue_id):
+    """
+    큐 항목 로드 (pending → processing → completed 순서로 확인)
+    :return: 큐 데이터 (status 포함) 또는 None
+    """
+    for status in VALID_STATUSES:
+        path = queue_file_path(queue_id, status)
+        if os.path.exists(path):
+            data = _read_json(path)
+            if data:
+                data['status'] = status
+                return data
+    return None
+
+
+def _index_entry(queue_id, data):
+    return {
+        'queue_id': queue_id,
+        'title': data.get('title', ''),
+        'status': data.get('status', 'pending'),
+        'category_id': data.get('category_id', ''),
+        'created_at': data.get('created_at', _now()),
+        'modified_at': data.get('modified_at', _now()),
+        'keywords': data.get('keywords', []),
+    }
+
+
+def update_queue_index(queue_id, data):
+    """인덱스 항목 추가 또는 갱신"""
+    with index_lock():
+        index = _read_json(QUEUE_INDEX_FILE) or {'queues': []}
+        queues = index.setdefault('queues', [])
+        entry = _index_entry(queue_id, data)
+
+        for i, queue in enumerate(queues):
+            if queue.get('queue_id') == queue_id:
+                queues[i] = entry
+                break
+        else:
+            queues.append(entry)
+
+        _write_json_atomic(QUEUE_INDEX_FILE, index)
+
+
+def remove_from_queue_index(queue_id):
+    """인덱스 항목 삭제"""
+    if not os.path.exists(QUEUE_INDEX_FILE):
+        return
+
+    with index_lock():
+        index = _read_json(QUEUE_INDEX_FILE)
+        if index and 'queues' in index:
+            index['queues'] = [queue for queue in index['queues'] if queue.get('queue_id') != queue_id]
+            _write_json_atomic(QUEUE_INDEX_FILE, index)
+
+
+def update_queue_status_split(queue_id, new_status):
+    """
+    큐 상태 변경 (pending / processing / completed 디렉토리 이동, processing에서 나가면 임대 삭제)
+    :return: 성공 여부 (허용되지 않는 상태면 False)
+    """
+    if new_status not in VALID_STATUSES:
+        return False
+
+    current_data = load_queue_split(queue_id)
+    if not current_data:
+        return False
+
+    current_status = current_data['status']
+    if current_status == new_status:
+        return True
+
+    old_file = queue_file_path(queue_id, current_status)
+    new_file = queue_file_path(queue_id, new_status)
+
+    current_data['status'] = new_status
+    current_data['modified_at'] = _now()
+
+    os.makedirs(os.path.dirname(new_file), 0o755, exist_ok=True)
+    _write_json_atomic(new_file, current_data)
+
+    if os.path.exists(old_file) and old_file != new_file:
+        os.remove(old_file)
+
+    if current_status == 'processing':
+        _remove_lease(queue_id)
+
+    update_queue_index(queue_id, current_data)
+    return True
+
+
+def _remove_lease(queue_id):
+    try:
+        os.remove(lease_file_path(queue_id))
+    except FileNotFoundError:
+        pass
+
+
+def _write_lease(queue_id, worker_id, lease_seconds):
+    now = int(time.time())
+    lease = {
+        'queue_id': queue_id,
+        'worker_id': worker_id,
+        'renewed_at': now,
+        'expires_at': now + int(lease_seconds),
+    }
+    _write_json_atomic(lease_file_path(queue_id), lease)
+    return lease
+
+
+def claim_queue(queue_id, worker_id=None, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    pending 큐 항목을 processing으로 원자적 이동 후 임대 기록
+    - 같은 파일을 여러 워커가 동시에 rename해도 한 워커만 성공
+    :return: 큐 데이터 (선점 실패 시 None)
+    """
+    worker_id = worker_id or default_worker_id()
+    pending_file = queue_file_path(queue_id, 'pending')
+    processing_file = queue_file_path(queue_id, 'processing')
+
+    os.makedirs(QUEUE_PROCESSING_DIR, 0o755, exist_ok=True)
+    try:
+        os.rename(pending_file, processing_file)
+    except FileNotFoundError:
+        return None
+
+    lease = _write_lease(queue_id, worker_id, lease_seconds)
+
+    data = _read_json(processing_file)
+    if not data:
+        # 손상된 파일은 다시 pending으로 돌려 놓음
+        release_queue(queue_id, worker_id)
+        return None
+
+    data['status'] = 'processing'
+    data['lease'] = lease
+    update_queue_index(queue_id, data)
+    return data
+
+
+def renew_lease(queue_id, worker_id=None, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    임대 연장 (하트비트)
+    :return: 연장 성공 여부 (임대가 회수되었거나 다른 워커 소유면 False)
+    """
+    worker_id = worker_id or default_worker_id()
+    lease = _read_json(lease_file_path(queue_id))
+    if not lease or lease.get('worker_id') != worker_id:
+        return False
+    if not os.path.exists(queue_file_path(queue_id, 'processing')):
+        return False
+
+    _write_lease(queue_id, worker_id, lease_seconds)
+    return True
+
+
+def release_queue(queue_id, worker_id=None):
+    """
+    처리 중 큐 항목을 pending으로 되돌림 (처리 실패 시)
+    :return: 성공 여부
+    """
+    lease = _read_json(lease_file_path(queue_id))
+    if worker_id and lease and lease.get('worker_id') != worker_id:
+        return False
+
+    try:
+        os.rename(queue_file_path(queue_id, 'processing'), queue_file_path(queue_id, 'pending'))
+    except FileNotFoundError:
+        return False
+
+    _remove_lease(queue_id)
+    data = load_queue_split(queue_id)
+    if data:
+        update_queue_index(queue_id, data)
+    return True
+
+
+def reclaim_expired_leases(now=None):
+    """
+    만료된 임대(중단된 워커)의 큐 항목을 pending으로 회수
+    - 임대 파일이 없으면 processing 파일의 ctime(rename 시각) 기준으로 만료 판단
+    :return: 회수한 큐 ID 목록
+    """
+    if not os.path.isdir(QUEUE_PROCESSING_DIR):
+        return []
+
+    now = now or int(time.time())
+    reclaimed = []
+    for filename in os.listdir(QUEUE_PROCESSING_DIR):
+        if not (filename.startswith('queue_') and filename.endswith('.json')):
+            continue
+
+        queue_id = filename[:-len('.json')]
+        lease = _read_json(lease_file_path(queue_id))
+        if lease:
+            expires_at = lease.get('expires_at', 0)
+        else:
+            try:
+                expires_at = int(os.stat(os.path.join(QUEUE_PROCESSING_DIR, filename)).st_ctime) + DEFAULT_LEASE_SECONDS
+            except FileNotFoundError:
+                continue
+
+        if expires_at <= now and release_queue(queue_id):
+            reclaimed.append(queue_id)
+
+    return reclaimed
+
+
+def remove_queue_split(queue_id):
+    """큐 항목 삭제 (pending/processing/completed 모두)"""
+    removed = False
+    for status in VALID_STATUSES:
+        path = queue_file_path(queue_id, status)
+        if os.path.exists(path):
+            os.remove(path)
+            removed = True
+
+    _remove_lease(queue_id)
+    if removed:
+        remove_from_queue_index(queue_id)
+    return removed
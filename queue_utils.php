@@ -7,12 +7,57 @@
 // 디렉토리 경로 상수
 define('QUEUE_PENDING_DIR', '/var/www/novacents/tools/queues/pending/');
 define('QUEUE_COMPLETED_DIR', '/var/www/novacents/tools/queues/completed/');
+// 작업 임대 중인 큐 (queue_store.py claim_queue가 pending에서 이동, queue_<id>.lease 파일 동반)
+define('QUEUE_PROCESSING_DIR', '/var/www/novacents/tools/queues/processing/');
 define('QUEUE_INDEX_FILE', '/var/www/novacents/tools/queue_index.json');
+define('QUEUE_INDEX_LOCK_FILE', QUEUE_INDEX_FILE . '.lock');
+
+/**
+ * 상태별 큐 파일 경로 (queue_store.py queue_file_path와 동일)
+ */
+function get_queue_status_dirs() {
+    return [
+        'pending' => QUEUE_PENDING_DIR,
+        'processing' => QUEUE_PROCESSING_DIR,
+        'completed' => QUEUE_COMPLETED_DIR
+    ];
+}
+
+function get_queue_file_path_split($queue_id, $status) {
+    // queue_id가 이미 'queue_'로 시작하는지 확인하여 중복 방지
+    $clean_queue_id = (strpos($queue_id, 'queue_') === 0) ? substr($queue_id, 6) : $queue_id;
+    $dirs = get_queue_status_dirs();
+    return $dirs[$status] . 'queue_' . $clean_queue_id . '.json';
+}
+
+function get_queue_lease_file_path($queue_id) {
+    $clean_queue_id = (strpos($queue_id, 'queue_') === 0) ? substr($queue_id, 6) : $queue_id;
+    return QUEUE_PROCESSING_DIR . 'queue_' . $clean_queue_id . '.lease';
+}
+
+/**
+ * queue_index.json 읽기-수정-쓰기 배타 잠금 (queue_store.py와 같은 잠금 파일 사용)
+ */
+function with_queue_index_lock($callback) {
+    $lock = fopen(QUEUE_INDEX_LOCK_FILE, 'c');
+    if ($lock === false) {
+        return $callback();
+    }
+    
+    flock($lock, LOCK_EX);
+    try {
+        return $callback();
+    } finally {
+        flock($lock, LOCK_UN);
+        fclose($lock);
+    }
+}
 
 function initialize_queue_directories() {
     $directories = [
         '/var/www/novacents/tools/queues/',
         QUEUE_PENDING_DIR,
+        QUEUE_PROCESSING_DIR,
         QUEUE_COMPLETED_DIR
     ];
     
@@ -88,6 +133,14 @@ function get_pending_queues_split() {
     return get_queues_from_directory(QUEUE_PENDING_DIR, 'pending');
 }
 
+function get_processing_queues_split() {
+    if (!initialize_queue_directories()) {
+        return [];
+    }
+    
+    return get_queues_from_directory(QUEUE_PROCESSING_DIR, 'processing');
+}
+
 function get_completed_queues_split() {
     if (!initialize_queue_directories()) {
         return [];
@@ -127,29 +180,17 @@ function get_queues_from_directory($directory, $status) {
 }
 
 function load_queue_split($queue_id) {
-    // queue_id가 이미 'queue_'로 시작하는지 확인하여 중복 방지
-    $clean_queue_id = (strpos($queue_id, 'queue_') === 0) ? substr($queue_id, 6) : $queue_id;
-    $pending_file = QUEUE_PENDING_DIR . 'queue_' . $clean_queue_id . '.json';
-    $completed_file = QUEUE_COMPLETED_DIR . 'queue_' . $clean_queue_id . '.json';
-    
-    if (file_exists($pending_file)) {
-        $content = file_get_contents($pending_file);
-        if ($content !== false) {
-            $data = json_decode($content, true);
-            if ($data) {
-                $data['status'] = 'pending';
-                return $data;
-            }
-        }
-    }
-    
-    if (file_exists($completed_file)) {
-        $content = file_get_contents($completed_file);
-        if ($content !== false) {
-            $data = json_decode($content, true);
-            if ($data) {
-                $data['status'] = 'completed';
-                return $data;
+    // pending → processing → completed 순서로 확인 (queue_store.py와 동일)
+    foreach (array_keys(get_queue_status_dirs()) as $status) {
+        $file = get_queue_file_path_split($queue_id, $status);
+        if (file_exists($file)) {
+            $content = file_get_contents($file);
+            if ($content !== false) {
+                $data = json_decode($content, true);
+                if ($data) {
+                    $data['status'] = $status;
+                    return $data;
+                }
             }
         }
     }
@@ -160,10 +201,7 @@ function load_queue_split($queue_id) {
 function update_queue_status_split_v2($queue_id, $new_status) {
     error_log("update_queue_status_split_v2 호출: queue_id=$queue_id, new_status=$new_status");
     
-    // queue_id가 이미 'queue_'로 시작하는지 확인하여 중복 방지
-    $clean_queue_id = (strpos($queue_id, 'queue_') === 0) ? substr($queue_id, 6) : $queue_id;
-    
-    if (!in_array($new_status, ['pending', 'completed'])) {
+    if (!array_key_exists($new_status, get_queue_status_dirs())) {
         error_log("유효하지 않은 상태: $new_status");
         return false;
     }
@@ -182,8 +220,8 @@ function update_queue_status_split_v2($queue_id, $new_status) {
         return true; // 이미 같은 상태
     }
     
-    $old_file = ($current_status === 'pending') ? QUEUE_PENDING_DIR . 'queue_' . $clean_queue_id . '.json' : QUEUE_COMPLETED_DIR . 'queue_' . $clean_queue_id . '.json';
-    $new_file = ($new_status === 'pending') ? QUEUE_PENDING_DIR . 'queue_' . $clean_queue_id . '.json' : QUEUE_COMPLETED_DIR . 'queue_' . $clean_queue_id . '.json';
+    $old_file = get_queue_file_path_split($queue_id, $current_status);
+    $new_file = get_queue_file_path_split($queue_id, $new_status);
     
     error_log("이동: $old_file -> $new_file");
     
@@ -191,10 +229,13 @@ function update_queue_status_split_v2($queue_id, $new_status) {
     if (!file_exists($old_file)) {
         error_log("기존 파일이 없음: $old_file");
         // 파일이 없으면 다른 위치 확인
-        $alt_file = ($current_status === 'completed') ? QUEUE_PENDING_DIR . 'queue_' . $clean_queue_id . '.json' : QUEUE_COMPLETED_DIR . 'queue_' . $clean_queue_id . '.json';
-        if (file_exists($alt_file)) {
-            error_log("대체 위치에서 파일 발견: $alt_file");
-            $old_file = $alt_file;
+        foreach (array_keys(get_queue_status_dirs()) as $status) {
+            $alt_file = get_queue_file_path_split($queue_id, $status);
+            if ($status !== $new_status && file_exists($alt_file)) {
+                error_log("대체 위치에서 파일 발견: $alt_file");
+                $old_file = $alt_file;
+                break;
+            }
         }
     }
     
@@ -228,6 +269,14 @@ function update_queue_status_split_v2($queue_id, $new_status) {
             }
         }
         
+        // processing에서 나가면 임대 파일 삭제
+        if ($current_status === 'processing') {
+            $lease_file = get_queue_lease_file_path($queue_id);
+            if (file_exists($lease_file)) {
+                unlink($lease_file);
+            }
+        }
+        
         // 인덱스 업데이트
         update_queue_index($queue_id, $current_data);
         
@@ -241,19 +290,19 @@ function update_queue_status_split_v2($queue_id, $new_status) {
 }
 
 function remove_queue_split($queue_id) {
-    // queue_id가 이미 'queue_'로 시작하는지 확인하여 중복 방지
-    $clean_queue_id = (strpos($queue_id, 'queue_') === 0) ? substr($queue_id, 6) : $queue_id;
-    $pending_file = QUEUE_PENDING_DIR . 'queue_' . $clean_queue_id . '.json';
-    $completed_file = QUEUE_COMPLETED_DIR . 'queue_' . $clean_queue_id . '.json';
-    
     $removed = false;
     
-    if (file_exists($pending_file)) {
-        $removed = unlink($pending_file);
+    // pending / processing / completed 모두 삭제
+    foreach (array_keys(get_queue_status_dirs()) as $status) {
+        $file = get_queue_file_path_split($queue_id, $status);
+        if (file_exists($file)) {
+            $removed = unlink($file) || $removed;
+        }
     }
     
-    if (file_exists($completed_file)) {
-        $removed = unlink($completed_file) || $removed;
+    $lease_file = get_queue_lease_file_path($queue_id);
+    if (file_exists($lease_file)) {
+        unlink($lease_file);
     }
     
     if ($removed) {
@@ -264,6 +313,12 @@ function remove_queue_split($queue_id) {
 }
 
 function update_queue_index($queue_id, $data) {
+    return with_queue_index_lock(function() use ($queue_id, $data) {
+        update_queue_index_unlocked($queue_id, $data);
+    });
+}
+
+function update_queue_index_unlocked($queue_id, $data) {
     if (!file_exists(QUEUE_INDEX_FILE)) {
         $index = ['queues' => []];
     } else {
@@ -305,6 +360,12 @@ function update_queue_index($queue_id, $data) {
 }
 
 function remove_from_queue_index($queue_id) {
+    return with_queue_index_lock(function() use ($queue_id) {
+        remove_from_queue_index_unlocked($queue_id);
+    });
+}
+
+function remove_from_queue_index_unlocked($queue_id) {
     if (!file_exists(QUEUE_INDEX_FILE)) {
         return;
     }
@@ -353,11 +414,13 @@ function cleanup_completed_queues_split($days_old = 7) {
 
 function get_queue_stats_split() {
     $pending_count = count(get_pending_queues_split());
+    $processing_count = count(get_processing_queues_split());
     $completed_count = count(get_completed_queues_split());
     
     return [
-        'total' => $pending_count + $completed_count,
+        'total' => $pending_count + $processing_count + $completed_count,
         'pending' => $pending_count,
+        'processing' => $processing_count,
         'completed' => $completed_count
     ];
 }
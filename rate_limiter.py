@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+프로세스 간 공유 API 호출 제한기
+cron, PHP에서 호출하는 스크립트, 상품 모니터가 동시에 실행되어도
+쿠팡 파트너스 API 시간당 호출 제한을 넘지 않도록 SQLite 트랜잭션으로 직렬화
+
+- 슬라이딩 윈도우 로그 방식 (호출 시각을 epoch 초 정수로 기록)
+- 엔드포인트 그룹(버킷)별 개별 제한: search / deeplink / bestcategory 등
+- 사용 방식: 대기(acquire), 대기 시간 조회(wait_time), 즉시 실패(acquire(block=False) → RateLimitExceeded)
+
+파일 위치: /var/www/novacents/tools/rate_limiter.py
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+
+class RateLimitExceeded(Exception):
+    """호출 제한 초과 (wait_seconds 후 재시도 가능)"""
+
+    def __init__(self, bucket, wait_seconds):
+        self.bucket = bucket
+        self.wait_seconds = wait_seconds
+        super().__init__(f"API 호출 제한 초과 ({bucket}): {wait_seconds}초 후 재시도 가능")
+
+
+class SlidingWindowRateLimiter:
+    """
+    SQLite 기반 슬라이딩 윈도우 호출 제한기
+    - BEGIN IMMEDIATE로 확인과 기록을 하나의 쓰기 트랜잭션에서 처리 (프로세스 간 경쟁 없음)
+    - 버킷별 (최대 호출 수, 윈도우 초) 설정
+    """
+
+    def __init__(self, db_path, quotas):
+        """
+        :param db_path: SQLite 파일 경로
+        :param quotas: {버킷 이름: (최대 호출 수, 윈도우 초)}
+        """
+        self.db_path = db_path
+        self.quotas = dict(quotas)
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS api_calls ("
+            " bucket TEXT NOT NULL,"
+            " called_at INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_api_calls_bucket ON api_calls(bucket, called_at)")
+
+    def _quota(self, bucket):
+        if bucket not in self.quotas:
+            raise KeyError(f"등록되지 않은 호출 제한 버킷: {bucket}")
+        return self.quotas[bucket]
+
+    def _window_state(self, bucket, now):
+        """(윈도우 내 호출 수, 가장 오래된 호출 시각) - 트랜잭션 안에서 호출"""
+        limit, window = self._quota(bucket)
+        self._conn.execute("DELETE FROM api_calls WHERE bucket = ? AND called_at <= ?", (bucket, now - window))
+        row = self._conn.execute(
+            "SELECT COUNT(*), MIN(called_at) FROM api_calls WHERE bucket = ? AND called_at > ?",
+            (bucket, now - window)
+        ).fetchone()
+        return row[0], row[1]
+
+    def _wait_seconds(self, bucket, count, oldest, now):
+        limit, window = self._quota(bucket)
+        if count < limit:
+            return 0
+        return max(1, oldest + window - now)
+
+    def try_acquire(self, bucket):
+        """
+        호출 슬롯 1개 예약 시도
+        :return: (예약 성공 여부, 성공 시 윈도우 내 호출 수 / 실패 시 대기 초)
+        """
+        now = int(time.time())
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                count, oldest = self._window_state(bucket, now)
+                wait = self._wait_seconds(bucket, count, oldest, now)
+                if wait == 0:
+                    self._conn.execute("INSERT INTO api_calls (bucket, called_at) VALUES (?, ?)", (bucket, now))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if wait:
+            return False, wait
+        return True, count + 1
+
+    def acquire(self, bucket, block=True, timeout=None):
+        """
+        호출 슬롯 1개 예약
+        :param block: False면 제한 초과 시 즉시 RateLimitExceeded
+        :param timeout: 최대 대기 초 (None이면 슬롯이 생길 때까지 대기)
+        :return: 예약 후 윈도우 내 호출 수
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            acquired, value = self.try_acquire(bucket)
+            if acquired:
+                return value
+            if not block or (deadline is not None and time.time() + value > deadline):
+                raise RateLimitExceeded(bucket, value)
+            time.sleep(value)
+
+    def wait_time(self, bucket):
+        """다음 호출까지 대기해야 하는 초 (바로 가능하면 0, 예약하지 않음)"""
+        now = int(time.time())
+        with self._lock:
+            count, oldest = self._window_state(bucket, now)
+        return self._wait_seconds(bucket, count, oldest, now)
+
+    def usage(self, bucket):
+        """윈도우 내 호출 수"""
+        now = int(time.time())
+        with self._lock:
+            count, _ = self._window_state(bucket, now)
+        return count
+
+    def remaining(self, bucket):
+        """윈도우 내 남은 호출 수"""
+        limit, _ = self._quota(bucket)
+        return max(0, limit - self.usage(bucket))
+
+    def stats(self):
+        """버킷별 사용량"""
+        return {
+            bucket: {"used": self.usage(bucket), "limit": limit, "window_seconds": window}
+            for bucket, (limit, window) in self.quotas.items()
+        }
+
+    def reset(self, bucket=None):
+        """호출 기록 삭제 (bucket 미지정 시 전체)"""
+        with self._lock:
+            if bucket is None:
+                self._conn.execute("DELETE FROM api_calls")
+            else:
+                self._conn.execute("DELETE FROM api_calls WHERE bucket = ?", (bucket,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
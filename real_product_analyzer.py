@@ -14,6 +14,7 @@ import time
 import urllib.parse
 import urllib.request
 import re
+from product_record import parse_minor_units, usd_cents_to_krw
 
 def load_env_simple():
     """Simple .env loader without dependencies"""
@@ -420,15 +421,10 @@ class AliexpressAPI:
     
     def format_single_product(self, item):
         """단일 상품 정보 포맷팅"""
-        # USD to KRW 환율 (대략적)
-        usd_to_krw = 1400
-        
-        try:
-            price_usd = float(item.get('target_sale_price', '0'))
-            price_krw = int(price_usd * usd_to_krw)
-        except:
-            price_usd = 0
-            price_krw = 0
+        # 가격은 센트 단위 정수로 파싱 후 원화 환산 (product_record와 같은 환율)
+        price_cents = parse_minor_units(item.get('target_sale_price', '0'), "USD") or 0
+        price_usd = price_cents / 100
+        price_krw = usd_cents_to_krw(price_cents)
         
         return {
             'platform': '알리익스프레스',
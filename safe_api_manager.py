@@ -14,35 +14,106 @@ import time
 import json
 import hmac
 import hashlib
+import threading
 import requests
-from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from datetime import datetime
 from dotenv import load_dotenv
+from cache_backends import SQLiteCacheBackend, BoundedMemoryCache
+from product_record import ProductRecord, records_to_cache, records_from_cache
+from rate_limiter import SlidingWindowRateLimiter
+from single_flight import SingleFlight
+
+
+COUPANG_API_DOMAIN = "https://api-gateway.coupang.com"
+ALIEXPRESS_API_URL = "https://api-sg.aliexpress.com/sync"
+
+
+class _PooledRequestsProxy:
+    """
+    IOP SDK 내부의 모듈 레벨 requests 호출을 공유 Session으로 우회시키는 프록시
+    get/post만 Session으로 보내고 나머지 속성(exceptions 등)은 requests 모듈 그대로 사용
+    """
+    
+    def __init__(self, session):
+        self._session = session
+    
+    def get(self, url, params=None, **kwargs):
+        return self._session.get(url, params=params, **kwargs)
+    
+    def post(self, url, data=None, json=None, **kwargs):
+        return self._session.post(url, data=data, json=json, **kwargs)
+    
+    def request(self, method, url, **kwargs):
+        return self._session.request(method, url, **kwargs)
+    
+    def __getattr__(self, name):
+        return getattr(requests, name)
 
 
 class SafeAPIManager:
     """
     쿠팡 파트너스 API 안전 관리자
-    - 1시간 슬라이딩 윈도우로 호출 제한 관리 (시간당 10회)
+    - 1시간 슬라이딩 윈도우로 호출 제한 관리 (엔드포인트 그룹별 시간당 10회, 프로세스 간 공유)
     - 다단계 캐싱 시스템 (메모리 → 파일 → API)
     - 429 에러 자동 처리 및 대기
     """
     
-    def __init__(self, mode="development"):
+    # 파일 캐시 단계 기본 TTL (초)
+    FILE_CACHE_TTL = 3600
+    
+    # 메모리 캐시 네임스페이스별 상한: (최대 엔트리 수, 최대 바이트, TTL 초)
+    MEMORY_CACHE_LIMITS = {
+        "coupang_search": (200, 8 * 1024 * 1024, 3600),
+        "coupang_best": (50, 4 * 1024 * 1024, 3600),
+        "coupang_category": (50, 4 * 1024 * 1024, 3600),
+        "aliexpress_search": (200, 8 * 1024 * 1024, 3600),
+        "aliexpress_advanced": (100, 8 * 1024 * 1024, 3600),
+        "original_data": (300, 16 * 1024 * 1024, 3600),
+    }
+    
+    # 쿠팡 API 엔드포인트 그룹별 시간당 호출 제한 (모드별 안전 마진은 별도 차감)
+    COUPANG_RATE_WINDOW = 3600
+    COUPANG_QUOTAS = {"search": 10, "deeplink": 10, "bestcategory": 10}
+    
+    # 쿠팡 deeplink API 요청당 최대 URL 수
+    COUPANG_DEEPLINK_MAX_URLS = 20
+    
+    # 알리익스프레스 link.generate / product.detail 요청당 최대 항목 수
+    ALIEXPRESS_BATCH_MAX = 50
+    
+    # HTTP 커넥션 풀 설정 (호스트별 Session 1개, keep-alive 유지)
+    HTTP_POOL_CONNECTIONS = 2
+    HTTP_POOL_MAXSIZE = 10
+    
+    # 프로세스 전역 전송 계층 (인스턴스가 여러 개여도 핸드셰이크 재사용)
+    _http_sessions = {}
+    _iop_client = None
+    _transport_lock = threading.Lock()
+    
+    # 프로세스 전역 요청 합치기 (같은 키의 동시 조회는 API 호출 1회)
+    _single_flight = None
+    
+    def __init__(self, mode="development", cache_backend=None, keep_original_data=False):
         """
         초기화
         :param mode: "development" 또는 "production"
+        :param cache_backend: 파일 캐시 단계 백엔드 (None이면 SQLite 기본 백엔드)
+        :param keep_original_data: API 원본 상품 응답을 get_original_data로 조회할 수 있게 보관할지 여부
         """
         self.mode = mode
+        self.keep_original_data = keep_original_data
         self.cache_dir = "/var/www/novacents/tools/cache"
-        self.coupang_cache_file = os.path.join(self.cache_dir, "coupang_cache.json")
-        self.api_usage_file = os.path.join(self.cache_dir, "api_usage.json")
+        self.coupang_cache_db = os.path.join(self.cache_dir, "coupang_cache.db")
+        self.rate_limit_db = os.path.join(self.cache_dir, "api_rate_limit.db")
         self.error_log_file = os.path.join(self.cache_dir, "error_log.json")
         
         # 조용한 모드 확인 (JSON 출력 시 로그 최소화)
         self.quiet_mode = os.environ.get('SAFE_API_QUIET') == '1'
         
-        # 메모리 캐시
-        self.memory_cache = {}
+        # 메모리 캐시 (네임스페이스별 LRU/TTL 상한)
+        self.memory_cache = BoundedMemoryCache(self.MEMORY_CACHE_LIMITS)
         
         # API 설정
         self.config = self._load_api_config()
@@ -53,6 +124,15 @@ class SafeAPIManager:
         # 캐시 디렉토리 생성
         self._ensure_cache_dir()
         
+        # 파일 캐시 백엔드 (키 단위 조회, 만료는 백그라운드 스윕)
+        self.cache_backend = cache_backend or SQLiteCacheBackend(self.coupang_cache_db)
+        
+        # 쿠팡 API 호출 제한기 (cron/PHP/모니터 프로세스가 같은 DB를 공유)
+        self.rate_limiter = SlidingWindowRateLimiter(self.rate_limit_db, {
+            endpoint: (self._get_usage_limit(endpoint), self.COUPANG_RATE_WINDOW)
+            for endpoint in self.COUPANG_QUOTAS
+        })
+        
         if not self.quiet_mode:
             print(f"[⚙️] SafeAPIManager 초기화 완료 (모드: {mode})")
     
@@ -117,107 +197,145 @@ class SafeAPIManager:
         """캐시 키 생성"""
         return f"{keyword.lower().strip()}_{limit}"
     
-    def _is_cache_valid(self, timestamp, hours=1):
-        """캐시 유효성 확인"""
-        try:
-            cache_time = datetime.fromisoformat(timestamp)
-            return datetime.now() - cache_time < timedelta(hours=hours)
-        except:
-            return False
+    def _memory_cache_namespace(self, cache_key):
+        """캐시 키 접두사로 메모리 캐시 네임스페이스 결정"""
+        if cache_key.startswith("aliexpress_adv_"):
+            return "aliexpress_advanced"
+        if cache_key.startswith("aliexpress_"):
+            return "aliexpress_search"
+        if cache_key.startswith("best_"):
+            return "coupang_best"
+        if cache_key.startswith("category_"):
+            return "coupang_category"
+        return "coupang_search"
+    
+    def _remember_original_data(self, platform, product_id, data):
+        """API 원본 상품 응답 보관 (keep_original_data일 때만, 상품 레코드와 별도)"""
+        if self.keep_original_data and product_id:
+            self.memory_cache.set("original_data", f"{platform}:{product_id}", data)
+    
+    def get_original_data(self, platform, product_id):
+        """
+        상품의 API 원본 응답 조회
+        :param platform: "쿠팡" 또는 "알리익스프레스"
+        :return: 원본 응답 dict 또는 None (보관하지 않았거나 만료)
+        """
+        return self.memory_cache.get("original_data", f"{platform}:{product_id}")
     
     def _get_memory_cache(self, cache_key):
-        """메모리 캐시에서 검색"""
-        if cache_key in self.memory_cache:
-            cache_data = self.memory_cache[cache_key]
-            if self._is_cache_valid(cache_data['timestamp']):
-                print(f"[💾] 메모리 캐시 히트: {cache_key}")
-                return cache_data['data']
-            else:
-                # 만료된 캐시 삭제
-                del self.memory_cache[cache_key]
-        return None
+        """메모리 캐시에서 검색 (히트/미스는 카운터로만 집계)"""
+        return self.memory_cache.get(self._memory_cache_namespace(cache_key), cache_key)
     
     def _set_memory_cache(self, cache_key, data):
-        """메모리 캐시에 저장"""
-        self.memory_cache[cache_key] = {
-            'data': data,
-            'timestamp': datetime.now().isoformat()
-        }
-        print(f"[💾] 메모리 캐시 저장: {cache_key}")
+        """메모리 캐시에 저장 (상한 초과 시 LRU 축출)"""
+        self.memory_cache.set(self._memory_cache_namespace(cache_key), cache_key, data)
     
     def _get_file_cache(self, cache_key):
-        """파일 캐시에서 검색"""
-        cache_data = self._load_json_file(self.coupang_cache_file, {})
-        
-        if cache_key in cache_data:
-            entry = cache_data[cache_key]
-            if self._is_cache_valid(entry['timestamp'], hours=1):
-                print(f"[📄] 파일 캐시 히트: {cache_key}")
-                # 메모리 캐시에도 복사
-                self._set_memory_cache(cache_key, entry['data'])
-                return entry['data']
-            else:
-                # 만료된 캐시 삭제
-                del cache_data[cache_key]
-                self._save_json_file(self.coupang_cache_file, cache_data)
-        
-        return None
-    
-    def _set_file_cache(self, cache_key, data):
-        """파일 캐시에 저장"""
-        cache_data = self._load_json_file(self.coupang_cache_file, {})
-        
-        cache_data[cache_key] = {
-            'data': data,
-            'timestamp': datetime.now().isoformat()
-        }
+        """파일 캐시(백엔드)에서 검색"""
+        try:
+            data = self.cache_backend.get(cache_key)
+        except Exception as e:
+            print(f"[⚠️] 파일 캐시 조회 실패 ({cache_key}): {e}")
+            return None
         
-        if self._save_json_file(self.coupang_cache_file, cache_data):
-            print(f"[📄] 파일 캐시 저장: {cache_key}")
-            # 메모리 캐시에도 저장
+        if data is not None:
+            print(f"[📄] 파일 캐시 히트: {cache_key}")
+            # 메모리 캐시에도 복사
             self._set_memory_cache(cache_key, data)
-    
-    def _get_api_usage_history(self):
-        """API 사용 기록 로드"""
-        return self._load_json_file(self.api_usage_file, [])
-    
-    def _add_api_usage_record(self):
-        """API 사용 기록 추가"""
-        usage_history = self._get_api_usage_history()
-        usage_history.append(datetime.now().isoformat())
         
-        # 1시간 이전 기록 정리
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-        usage_history = [
-            timestamp for timestamp in usage_history
-            if datetime.fromisoformat(timestamp) > one_hour_ago
-        ]
+        return data
+    
+    def _set_file_cache(self, cache_key, data, ttl_seconds=None):
+        """파일 캐시(백엔드)에 저장"""
+        try:
+            self.cache_backend.set(cache_key, data, ttl_seconds or self.FILE_CACHE_TTL)
+        except Exception as e:
+            print(f"[❌] 파일 캐시 저장 실패 ({cache_key}): {e}")
+            return
         
-        self._save_json_file(self.api_usage_file, usage_history)
-        return len(usage_history)
+        print(f"[📄] 파일 캐시 저장: {cache_key}")
+        # 메모리 캐시에도 저장
+        self._set_memory_cache(cache_key, data)
     
-    def _get_current_usage_count(self):
+    def _get_current_usage_count(self, endpoint="search"):
         """현재 1시간 내 API 호출 횟수"""
-        usage_history = self._get_api_usage_history()
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-        
-        current_usage = [
-            timestamp for timestamp in usage_history
-            if datetime.fromisoformat(timestamp) > one_hour_ago
-        ]
-        
-        return len(current_usage)
+        return self.rate_limiter.usage(endpoint)
+    
+    def _get_usage_limit(self, endpoint="search"):
+        """1시간 API 호출 제한 (안전 마진 적용)"""
+        margin = 2 if self.mode == "development" else 1
+        return self.COUPANG_QUOTAS[endpoint] - margin
+    
+    def _coalesce(self, key, fn, share=None):
+        """
+        같은 키의 동시 조회를 API 호출 1회로 합침 (프로세스 내부 + 잠금 파일로 프로세스 간)
+        :param key: 정규화된 요청 키
+        :param fn: 실제 조회 함수
+        :param share: 결과를 다른 프로세스와 공유할지 판단하는 함수 (성공한 결과만 공유)
+        """
+        with SafeAPIManager._transport_lock:
+            if SafeAPIManager._single_flight is None:
+                SafeAPIManager._single_flight = SingleFlight(
+                    os.path.join(self.cache_dir, "single_flight"), result_store=self.cache_backend
+                )
+            single_flight = SafeAPIManager._single_flight
+        return single_flight.do(key, fn, share)
     
-    def _can_make_api_call(self):
-        """API 호출 가능 여부 확인"""
-        current_usage = self._get_current_usage_count()
-        limit = 8 if self.mode == "development" else 9  # 안전 마진
+    @staticmethod
+    def _normalized_url_key(urls):
+        """URL 목록 → 순서/중복과 무관한 요청 키"""
+        return "|".join(sorted({(url or "").strip() for url in urls if (url or "").strip()}))
+    
+    def is_search_cached(self, keyword, limit=5):
+        """
+        쿠팡 검색 결과가 메모리/파일 캐시에 있는지 (API 호출 없이 응답 가능 여부, 로그 출력 없음)
+        """
+        cache_key = self._get_cache_key(keyword, limit)
+        if self._get_memory_cache(cache_key) is not None:
+            return True
+        try:
+            return self.cache_backend.get(cache_key) is not None
+        except Exception:
+            return False
+    
+    def get_remaining_api_calls(self, endpoint="search"):
+        """현재 1시간 창에서 추가로 호출 가능한 API 횟수"""
+        return self.rate_limiter.remaining(endpoint)
+    
+    def get_api_wait_time(self, endpoint="search"):
+        """다음 API 호출까지 대기해야 하는 초 (바로 가능하면 0)"""
+        return self.rate_limiter.wait_time(endpoint)
+    
+    def wait_for_api_call(self, endpoint="search", timeout=None):
+        """
+        호출 슬롯이 생길 때까지 대기 후 예약
+        :param timeout: 최대 대기 초 (초과 시 rate_limiter.RateLimitExceeded)
+        :return: 예약 후 1시간 내 호출 수
+        """
+        return self.rate_limiter.acquire(endpoint, block=True, timeout=timeout)
+    
+    def _can_make_api_call(self, endpoint="search"):
+        """API 호출 가능 여부 확인 (예약하지 않음)"""
+        current_usage = self._get_current_usage_count(endpoint)
+        limit = self._get_usage_limit(endpoint)  # 안전 마진
         
         can_call = current_usage < limit
-        print(f"[📊] 현재 사용량: {current_usage}/10 (제한: {limit}) - {'가능' if can_call else '불가능'}")
+        print(f"[📊] 현재 사용량 ({endpoint}): {current_usage}/{self.COUPANG_QUOTAS[endpoint]} (제한: {limit}) - {'가능' if can_call else '불가능'}")
         
         return can_call
     
+    def _reserve_api_call(self, endpoint="search"):
+        """
+        API 호출 슬롯 예약 (확인과 기록을 원자적으로 처리)
+        :return: 예약 성공 여부
+        """
+        acquired, value = self.rate_limiter.try_acquire(endpoint)
+        if acquired:
+            print(f"[📊] API 호출 예약 ({endpoint}): {value}/{self.COUPANG_QUOTAS[endpoint]}")
+        else:
+            print(f"[📊] API 호출 제한 ({endpoint}): {value}초 후 가능")
+        return acquired
+    
     def _log_error(self, error_type, details):
         """에러 로그 기록"""
         error_log = self._load_json_file(self.error_log_file, [])
@@ -263,6 +381,98 @@ class SafeAPIManager:
         """테스트 모드 확인 (대기 시간 건너뛰기용)"""
         return os.environ.get("SAFE_API_TEST_MODE") == "1"
     
+    def _get_http_session(self, url):
+        """
+        호스트별 공유 requests.Session 반환 (없으면 생성)
+        커넥션 풀 + keep-alive로 매 호출마다의 TCP/TLS 핸드셰이크 제거
+        """
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+        
+        session = SafeAPIManager._http_sessions.get(host_key)
+        if session is not None:
+            return session
+        
+        with SafeAPIManager._transport_lock:
+            session = SafeAPIManager._http_sessions.get(host_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=self.HTTP_POOL_MAXSIZE,
+                    max_retries=0
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Connection": "keep-alive"})
+                SafeAPIManager._http_sessions[host_key] = session
+                self._log(f"[🔌] HTTP 세션 생성: {host_key} (pool: {self.HTTP_POOL_MAXSIZE})")
+        
+        return session
+    
+    def _http_request(self, method, url, **kwargs):
+        """공유 세션을 통한 HTTP 요청"""
+        kwargs.setdefault('timeout', 30)
+        return self._get_http_session(url).request(method, url, **kwargs)
+    
+    def _get_iop_client(self):
+        """
+        프로세스 공유 IOP 클라이언트 반환 (없으면 생성)
+        SDK 내부 HTTP 호출도 공유 세션(커넥션 풀)을 사용하도록 연결
+        """
+        if SafeAPIManager._iop_client is not None:
+            return SafeAPIManager._iop_client
+        
+        with SafeAPIManager._transport_lock:
+            if SafeAPIManager._iop_client is None:
+                SafeAPIManager._iop_client = self.aliexpress_sdk.IopClient(
+                    ALIEXPRESS_API_URL,
+                    self.config["aliexpress_app_key"],
+                    self.config["aliexpress_app_secret"]
+                )
+                self._bind_sdk_transport()
+        
+        return SafeAPIManager._iop_client
+    
+    def _bind_sdk_transport(self):
+        """IOP SDK가 모듈 레벨 requests를 쓰는 경우 공유 세션 프록시로 교체"""
+        sdk_base = sys.modules.get(f"{self.aliexpress_sdk.__name__}.base")
+        if sdk_base is None or not hasattr(sdk_base, 'requests'):
+            self._log("[⚠️] IOP SDK 전송 계층을 찾지 못해 SDK 기본 HTTP 호출을 사용합니다")
+            return
+        
+        if not isinstance(sdk_base.requests, _PooledRequestsProxy):
+            sdk_base.requests = _PooledRequestsProxy(self._get_http_session(ALIEXPRESS_API_URL))
+    
+    def get_transport_stats(self):
+        """
+        호스트별 커넥션 재사용 통계
+        - connections_opened: 새로 연결한 횟수 (핸드셰이크 수)
+        - requests_sent: 전송한 요청 수
+        - connections_reused: 기존 연결로 처리한 요청 수
+        """
+        stats = {}
+        
+        for host_key, session in list(SafeAPIManager._http_sessions.items()):
+            opened = 0
+            sent = 0
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for pool_key in list(pools.keys()):
+                    pool = pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    opened += pool.num_connections
+                    sent += pool.num_requests
+            
+            stats[host_key] = {
+                "connections_opened": opened,
+                "requests_sent": sent,
+                "connections_reused": max(sent - opened, 0)
+            }
+        
+        return stats
+    
     def _generate_coupang_signature(self, method, url_path, secret_key, access_key):
         """
         쿠팡 파트너스 API HMAC 서명 생성
@@ -310,14 +520,14 @@ class SafeAPIManager:
         # 캐시 확인
         cached_result = self._get_memory_cache(cache_key)
         if cached_result:
-            return True, cached_result
+            return True, records_from_cache(cached_result)
         
         cached_result = self._get_file_cache(cache_key)
         if cached_result:
-            return True, cached_result
+            return True, records_from_cache(cached_result)
         
-        # API 호출 가능 여부 확인
-        if not self._can_make_api_call():
+        # API 호출 슬롯 예약
+        if not self._reserve_api_call("bestcategory"):
             print(f"[❌] API 호출 제한 초과")
             return False, []
         
@@ -338,18 +548,18 @@ class SafeAPIManager:
                 "Content-Type": "application/json"
             }
             
-            url = "https://api-gateway.coupang.com" + url_path
+            url = COUPANG_API_DOMAIN + url_path
             
-            self._add_api_usage_record()
             print(f"[📡] 베스트 상품 API 호출: {url}")
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._http_request('GET', url, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
                 if data.get('rCode') == '0':
-                    products = self._format_coupang_response(data)
-                    self._set_file_cache(cache_key, products)
+                    records = self._format_coupang_response(data.get('data') or [])
+                    self._set_file_cache(cache_key, records_to_cache(records))
+                    products = [record.to_dict() for record in records]
                     print(f"[✅] 베스트 상품 조회 성공: {len(products)}개")
                     return True, products
                 else:
@@ -384,14 +594,14 @@ class SafeAPIManager:
         # 캐시 확인
         cached_result = self._get_memory_cache(cache_key)
         if cached_result:
-            return True, cached_result
+            return True, records_from_cache(cached_result)
         
         cached_result = self._get_file_cache(cache_key)
         if cached_result:
-            return True, cached_result
+            return True, records_from_cache(cached_result)
         
-        # API 호출 가능 여부 확인
-        if not self._can_make_api_call():
+        # API 호출 슬롯 예약
+        if not self._reserve_api_call("bestcategory"):
             print(f"[❌] API 호출 제한 초과")
             return False, []
         
@@ -408,18 +618,18 @@ class SafeAPIManager:
                 "Content-Type": "application/json"
             }
             
-            url = "https://api-gateway.coupang.com" + url_path
+            url = COUPANG_API_DOMAIN + url_path
             
-            self._add_api_usage_record()
             print(f"[📡] 카테고리 상품 API 호출: {url}")
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._http_request('GET', url, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
                 if data.get('rCode') == '0':
-                    products = self._format_coupang_response(data)
-                    self._set_file_cache(cache_key, products)
+                    records = self._format_coupang_response(data.get('data') or [])
+                    self._set_file_cache(cache_key, records_to_cache(records))
+                    products = [record.to_dict() for record in records]
                     print(f"[✅] 카테고리 상품 조회 성공: {len(products)}개")
                     return True, products
                 else:
@@ -441,6 +651,18 @@ class SafeAPIManager:
             return False, []
 
     def search_coupang_safe(self, keyword, limit=5, force_api=False):
+        """
+        안전한 쿠팡 상품 검색 (같은 키워드의 동시 요청은 한 번만 조회)
+        :return: (success, products_list)
+        """
+        # 강제 조회는 일반 조회와 합치지 않음 (캐시/공유 결과를 받지 않도록 키 분리)
+        return self._coalesce(
+            f"coupang_search:{int(bool(force_api))}:{self._get_cache_key(keyword, limit)}",
+            lambda: self._search_coupang_safe(keyword, limit, force_api),
+            share=lambda result: result[0]
+        )
+    
+    def _search_coupang_safe(self, keyword, limit=5, force_api=False):
         """
         안전한 쿠팡 상품 검색 (향상된 검색 API 활용)
         :param keyword: 검색 키워드
@@ -456,15 +678,15 @@ class SafeAPIManager:
         if not force_api:
             cached_data = self._get_memory_cache(cache_key)
             if cached_data is not None:
-                return True, cached_data
+                return True, records_from_cache(cached_data)
             
             # 2단계: 파일 캐시 확인
             cached_data = self._get_file_cache(cache_key)
             if cached_data is not None:
-                return True, cached_data
+                return True, records_from_cache(cached_data)
         
-        # 3단계: API 호출 여부 확인
-        if not self._can_make_api_call():
+        # 3단계: API 호출 슬롯 예약
+        if not self._reserve_api_call("search"):
             print(f"[🚫] API 호출 제한 도달 - 캐시된 데이터만 사용 가능")
             return False, []
         
@@ -473,7 +695,7 @@ class SafeAPIManager:
         
         try:
             # API 엔드포인트 설정
-            domain = "https://api-gateway.coupang.com"
+            domain = COUPANG_API_DOMAIN
             url_path = "/v2/providers/affiliate_open_api/apis/openapi/products/search"
             
             # 쿼리 파라미터를 URL에 포함
@@ -496,7 +718,7 @@ class SafeAPIManager:
             }
             
             # API 호출
-            response = requests.get(full_url, headers=headers, timeout=30)
+            response = self._http_request('GET', full_url, headers=headers, timeout=30)
             
             # 429 에러 처리
             if response.status_code == 429:
@@ -506,19 +728,16 @@ class SafeAPIManager:
             
             response.raise_for_status()
             
-            # API 사용 기록 추가
-            current_usage = self._add_api_usage_record()
-            print(f"[📊] API 호출 기록됨: {current_usage}/10")
-            
             # 응답 처리
             data = response.json()
             
             if data.get("rCode") == "0" and data.get("data"):
                 # 성공적인 응답 처리
-                formatted_products = self._format_coupang_response(data["data"], keyword)
+                records = self._format_coupang_response(data["data"], keyword)
                 
-                # 캐시에 저장
-                self._set_file_cache(cache_key, formatted_products)
+                # 캐시에 저장 (숫자 필드만 있는 압축 레코드)
+                self._set_file_cache(cache_key, records_to_cache(records))
+                formatted_products = [record.to_dict() for record in records]
                 
                 print(f"[✅] 쿠팡 API 호출 성공: {len(formatted_products)}개 상품")
                 return True, formatted_products
@@ -535,94 +754,48 @@ class SafeAPIManager:
             self._log_error("general_error", {"error": str(e), "keyword": keyword})
             return False, []
     
-    def _format_coupang_response(self, data, keyword):
-        """쿠팡 API 응답 데이터 형식화"""
-        formatted_products = []
+    def _format_coupang_response(self, data, keyword=""):
+        """
+        쿠팡 API 응답 데이터 → 상품 레코드 목록
+        (출력용 dict는 record.to_dict(), 원본 응답은 get_original_data로 조회)
+        """
+        records = []
         
         if isinstance(data, dict):
             # landingUrl 형태의 응답인 경우 실제 상품 데이터 확인
             if 'productData' in data and data['productData']:
                 # 실제 상품 데이터가 있는 경우
                 for product in data['productData']:
-                    formatted_product = {
-                        "platform": "쿠팡",
-                        "product_id": product.get("productId"),
-                        "title": product.get("productName"),
-                        "price": product.get("salesPrice") or product.get("productPrice"),
-                        "original_price": product.get("originalPrice"),
-                        "discount_rate": product.get("discountRate"),
-                        "currency": "KRW",
-                        "image_url": product.get("productImage"),
-                        "product_url": product.get("productUrl"),
-                        "affiliate_url": product.get("productUrl"),
-                        "vendor": "쿠팡",
-                        "brand_name": product.get("brandName"),
-                        "category_name": product.get("categoryName"),
-                        "is_rocket": product.get("isRocket"),
-                        "is_free_shipping": product.get("isFreeShipping"),
-                        "rating": product.get("rating", "평점 정보 없음"),
-                        "review_count": product.get("reviewCount", "리뷰 정보 없음"),
-                        "original_data": product
-                    }
-                    formatted_products.append(formatted_product)
+                    record = ProductRecord.from_coupang(product)
+                    self._remember_original_data(record.platform, record.product_id, product)
+                    records.append(record)
             else:
                 # landingUrl만 있는 경우
-                formatted_product = {
-                    "platform": "쿠팡",
-                    "product_id": "landing_page",
-                    "title": f"{keyword} 관련 상품 모음",
-                    "price": "가격 정보 없음",
-                    "currency": "KRW",
-                    "image_url": "이미지 정보 없음",
-                    "product_url": data.get("landingUrl", ""),
-                    "affiliate_url": data.get("landingUrl", ""),
-                    "vendor": "쿠팡",
-                    "commission_rate": "알 수 없음",
-                    "rating": "평점 정보 없음",
-                    "review_count": "리뷰 정보 없음",
-                    "original_data": data
-                }
-                formatted_products.append(formatted_product)
+                records.append(ProductRecord.coupang_landing(keyword, data.get("landingUrl", "")))
             
         elif isinstance(data, list):
             # 일반적인 상품 리스트 형태
             for product in data:
-                formatted_product = {
-                    "platform": "쿠팡",
-                    "product_id": product.get("productId"),
-                    "title": product.get("productName"),
-                    "price": product.get("productPrice"),
-                    "currency": "KRW",
-                    "image_url": product.get("productImage"),
-                    "product_url": product.get("productUrl"),
-                    "affiliate_url": product.get("productUrl"),
-                    "vendor": product.get("vendorItemName"),
-                    "commission_rate": "알 수 없음",
-                    "rating": "평점 정보 없음",
-                    "review_count": "리뷰 정보 없음",
-                    "original_data": product
-                }
-                formatted_products.append(formatted_product)
+                record = ProductRecord.from_coupang(product, vendor_field="vendorItemName")
+                self._remember_original_data(record.platform, record.product_id, product)
+                records.append(record)
         
-        return formatted_products
+        return records
     
     def get_cache_stats(self):
         """캐시 통계 정보"""
-        cache_data = self._load_json_file(self.coupang_cache_file, {})
-        usage_history = self._get_api_usage_history()
+        backend_stats = self.cache_backend.stats()
         error_log = self._load_json_file(self.error_log_file, [])
         
-        # 유효한 캐시 엔트리 수
-        valid_cache_count = sum(
-            1 for entry in cache_data.values()
-            if self._is_cache_valid(entry['timestamp'])
-        )
-        
         stats = {
             "memory_cache_count": len(self.memory_cache),
-            "file_cache_total": len(cache_data),
-            "file_cache_valid": valid_cache_count,
-            "api_calls_last_hour": len(usage_history),
+            "memory_cache": self.memory_cache.stats(),
+            "file_cache_total": backend_stats.get("total", 0),
+            "file_cache_valid": backend_stats.get("valid", 0),
+            "file_cache_backend": backend_stats.get("backend", "unknown"),
+            "api_calls_last_hour": self._get_current_usage_count("search"),
+            "api_usage": self.rate_limiter.stats(),
+            "single_flight": dict(SafeAPIManager._single_flight.stats) if SafeAPIManager._single_flight else {},
             "total_errors": len(error_log),
             "mode": self.mode
         }
@@ -636,14 +809,12 @@ class SafeAPIManager:
             print("[🧹] 메모리 캐시 정리 완료")
         
         if cache_type in ["all", "file"]:
-            if os.path.exists(self.coupang_cache_file):
-                os.remove(self.coupang_cache_file)
-                print("[🧹] 파일 캐시 정리 완료")
+            self.cache_backend.clear()
+            print("[🧹] 파일 캐시 정리 완료")
         
         if cache_type in ["all", "usage"]:
-            if os.path.exists(self.api_usage_file):
-                os.remove(self.api_usage_file)
-                print("[🧹] API 사용 기록 정리 완료")
+            self.rate_limiter.reset()
+            print("[🧹] API 사용 기록 정리 완료")
     
     def extract_coupang_product_id(self, url):
         """
@@ -669,101 +840,151 @@ class SafeAPIManager:
     def convert_coupang_to_affiliate_link(self, product_url):
         """
         쿠팡 일반 상품 링크를 어필리에이트 링크로 변환
-        테스트에서 검증된 deeplink API 사용
+        테스트에서 검증된 deeplink API 사용 (일괄 변환 API의 단건 래퍼)
         :param product_url: 쿠팡 일반 상품 URL
         :return: (success, affiliate_link, product_info)
         """
-        print(f"\n[🔗] 쿠팡 링크 변환 (deeplink API): {product_url}")
-        
-        # 링크 변환도 API 제한에 포함되므로 확인
-        if not self._can_make_api_call():
-            print(f"[🚫] API 호출 제한 도달 - 링크 변환 불가")
+        result = self.convert_coupang_to_affiliate_links([product_url]).get(product_url.strip())
+        if not result:
             return False, None, None
+        return result["success"], result["affiliate_link"], result["product_info"]
+    
+    def convert_coupang_to_affiliate_links(self, product_urls, fetch_product_info=True):
+        """
+        쿠팡 상품 링크 일괄 변환 (같은 URL 목록의 동시 요청은 한 번만 변환)
+        :return: {product_url: {"success", "affiliate_link", "product_info", "error"}}
+        """
+        return self._coalesce(
+            f"coupang_deeplink:{int(bool(fetch_product_info))}:{self._normalized_url_key(product_urls)}",
+            lambda: self._convert_coupang_to_affiliate_links(product_urls, fetch_product_info),
+            share=lambda results: any(result["success"] for result in results.values())
+        )
+    
+    def _convert_coupang_to_affiliate_links(self, product_urls, fetch_product_info=True):
+        """
+        쿠팡 상품 링크 여러 개를 deeplink API로 일괄 변환
+        - 요청당 최대 COUPANG_DEEPLINK_MAX_URLS개 URL을 하나의 서명된 POST로 전송
+        - 응답의 originalUrl 기준으로 결과를 원래 URL에 매핑
+        - API 사용 기록은 URL 개수가 아닌 요청 1회당 1건
+        :param product_urls: 쿠팡 일반 상품 URL 목록
+        :param fetch_product_info: 변환 후 상품 정보(검색 API)도 조회할지 여부
+        :return: {product_url: {"success", "affiliate_link", "product_info", "error"}}
+        """
+        urls = []
+        for url in product_urls:
+            url = (url or "").strip()
+            if url and url not in urls:
+                urls.append(url)
+        
+        results = {
+            url: {"success": False, "affiliate_link": None, "product_info": None, "error": None}
+            for url in urls
+        }
+        if not urls:
+            return results
         
-        try:
-            # 작동하는 deeplink API 엔드포인트 사용
-            domain = "https://api-gateway.coupang.com"
-            url_path = "/v2/providers/affiliate_open_api/apis/openapi/deeplink"
-            
-            # 요청 데이터 준비
-            request_data = {
-                "coupangUrls": [product_url],
-                "subId": "novacents_workflow"
-            }
-            
-            # HMAC 서명 생성 (POST 메서드)
-            authorization = self._generate_coupang_signature(
-                "POST", 
-                url_path,
-                self.config["coupang_secret_key"], 
-                self.config["coupang_access_key"]
-            )
-            
-            # 헤더 설정
-            headers = {
-                "Authorization": authorization,
-                "Content-Type": "application/json"
-            }
-            
-            # API 호출
-            full_url = domain + url_path
-            response = requests.post(full_url, json=request_data, headers=headers, timeout=30)
-            
-            # 429 에러 처리
-            if response.status_code == 429:
-                print(f"[⚠️] 링크 변환 429 에러 발생")
-                self._handle_429_error()
-                return False, None, None
-            
-            response.raise_for_status()
-            
-            # API 사용 기록 추가
-            current_usage = self._add_api_usage_record()
-            print(f"[📊] 링크 변환 API 호출 기록됨: {current_usage}/10")
+        print(f"\n[🔗] 쿠팡 링크 일괄 변환 (deeplink API): {len(urls)}개")
+        
+        url_path = "/v2/providers/affiliate_open_api/apis/openapi/deeplink"
+        full_url = COUPANG_API_DOMAIN + url_path
+        chunk_size = self.COUPANG_DEEPLINK_MAX_URLS
+        
+        for start in range(0, len(urls), chunk_size):
+            chunk = urls[start:start + chunk_size]
             
-            # 응답 처리 (deeplink API 응답 구조)
-            data = response.json()
+            # 링크 변환도 API 제한에 포함되므로 요청 단위로 확인
+            if not self._reserve_api_call("deeplink"):
+                print(f"[🚫] API 호출 제한 도달 - 남은 {len(urls) - start}개 링크 변환 불가")
+                for url in urls[start:]:
+                    results[url]["error"] = "API 호출 제한 도달"
+                break
             
-            if data.get("rCode") == "0" and data.get("data"):
-                # deeplink API 성공 응답 처리
-                link_data = data["data"][0] if isinstance(data["data"], list) else data["data"]
+            try:
+                request_data = {
+                    "coupangUrls": chunk,
+                    "subId": "novacents_workflow"
+                }
+                
+                # HMAC 서명 생성 (POST 메서드)
+                headers = {
+                    "Authorization": self._generate_coupang_signature(
+                        "POST",
+                        url_path,
+                        self.config["coupang_secret_key"],
+                        self.config["coupang_access_key"]
+                    ),
+                    "Content-Type": "application/json"
+                }
                 
-                affiliate_link = link_data.get("shortenUrl", "")
-                landing_url = link_data.get("landingUrl", "")
+                response = self._http_request('POST', full_url, json=request_data, headers=headers, timeout=30)
                 
-                if affiliate_link:
-                    print(f"[✅] 쿠팡 링크 변환 성공 (deeplink)")
-                    print(f"[🔗] 어필리에이트 링크: {affiliate_link}")
-                    print(f"[🔗] 랜딩 URL: {landing_url}")
-                    
-                    # 상품 정보도 함께 가져오기 (상품 ID 추출해서 검색)
-                    product_id = self.extract_coupang_product_id(product_url)
-                    product_info = None
-                    
-                    if product_id:
-                        # 상품 ID로 상세 정보 검색 시도
-                        success, products = self.search_coupang_safe(product_id, limit=1)
-                        if success and products:
-                            product_info = products[0]
-                            # 어필리에이트 링크로 업데이트
-                            product_info["affiliate_url"] = affiliate_link
+                # 429 에러 처리
+                if response.status_code == 429:
+                    print(f"[⚠️] 링크 변환 429 에러 발생")
+                    self._handle_429_error()
+                    for url in urls[start:]:
+                        results[url]["error"] = "429 호출 제한"
+                    break
+                
+                response.raise_for_status()
+                
+                print(f"[📊] 링크 변환 API 요청: {len(chunk)}개 URL")
+                
+                data = response.json()
+                
+                if data.get("rCode") != "0" or not data.get("data"):
+                    error_msg = data.get('rMessage', '알 수 없는 오류')
+                    print(f"[⚠️] 쿠팡 deeplink 오류: {error_msg}")
+                    for url in chunk:
+                        results[url]["error"] = error_msg
+                    continue
+                
+                link_items = data["data"] if isinstance(data["data"], list) else [data["data"]]
+                
+                for index, link_data in enumerate(link_items):
+                    original_url = link_data.get("originalUrl")
+                    if original_url not in results:
+                        # originalUrl이 없거나 정규화되어 돌아온 경우 요청 순서로 매핑
+                        if len(link_items) != len(chunk):
+                            continue
+                        original_url = chunk[index]
                     
-                    return True, affiliate_link, product_info
-                else:
-                    print(f"[⚠️] 쿠팡 deeplink 응답에 링크가 없음")
-                    return False, None, None
-            else:
-                print(f"[⚠️] 쿠팡 deeplink 오류: {data.get('rMessage', '알 수 없는 오류')}")
-                return False, None, None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"[❌] 쿠팡 링크 변환 API 호출 오류: {e}")
-            self._log_error("link_conversion_error", {"error": str(e), "url": product_url})
-            return False, None, None
-        except Exception as e:
-            print(f"[❌] 쿠팡 링크 변환 처리 중 오류: {e}")
-            self._log_error("link_conversion_general_error", {"error": str(e), "url": product_url})
-            return False, None, None
+                    affiliate_link = link_data.get("shortenUrl", "")
+                    if affiliate_link:
+                        results[original_url]["success"] = True
+                        results[original_url]["affiliate_link"] = affiliate_link
+                
+                for url in chunk:
+                    if not results[url]["success"]:
+                        results[url]["error"] = "deeplink 응답에 링크가 없음"
+                
+            except requests.exceptions.RequestException as e:
+                print(f"[❌] 쿠팡 링크 변환 API 호출 오류: {e}")
+                self._log_error("link_conversion_error", {"error": str(e), "urls": chunk})
+                for url in chunk:
+                    results[url]["error"] = str(e)
+            except Exception as e:
+                print(f"[❌] 쿠팡 링크 변환 처리 중 오류: {e}")
+                self._log_error("link_conversion_general_error", {"error": str(e), "urls": chunk})
+                for url in chunk:
+                    results[url]["error"] = str(e)
+        
+        converted = [url for url in urls if results[url]["success"]]
+        print(f"[✅] 쿠팡 링크 변환 결과: 성공 {len(converted)}개 / 실패 {len(urls) - len(converted)}개")
+        
+        if fetch_product_info:
+            for url in converted:
+                # 상품 ID로 상세 정보 검색 시도 (캐시 우선)
+                product_id = self.extract_coupang_product_id(url)
+                if product_id:
+                    success, products = self.search_coupang_safe(product_id, limit=1)
+                    if success and products:
+                        product_info = products[0]
+                        # 어필리에이트 링크로 업데이트
+                        product_info["affiliate_url"] = results[url]["affiliate_link"]
+                        results[url]["product_info"] = product_info
+        
+        return results
     
     def _init_aliexpress_sdk(self):
         """알리익스프레스 SDK 초기화"""
@@ -835,92 +1056,166 @@ class SafeAPIManager:
     def convert_aliexpress_to_affiliate_link(self, product_url):
         """
         알리익스프레스 일반 상품 링크를 어필리에이트 링크로 변환
-        테스트에서 검증된 공식 IOP SDK + tracking_id="default" 사용
+        테스트에서 검증된 공식 IOP SDK + tracking_id="default" 사용 (일괄 변환 API의 단건 래퍼)
         :param product_url: 알리익스프레스 일반 상품 URL
         :return: (success, affiliate_link, product_info)
         """
-        print(f"\n[🔗] 알리익스프레스 링크 변환 (공식 SDK): {product_url}")
+        result = self.convert_aliexpress_to_affiliate_links([product_url]).get(product_url.strip())
+        if not result:
+            return False, None, None
+        return result["success"], result["affiliate_link"], result["product_info"]
+    
+    def convert_aliexpress_to_affiliate_links(self, product_urls, fetch_product_info=True):
+        """
+        알리익스프레스 상품 링크 일괄 변환 (같은 URL 목록의 동시 요청은 한 번만 변환)
+        :return: {product_url: {"success", "affiliate_link", "product_info", "error"}}
+        """
+        return self._coalesce(
+            f"aliexpress_link:{int(bool(fetch_product_info))}:{self._normalized_url_key(product_urls)}",
+            lambda: self._convert_aliexpress_to_affiliate_links(product_urls, fetch_product_info),
+            share=lambda results: any(result["success"] for result in results.values())
+        )
+    
+    def _convert_aliexpress_to_affiliate_links(self, product_urls, fetch_product_info=True):
+        """
+        알리익스프레스 상품 링크 여러 개를 일괄 변환
+        - ALIEXPRESS_BATCH_MAX개 단위로 나눠 청크마다 link.generate 1회 + product.detail 1회 호출
+        - URL별 결과와 실패 사유를 함께 반환 (일부 실패해도 나머지는 정상 반환)
+        :param product_urls: 알리익스프레스 일반 상품 URL 목록
+        :param fetch_product_info: 상품 상세 정보도 함께 조회할지 여부
+        :return: {product_url: {"success", "affiliate_link", "product_info", "error"}}
+        """
+        urls = []
+        for url in product_urls:
+            url = (url or "").strip()
+            if url and url not in urls:
+                urls.append(url)
+        
+        results = {
+            url: {"success": False, "affiliate_link": None, "product_info": None, "error": None}
+            for url in urls
+        }
+        if not urls:
+            return results
+        
+        print(f"\n[🔗] 알리익스프레스 링크 일괄 변환 (공식 SDK): {len(urls)}개")
         
         # API 키 및 SDK 확인
         if not self.config["aliexpress_app_key"] or not self.config["aliexpress_app_secret"]:
             print(f"[❌] 알리익스프레스 API 키가 설정되지 않았습니다")
-            return False, None, None
+            for result in results.values():
+                result["error"] = "알리익스프레스 API 키 없음"
+            return results
         
         if not self.aliexpress_sdk:
             print(f"[❌] 알리익스프레스 SDK가 로드되지 않았습니다")
-            return False, None, None
+            for result in results.values():
+                result["error"] = "알리익스프레스 SDK 없음"
+            return results
         
-        try:
-            # 공식 IOP SDK 클라이언트 생성
-            client = self.aliexpress_sdk.IopClient(
-                'https://api-sg.aliexpress.com/sync',
-                self.config["aliexpress_app_key"], 
-                self.config["aliexpress_app_secret"]
-            )
-            
-            # URL 정리 (쿼리 파라미터 제거)
-            clean_url = product_url.split('?')[0]
-            print(f"[🧹] 정리된 URL: {clean_url}")
-            
-            # 링크 변환 요청 생성
-            request = self.aliexpress_sdk.IopRequest('aliexpress.affiliate.link.generate', 'POST')
-            request.set_simplify()
-            request.add_api_param('source_values', clean_url)
-            request.add_api_param('promotion_link_type', '0')
-            request.add_api_param('tracking_id', 'default')  # 테스트에서 성공한 tracking_id
-            
-            print(f"[📋] 요청 파라미터:")
-            print(f"  source_values: {clean_url}")
-            print(f"  promotion_link_type: 0")
-            print(f"  tracking_id: default")
-            
-            # API 실행
-            print(f"[⏳] 공식 SDK로 API 호출 중...")
-            response = client.execute(request)
+        client = self._get_iop_client()
+        chunk_size = self.ALIEXPRESS_BATCH_MAX
+        
+        for start in range(0, len(urls), chunk_size):
+            chunk = urls[start:start + chunk_size]
             
-            print(f"[📨] 응답:")
-            print(f"  Type: {response.type}")
-            print(f"  Code: {response.code}")
-            print(f"  Message: {response.message}")
+            # URL 정리 (쿼리 파라미터 제거) - 정리된 URL → 원본 URL 목록
+            clean_to_urls = {}
+            for url in chunk:
+                clean_to_urls.setdefault(url.split('?')[0], []).append(url)
             
-            # 응답 처리
-            if response.body and 'resp_result' in response.body:
-                result = response.body['resp_result'].get('result', {})
-                promotion_links = result.get('promotion_links', [])
+            try:
+                # 링크 변환 요청 생성 (source_values 콤마 구분)
+                request = self.aliexpress_sdk.IopRequest('aliexpress.affiliate.link.generate', 'POST')
+                request.set_simplify()
+                request.add_api_param('source_values', ','.join(clean_to_urls.keys()))
+                request.add_api_param('promotion_link_type', '0')
+                request.add_api_param('tracking_id', 'default')  # 테스트에서 성공한 tracking_id
                 
-                if promotion_links:
-                    affiliate_link = promotion_links[0]['promotion_link']
-                    source_value = promotion_links[0]['source_value']
-                    
-                    print(f"[✅] 알리익스프레스 링크 변환 성공 (공식 SDK)")
-                    print(f"[📄] 원본: {source_value}")
-                    print(f"[🔗] 어필리에이트: {affiliate_link}")
-                    
-                    # 상품 정보도 함께 가져오기
-                    product_id = self.extract_aliexpress_product_id(product_url)
-                    product_info = None
-                    
-                    if product_id:
-                        # 상품 상세 정보 조회 시도 (공식 SDK 사용)
-                        product_info = self._get_aliexpress_product_details_sdk(product_id, client)
-                        if product_info:
-                            # 어필리에이트 링크로 업데이트
-                            product_info["affiliate_url"] = affiliate_link
-                    
-                    return True, affiliate_link, product_info
-                else:
-                    print(f"[⚠️] 알리익스프레스 링크 변환 응답에 링크가 없음")
-                    return False, None, None
-            else:
-                print(f"[⚠️] 알리익스프레스 API 응답 오류")
-                if response.body:
-                    print(f"  응답 본문: {response.body}")
-                return False, None, None
+                print(f"[⏳] 공식 SDK로 링크 변환 API 호출 중... ({len(clean_to_urls)}개)")
+                response = client.execute(request)
+                
+                if not response.body or 'resp_result' not in response.body:
+                    print(f"[⚠️] 알리익스프레스 API 응답 오류 (Code: {response.code}, Message: {response.message})")
+                    for url in chunk:
+                        results[url]["error"] = f"API 응답 오류: {response.message}"
+                    continue
+                
+                result = response.body['resp_result'].get('result', {}) or {}
+                for link in result.get('promotion_links', []):
+                    for url in clean_to_urls.get(link.get('source_value'), []):
+                        results[url]["success"] = True
+                        results[url]["affiliate_link"] = link.get('promotion_link')
+                
+                for url in chunk:
+                    if not results[url]["success"]:
+                        results[url]["error"] = "링크 변환 응답에 링크가 없음"
+                
+            except Exception as e:
+                print(f"[❌] 알리익스프레스 링크 변환 처리 중 오류: {e}")
+                self._log_error("aliexpress_link_conversion_general_error", {"error": str(e), "urls": chunk})
+                for url in chunk:
+                    results[url]["error"] = str(e)
+                continue
             
-        except Exception as e:
-            print(f"[❌] 알리익스프레스 링크 변환 처리 중 오류: {e}")
-            self._log_error("aliexpress_link_conversion_general_error", {"error": str(e), "url": product_url})
-            return False, None, None
+            if not fetch_product_info:
+                continue
+            
+            # 상품 상세 정보 조회 (청크당 product.detail 1회)
+            url_product_ids = {}
+            for url in chunk:
+                product_id = self.extract_aliexpress_product_id(url)
+                if results[url]["success"] and product_id:
+                    url_product_ids[url] = product_id
+            
+            if url_product_ids:
+                details = self._fetch_aliexpress_product_details(list(set(url_product_ids.values())), client)
+                for url, product_id in url_product_ids.items():
+                    product_info = details.get(product_id)
+                    if product_info:
+                        # URL마다 별도 사본 (어필리에이트 링크로 업데이트)
+                        product_info = dict(product_info)
+                        product_info["affiliate_url"] = results[url]["affiliate_link"]
+                        results[url]["product_info"] = product_info
+        
+        succeeded = [url for url in urls if results[url]["success"]]
+        print(f"[✅] 알리익스프레스 링크 변환 결과: 성공 {len(succeeded)}개 / 실패 {len(urls) - len(succeeded)}개")
+        for url in urls:
+            if not results[url]["success"]:
+                print(f"  [⚠️] 실패: {url} ({results[url]['error']})")
+        
+        return results
+    
+    def get_aliexpress_product_details_batch(self, product_ids):
+        """
+        알리익스프레스 상품 상세 정보 일괄 조회 (같은 상품 ID 목록의 동시 요청은 한 번만 조회)
+        :return: {product_id: 상품 정보 딕셔너리 또는 None}
+        """
+        key_ids = sorted({str(product_id) for product_id in product_ids if product_id})
+        return self._coalesce(
+            f"aliexpress_detail:{','.join(key_ids)}",
+            lambda: self._get_aliexpress_product_details_batch(product_ids),
+            share=lambda results: any(results.values())
+        )
+    
+    def _get_aliexpress_product_details_batch(self, product_ids):
+        """
+        알리익스프레스 상품 상세 정보 일괄 조회
+        :param product_ids: 상품 ID 목록
+        :return: {product_id: 상품 정보 딕셔너리 또는 None}
+        """
+        product_ids = [str(product_id) for product_id in product_ids if product_id]
+        results = {product_id: None for product_id in product_ids}
+        
+        if not product_ids:
+            return results
+        
+        if not self.aliexpress_sdk:
+            print(f"[⚠️] 알리익스프레스 SDK 없음 - 상품 정보 조회 불가")
+            return results
+        
+        results.update(self._fetch_aliexpress_product_details(list(results.keys()), self._get_iop_client()))
+        return results
     
     def _get_aliexpress_product_details_sdk(self, product_id, client):
         """
@@ -929,95 +1224,71 @@ class SafeAPIManager:
         :param client: IOP 클라이언트
         :return: 상품 정보 딕셔너리 또는 None
         """
-        try:
-            # 상품 상세 API 호출 (API 가이드의 모든 필드 활용)
-            detail_request = self.aliexpress_sdk.IopRequest('aliexpress.affiliate.product.detail', 'POST')
-            detail_request.set_simplify()
-            detail_request.add_api_param('product_ids', product_id)
-            # API 가이드에서 제공하는 모든 유용한 필드들
-            detail_request.add_api_param('fields', 'product_id,product_title,product_main_image_url,product_video_url,shop_url,shop_id,first_level_category_id,first_level_category_name,second_level_category_id,second_level_category_name,target_sale_price,target_sale_price_currency,target_original_price,target_original_price_currency,evaluate_rate,30days_commission,volume,platform_product_type,plus_product,relevant_market_commission_rate')
-            detail_request.add_api_param('tracking_id', 'default')
-            
-            print(f"[📋] 알리익스프레스 상품 상세 정보 조회: {product_id}")
-            detail_response = client.execute(detail_request)
+        product_id = str(product_id)
+        formatted_product = self._fetch_aliexpress_product_details([product_id], client).get(product_id)
+        
+        # 조회 성공 로그는 _format_aliexpress_product_detail에서 출력
+        if not formatted_product:
+            print(f"[⚠️] 알리익스프레스 상품 정보를 찾을 수 없습니다 (SDK)")
+        
+        return formatted_product
+    
+    def _fetch_aliexpress_product_details(self, product_ids, client):
+        """
+        product.detail API를 ALIEXPRESS_BATCH_MAX개 단위로 호출
+        :param product_ids: 상품 ID(문자열) 목록
+        :param client: IOP 클라이언트
+        :return: {product_id: 상품 정보} (조회된 상품만 포함)
+        """
+        details = {}
+        chunk_size = self.ALIEXPRESS_BATCH_MAX
+        
+        for start in range(0, len(product_ids), chunk_size):
+            chunk = product_ids[start:start + chunk_size]
             
-            if detail_response.body and 'resp_result' in detail_response.body:
-                detail_result = detail_response.body['resp_result'].get('result', {})
-                products = detail_result.get('products', [])
+            try:
+                # 상품 상세 API 호출 (API 가이드의 모든 필드 활용)
+                detail_request = self.aliexpress_sdk.IopRequest('aliexpress.affiliate.product.detail', 'POST')
+                detail_request.set_simplify()
+                detail_request.add_api_param('product_ids', ','.join(chunk))
+                # API 가이드에서 제공하는 모든 유용한 필드들
+                detail_request.add_api_param('fields', 'product_id,product_title,product_main_image_url,product_video_url,shop_url,shop_id,first_level_category_id,first_level_category_name,second_level_category_id,second_level_category_name,target_sale_price,target_sale_price_currency,target_original_price,target_original_price_currency,evaluate_rate,30days_commission,volume,platform_product_type,plus_product,relevant_market_commission_rate')
+                detail_request.add_api_param('tracking_id', 'default')
                 
-                if products:
-                    product = products[0]
-                    
-                    # USD를 KRW로 변환 (환율 1400원 적용)
-                    usd_price = float(product.get('target_sale_price', 0))
-                    krw_price = int(usd_price * 1400)
-                    
-                    # 원가 정보
-                    usd_original_price = float(product.get('target_original_price', usd_price))
-                    krw_original_price = int(usd_original_price * 1400)
-                    
-                    # 할인율 계산
-                    discount_rate = 0
-                    if usd_original_price > 0 and usd_original_price != usd_price:
-                        discount_rate = round(((usd_original_price - usd_price) / usd_original_price) * 100)
-                    
-                    # 평점 정보 개선
-                    rating_value = product.get("evaluate_rate", "0")
-                    try:
-                        rating_float = float(rating_value)
-                        rating_display = f"{rating_float:.1f}점" if rating_float > 0 else "평점 정보 없음"
-                    except:
-                        rating_display = "평점 정보 없음"
-                    
-                    # 판매량 정보 개선
-                    volume = product.get("volume", "0")
-                    try:
-                        volume_int = int(volume)
-                        volume_display = f"{volume_int:,}개 판매" if volume_int > 0 else "판매량 정보 없음"
-                    except:
-                        volume_display = "판매량 정보 없음"
-                    
-                    # 수수료 정보 개선
-                    commission = product.get("30days_commission", "0")
-                    commission_rate = product.get("relevant_market_commission_rate", "0")
-                    
-                    formatted_product = {
-                        "platform": "알리익스프레스",
-                        "product_id": product_id,
-                        "title": product.get("product_title", "상품명 없음"),
-                        "price": f"${usd_price:.2f} (약 {krw_price:,}원)",
-                        "original_price": f"${usd_original_price:.2f} (약 {krw_original_price:,}원)" if usd_original_price != usd_price else f"${usd_price:.2f} (약 {krw_price:,}원)",
-                        "discount_rate": f"{discount_rate}%" if discount_rate > 0 else "할인 없음",
-                        "currency": "USD/KRW",
-                        "image_url": product.get("product_main_image_url", ""),
-                        "video_url": product.get("product_video_url", ""),
-                        "product_url": f"https://www.aliexpress.com/item/{product_id}.html",
-                        "affiliate_url": "",  # 변환된 링크로 나중에 업데이트
-                        "vendor": "알리익스프레스",
-                        "shop_id": product.get("shop_id", ""),
-                        "shop_url": product.get("shop_url", ""),
-                        "category": product.get("first_level_category_name", ""),
-                        "subcategory": product.get("second_level_category_name", ""),
-                        "rating": rating_display,
-                        "review_count": volume_display,
-                        "commission": f"${commission}" if commission and commission != "0" else "수수료 정보 없음",
-                        "commission_rate": commission_rate if commission_rate and commission_rate != "0" else "수수료율 정보 없음",
-                        "is_plus": product.get("plus_product", False),
-                        "product_type": product.get("platform_product_type", "ALL"),
-                        "original_data": product
-                    }
+                print(f"[📋] 알리익스프레스 상품 상세 정보 조회: {len(chunk)}개")
+                detail_response = client.execute(detail_request)
+                
+                if detail_response.body and 'resp_result' in detail_response.body:
+                    detail_result = detail_response.body['resp_result'].get('result', {}) or {}
                     
-                    print(f"[✅] 알리익스프레스 상품 상세 정보 조회 성공 (SDK): {formatted_product['title']}")
-                    print(f"[💰] 가격: {formatted_product['price']}, 할인율: {formatted_product['discount_rate']}")
-                    print(f"[⭐] 평점: {formatted_product['rating']}, 판매량: {formatted_product['review_count']}")
-                    return formatted_product
-            
-            print(f"[⚠️] 알리익스프레스 상품 정보를 찾을 수 없습니다 (SDK)")
-            return None
-            
-        except Exception as e:
-            print(f"[❌] 알리익스프레스 상품 정보 조회 오류 (SDK): {e}")
-            return None
+                    for product in detail_result.get('products', []):
+                        product_id = str(product.get('product_id', ''))
+                        if product_id not in chunk:
+                            # 단건 요청에서 product_id 필드가 없으면 요청 ID 사용
+                            if len(chunk) != 1:
+                                continue
+                            product_id = chunk[0]
+                        try:
+                            details[product_id] = self._format_aliexpress_product_detail(product, product_id)
+                        except Exception as e:
+                            print(f"[⚠️] 상품 포맷팅 오류 ({product_id}): {e}")
+                
+            except Exception as e:
+                print(f"[❌] 알리익스프레스 상품 정보 조회 오류 (SDK): {e}")
+                self._log_error("aliexpress_product_detail_error", {"error": str(e), "product_ids": chunk})
+        
+        return details
+    
+    def _format_aliexpress_product_detail(self, product, product_id):
+        """product.detail 응답의 상품 하나를 표준 상품 정보(dict)로 변환"""
+        record = ProductRecord.from_aliexpress(product, product_id)
+        self._remember_original_data(record.platform, product_id, product)
+        formatted_product = record.to_dict()
+        
+        print(f"[✅] 알리익스프레스 상품 상세 정보 조회 성공 (SDK): {formatted_product['title']}")
+        print(f"[💰] 가격: {formatted_product['price']}, 할인율: {formatted_product['discount_rate']}")
+        print(f"[⭐] 평점: {formatted_product['rating']}, 판매량: {formatted_product['review_count']}")
+        return formatted_product
     
     def _api_call_with_retry(self, api_func, api_name, max_retries=3, delay=1):
         """
@@ -1081,81 +1352,22 @@ class SafeAPIManager:
     
     def _format_aliexpress_response(self, products):
         """
-        알리익스프레스 API 응답 포맷팅 (공식 가이드 기반)
-        모든 필드 정보 활용
+        알리익스프레스 API 응답 → 상품 레코드 목록 (공식 가이드 기반)
         :param products: 알리익스프레스 상품 리스트
-        :return: 포맷팅된 상품 리스트
+        :return: ProductRecord 목록 (출력용 dict는 record.to_dict())
         """
-        formatted_products = []
+        records = []
         
         for product in products:
             try:
-                # USD 를 KRW로 변환 (환율 1400원 적용)
-                usd_price = float(product.get('target_sale_price', 0))
-                krw_price = int(usd_price * 1400)
-                
-                # 원가 정보
-                usd_original_price = float(product.get('target_original_price', usd_price))
-                krw_original_price = int(usd_original_price * 1400)
-                
-                # 할인율 계산
-                discount_rate = 0
-                if usd_original_price > 0 and usd_original_price != usd_price:
-                    discount_rate = round(((usd_original_price - usd_price) / usd_original_price) * 100)
-                
-                # 평점 정보 개선
-                rating_value = product.get("evaluate_rate", "0")
-                try:
-                    rating_float = float(rating_value)
-                    rating_display = f"{rating_float:.1f}점" if rating_float > 0 else "평점 정보 없음"
-                except:
-                    rating_display = "평점 정보 없음"
-                
-                # 판매량 정보 개선
-                volume = product.get("volume", "0")
-                try:
-                    volume_int = int(volume)
-                    volume_display = f"{volume_int:,}개 판매" if volume_int > 0 else "판매량 정보 없음"
-                except:
-                    volume_display = "판매량 정보 없음"
-                
-                # 수수료 정보 개선
-                commission = product.get("30days_commission", "0")
-                commission_rate = product.get("relevant_market_commission_rate", "0")
-                
-                formatted_product = {
-                    "platform": "알리익스프레스",
-                    "product_id": product.get("product_id"),
-                    "title": product.get("product_title", "상품명 없음"),
-                    "price": f"${usd_price:.2f} (약 {krw_price:,}원)",
-                    "original_price": f"${usd_original_price:.2f} (약 {krw_original_price:,}원)" if usd_original_price != usd_price else f"${usd_price:.2f} (약 {krw_price:,}원)",
-                    "discount_rate": f"{discount_rate}%" if discount_rate > 0 else "할인 없음",
-                    "currency": "USD/KRW",
-                    "image_url": product.get("product_main_image_url", ""),
-                    "video_url": product.get("product_video_url", ""),
-                    "product_url": f"https://www.aliexpress.com/item/{product.get('product_id')}.html",
-                    "affiliate_url": "",  # 변환된 링크로 나중에 업데이트
-                    "vendor": "알리익스프레스",
-                    "shop_id": product.get("shop_id", ""),
-                    "shop_url": product.get("shop_url", ""),
-                    "category": product.get("first_level_category_name", ""),
-                    "subcategory": product.get("second_level_category_name", ""),
-                    "rating": rating_display,
-                    "review_count": volume_display,
-                    "commission": f"${commission}" if commission and commission != "0" else "수수료 정보 없음",
-                    "commission_rate": commission_rate if commission_rate and commission_rate != "0" else "수수료율 정보 없음",
-                    "is_plus": product.get("plus_product", False),
-                    "product_type": product.get("platform_product_type", "ALL"),
-                    "original_data": product
-                }
-                
-                formatted_products.append(formatted_product)
-                
+                record = ProductRecord.from_aliexpress(product)
             except Exception as e:
                 print(f"[⚠️] 상품 포맷팅 오류: {e}")
                 continue
+            self._remember_original_data(record.platform, record.product_id, product)
+            records.append(record)
         
-        return formatted_products
+        return records
     
     def _get_aliexpress_product_details(self, product_id):
         """
@@ -1163,13 +1375,17 @@ class SafeAPIManager:
         :param product_id: 상품 ID
         :return: 상품 정보 딕셔너리 또는 None
         """
+        return self._coalesce(
+            f"aliexpress_detail_single:{product_id}",
+            lambda: self._get_aliexpress_product_details_uncoalesced(product_id),
+            share=lambda result: result is not None
+        )
+    
+    def _get_aliexpress_product_details_uncoalesced(self, product_id):
+        """알리익스프레스 상품 상세 정보 조회 (요청 합치기 없이 직접 조회)"""
         if self.aliexpress_sdk:
-            # SDK가 있으면 새로운 메서드 사용
-            client = self.aliexpress_sdk.IopClient(
-                'https://api-sg.aliexpress.com/sync',
-                self.config["aliexpress_app_key"], 
-                self.config["aliexpress_app_secret"]
-            )
+            # SDK가 있으면 새로운 메서드 사용 (공유 클라이언트)
+            client = self._get_iop_client()
             return self._get_aliexpress_product_details_sdk(product_id, client)
         else:
             print(f"[⚠️] 알리익스프레스 SDK 없음 - 상품 정보 조회 불가")
@@ -1204,15 +1420,11 @@ class SafeAPIManager:
         # 캐시 확인
         cached_result = self._get_memory_cache(cache_key)
         if cached_result:
-            return True, cached_result['products'], cached_result['total_count']
+            return True, records_from_cache(cached_result['products']), cached_result['total_count']
         
         try:
-            # 공식 IOP SDK 클라이언트 생성
-            client = self.aliexpress_sdk.IopClient(
-                'https://api-sg.aliexpress.com/sync',
-                self.config["aliexpress_app_key"], 
-                self.config["aliexpress_app_secret"]
-            )
+            # 프로세스 공유 IOP SDK 클라이언트
+            client = self._get_iop_client()
             
             # 공식 가이드에 따른 상품 검색 요청
             request = self.aliexpress_sdk.IopRequest('aliexpress.affiliate.product.query', 'GET')
@@ -1241,11 +1453,12 @@ class SafeAPIManager:
                 total_count = result.get('total_record_count', 0)
                 
                 if products:
-                    formatted_products = self._format_aliexpress_response(products)
+                    records = self._format_aliexpress_response(products)
+                    formatted_products = [record.to_dict() for record in records]
                     
-                    # 캐시 저장
+                    # 캐시 저장 (압축 레코드)
                     cache_data = {
-                        'products': formatted_products,
+                        'products': records_to_cache(records),
                         'total_count': total_count
                     }
                     self._set_memory_cache(cache_key, cache_data)
@@ -1265,6 +1478,17 @@ class SafeAPIManager:
             return False, [], 0
 
     def search_aliexpress_safe(self, keyword, limit=5, force_api=False):
+        """
+        안전한 알리익스프레스 상품 검색 (같은 키워드의 동시 요청은 한 번만 조회)
+        :return: (success, products_list)
+        """
+        return self._coalesce(
+            f"aliexpress_search:{int(bool(force_api))}:{self._get_cache_key(keyword, limit)}",
+            lambda: self._search_aliexpress_safe(keyword, limit, force_api),
+            share=lambda result: result[0]
+        )
+    
+    def _search_aliexpress_safe(self, keyword, limit=5, force_api=False):
         """
         안전한 알리익스프레스 상품 검색 (API 가이드 기반 개선)
         공식 IOP SDK 활용
@@ -1290,16 +1514,12 @@ class SafeAPIManager:
         if not force_api:
             cached_data = self._get_memory_cache(cache_key)
             if cached_data is not None:
-                return True, cached_data
+                return True, records_from_cache(cached_data)
         
         # 2단계: 실제 API 호출
         try:
-            # 공식 IOP SDK 클라이언트 생성
-            client = self.aliexpress_sdk.IopClient(
-                'https://api-sg.aliexpress.com/sync',
-                self.config["aliexpress_app_key"], 
-                self.config["aliexpress_app_secret"]
-            )
+            # 프로세스 공유 IOP SDK 클라이언트
+            client = self._get_iop_client()
             
             # 상품 검색 요청 생성 (API 가이드 기반)
             request = self.aliexpress_sdk.IopRequest('aliexpress.affiliate.product.query', 'POST')
@@ -1338,10 +1558,11 @@ class SafeAPIManager:
                     products = result.get('products', [])
                     
                     if products:
-                        formatted_products = self._format_aliexpress_response(products)
+                        records = self._format_aliexpress_response(products)
+                        formatted_products = [record.to_dict() for record in records]
                         
-                        # 캐시에 저장
-                        self._set_memory_cache(cache_key, formatted_products)
+                        # 캐시에 저장 (압축 레코드)
+                        self._set_memory_cache(cache_key, records_to_cache(records))
                         
                         print(f"[✅] 알리익스프레스 API 호출 성공: {len(formatted_products)}개 상품")
                         return True, formatted_products
@@ -1361,62 +1582,3 @@ class SafeAPIManager:
             print(f"[❌] 알리익스프레스 검색 처리 중 오류: {e}")
             self._log_error("aliexpress_search_error", {"error": str(e), "keyword": keyword})
             return False, []
-    
-    def _format_aliexpress_response(self, products):
-        """알리익스프레스 API 응답 데이터 형식화 (API 가이드 기반)"""
-        formatted_products = []
-        
-        for product in products:
-            # USD를 KRW로 변환 (환율 1400원 적용)
-            usd_price = float(product.get('target_sale_price', 0))
-            krw_price = int(usd_price * 1400)
-            
-            # 할인율 계산
-            original_price = float(product.get('target_original_price', 0))
-            discount_rate = 0
-            if original_price > 0 and original_price != usd_price:
-                discount_rate = round(((original_price - usd_price) / original_price) * 100)
-            
-            # 평점 정보 개선
-            rating_value = product.get("evaluate_rate", "0")
-            try:
-                rating_float = float(rating_value)
-                rating_display = f"{rating_float:.1f}점" if rating_float > 0 else "평점 정보 없음"
-            except:
-                rating_display = "평점 정보 없음"
-            
-            # 판매량 정보 개선
-            volume = product.get("volume", "0")
-            try:
-                volume_int = int(volume)
-                volume_display = f"{volume_int:,}개 판매" if volume_int > 0 else "판매량 정보 없음"
-            except:
-                volume_display = "판매량 정보 없음"
-            
-            formatted_product = {
-                "platform": "알리익스프레스",
-                "product_id": product.get("product_id"),
-                "title": product.get("product_title", "상품명 없음"),
-                "price": f"${usd_price:.2f} (약 {krw_price:,}원)",
-                "original_price": f"${original_price:.2f} (약 {int(original_price * 1400):,}원)" if original_price > 0 and original_price != usd_price else f"${usd_price:.2f} (약 {krw_price:,}원)",
-                "discount_rate": f"{discount_rate}%" if discount_rate > 0 else "할인 없음",
-                "currency": "USD/KRW",
-                "image_url": product.get("product_main_image_url", ""),
-                "video_url": product.get("product_video_url", ""),
-                "product_url": f"https://www.aliexpress.com/item/{product.get('product_id')}.html",
-                "affiliate_url": "",  # 링크 변환 후 업데이트
-                "vendor": "알리익스프레스",
-                "shop_id": product.get("shop_id"),
-                "shop_url": product.get("shop_url"),
-                "category": product.get("first_level_category_name"),
-                "subcategory": product.get("second_level_category_name"),
-                "rating": rating_display,
-                "review_count": volume_display,
-                "commission": product.get("30days_commission", "수수료 정보 없음"),
-                "commission_rate": product.get("relevant_market_commission_rate", "수수료율 정보 없음"),
-                "is_plus": product.get("plus_product", False),
-                "original_data": product
-            }
-            formatted_products.append(formatted_product)
-        
-        return formatted_products
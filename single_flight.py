@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+동일 API 조회 요청 합치기 (single-flight)
+편집기 UI, 큐 워커, 상품 모니터가 같은 키워드/상품을 동시에 조회할 때 API 호출과 호출 한도를 한 번만 사용
+
+- 프로세스 내부: 같은 키로 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과를 기다림
+- 프로세스 간: 키별 잠금 파일(flock)로 직렬화, 잠금을 기다린 쪽은 앞선 프로세스가 공유 저장소에
+  남긴 결과(짧은 TTL)를 먼저 확인하고 있으면 API를 호출하지 않음
+- 잠금은 프로세스가 종료되면 커널이 해제 (비정상 종료 시에도 잠금이 남지 않음)
+- 오래된 잠금 파일은 비차단 잠금을 잡은 뒤에만 삭제, 잠금을 잡은 쪽은 파일이 교체되지 않았는지 확인
+
+파일 위치: /var/www/novacents/tools/single_flight.py
+"""
+
+import os
+import copy
+import time
+import fcntl
+import hashlib
+import threading
+
+DEFAULT_LOCK_DIR = '/var/www/novacents/tools/cache/single_flight'
+DEFAULT_LOCK_TIMEOUT = 60
+DEFAULT_SHARE_TTL = 60
+LOCK_POLL_INTERVAL = 0.1
+# 이 시간 동안 잠그지 않은 잠금 파일은 시작 시 정리 (잠금할 때마다 mtime 갱신)
+STALE_LOCK_SECONDS = 24 * 3600
+
+
+class _InFlightCall:
+    """진행 중인 호출 1건 (같은 프로세스의 대기자들이 결과를 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    키 단위 요청 합치기
+    - do(key, fn, share=None): 같은 키의 동시 호출은 fn을 한 번만 실행
+    """
+
+    def __init__(self, lock_dir=DEFAULT_LOCK_DIR, result_store=None, lock_timeout=DEFAULT_LOCK_TIMEOUT, share_ttl=DEFAULT_SHARE_TTL):
+        """
+        :param lock_dir: 프로세스 간 잠금 파일 디렉토리
+        :param result_store: 프로세스 간 결과 공유 저장소 (get/set(key, data, ttl_seconds) - CacheBackend)
+        :param lock_timeout: 잠금 대기 최대 시간 (초과 시 잠금 없이 직접 호출)
+        :param share_ttl: 공유 결과 유효 시간 (초)
+        """
+        self.lock_dir = lock_dir
+        self.result_store = result_store
+        self.lock_timeout = lock_timeout
+        self.share_ttl = share_ttl
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.stats = {"calls": 0, "coalesced": 0, "shared_hits": 0, "lock_timeouts": 0}
+
+        os.makedirs(lock_dir, exist_ok=True)
+        self._cleanup_stale_locks()
+
+    def _cleanup_stale_locks(self):
+        """오래 사용하지 않은 잠금 파일 삭제 (다른 프로세스가 잡고 있거나 기다리는 파일은 유지)"""
+        cutoff = time.time() - STALE_LOCK_SECONDS
+        try:
+            filenames = os.listdir(self.lock_dir)
+        except OSError:
+            return
+        for filename in filenames:
+            path = os.path.join(self.lock_dir, filename)
+            try:
+                if not filename.endswith('.lock') or os.path.getmtime(path) >= cutoff:
+                    continue
+                with open(path, 'a') as lock_file:
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        continue
+                    os.remove(path)
+            except OSError:
+                continue
+
+    @staticmethod
+    def _digest(key):
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def do(self, key, fn, share=None):
+        """
+        키 단위로 합쳐서 fn 실행
+        :param key: 정규화된 요청 키
+        :param fn: 실제 API 호출 함수
+        :param share: 결과를 다른 프로세스와 공유할지 판단하는 함수 (None이면 공유하지 않음)
+        :return: fn 결과 (대기한 호출자는 사본)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.stats["coalesced"] += 1
+                leader = False
+            else:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self.stats["calls"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # 호출자가 결과를 수정해도 서로 영향이 없도록 사본 전달
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = self._run_with_process_lock(key, fn, share)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _acquire_lock_file(self, lock_path, deadline):
+        """
+        잠금 파일을 열어 배타 잠금 (기다리는 동안 정리 작업이 파일을 삭제했으면 다시 열기)
+        :return: (잠긴 파일 또는 None(시간 초과), 다른 프로세스를 기다렸는지)
+        """
+        contended = False
+        while True:
+            lock_file = open(lock_path, 'a')
+            try:
+                while True:
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        contended = True
+                        if time.time() >= deadline:
+                            lock_file.close()
+                            return None, contended
+                        time.sleep(LOCK_POLL_INTERVAL)
+
+                if os.fstat(lock_file.fileno()).st_ino == os.stat(lock_path).st_ino:
+                    # 사용 중인 잠금 파일로 표시 (정리 대상에서 제외)
+                    os.utime(lock_path)
+                    return lock_file, contended
+            except FileNotFoundError:
+                pass
+            except BaseException:
+                lock_file.close()
+                raise
+            # 잠근 파일이 이미 경로에서 삭제됨 - 새 파일로 다시 시도
+            lock_file.close()
+
+    def _run_with_process_lock(self, key, fn, share):
+        """키별 잠금 파일을 잡고 실행 (다른 프로세스가 먼저 잡고 있었으면 공유 결과 확인)"""
+        digest = self._digest(key)
+        lock_path = os.path.join(self.lock_dir, f"{digest}.lock")
+        try:
+            lock_file, contended = self._acquire_lock_file(lock_path, time.time() + self.lock_timeout)
+        except OSError:
+            return fn()
+
+        if lock_file is None:
+            # 잠금을 오래 잡고 있는 프로세스가 있으면 기다리지 않고 직접 호출
+            with self._lock:
+                self.stats["lock_timeouts"] += 1
+            return fn()
+
+        try:
+            try:
+                if contended:
+                    shared = self._load_shared(digest)
+                    if shared is not None:
+                        with self._lock:
+                            self.stats["shared_hits"] += 1
+                        return shared
+
+                result = fn()
+                if share is not None and share(result):
+                    self._store_shared(digest, result)
+                return result
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def _load_shared(self, digest):
+        if self.result_store is None:
+            return None
+        try:
+            entry = self.result_store.get(f"single_flight:{digest}")
+        except Exception:
+            return None
+        if not isinstance(entry, dict) or "value" not in entry:
+            return None
+        # JSON 저장 시 튜플이 리스트로 바뀌므로 복원
+        return tuple(entry["value"]) if entry.get("tuple") else entry["value"]
+
+    def _store_shared(self, digest, result):
+        if self.result_store is None:
+            return
+        try:
+            self.result_store.set(
+                f"single_flight:{digest}",
+                {"tuple": isinstance(result, tuple), "value": list(result) if isinstance(result, tuple) else result},
+                self.share_ttl
+            )
+        except Exception:
+            # 공유 실패는 합치기 효과만 줄어들 뿐 결과에는 영향 없음
+            pass
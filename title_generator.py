@@ -14,6 +14,7 @@ import gc
 import google.generativeai as genai
 from dotenv import load_dotenv
 from datetime import datetime
+from llm_cache import generate_content_cached
 
 def load_configuration():
     """환경변수 로드 (웹 환경에서는 로그 출력 제거)"""
@@ -33,9 +34,10 @@ def load_configuration():
         return None
     return config
 
-def generate_titles_with_gemini(keywords):
+def generate_titles_with_gemini(keywords, use_cache=False):
     """
     Gemini AI로 제목 생성 (여러 키워드 지원)
+    :param use_cache: True면 같은 키워드의 이전 응답 재사용 (기본은 매번 새 제목 후보 생성)
     """
     try:
         model = genai.GenerativeModel('gemini-2.5-pro')
@@ -70,7 +72,7 @@ def generate_titles_with_gemini(keywords):
 
 결과는 제목만 5개를 번호 없이 줄바꿈으로 구분해서 출력해주세요."""
 
-        response = model.generate_content(prompt)
+        response = generate_content_cached(model, prompt, bypass=not use_cache)
         
         if response and response.text:
             # 생성된 텍스트를 줄바꿈으로 분리하여 제목 목록 생성
@@ -10,7 +10,6 @@ import sys
 import json
 import os
 import re
-import time
 import requests
 import base64
 from datetime import datetime
@@ -89,6 +88,54 @@ class PostProductUpdater:
         except Exception as e:
             return None, None, None, str(e)
     
+    def get_products_info_and_affiliate_links(self, product_urls):
+        """
+        여러 상품의 정보 조회 및 어필리에이트 링크 생성
+        - 쿠팡: deeplink 일괄 변환으로 요청 1회(쿼터 1회)에 묶어서 처리
+        - 알리익스프레스: link.generate / product.detail 일괄 호출
+        :return: {product_url: (platform, affiliate_link, product_info, error)}
+        """
+        results = {}
+        platform_urls = {"쿠팡": [], "알리익스프레스": []}
+        
+        for product_url in product_urls:
+            url = product_url.strip()
+            if not url or url in results:
+                continue
+            if 'coupang.com' in url.lower():
+                platform_urls["쿠팡"].append(url)
+            elif 'aliexpress.com' in url.lower():
+                platform_urls["알리익스프레스"].append(url)
+            else:
+                results[url] = (None, None, None, "지원하지 않는 플랫폼")
+                continue
+            results[url] = None
+        
+        converters = {
+            "쿠팡": self.api_manager.convert_coupang_to_affiliate_links,
+            "알리익스프레스": self.api_manager.convert_aliexpress_to_affiliate_links,
+        }
+        
+        for platform, urls in platform_urls.items():
+            if not urls:
+                continue
+            
+            try:
+                converted = converters[platform](urls)
+            except Exception as e:
+                for url in urls:
+                    results[url] = (platform, None, None, str(e))
+                continue
+            
+            for url in urls:
+                result = converted.get(url)
+                if result and result["success"] and result["affiliate_link"]:
+                    results[url] = (platform, result["affiliate_link"], result["product_info"], None)
+                else:
+                    results[url] = (platform, None, None, "링크 변환 실패")
+        
+        return results
+    
     def generate_product_html_block(self, platform, product_info, affiliate_link):
         """상품 정보 HTML 블록 생성"""
         if not product_info:
@@ -154,11 +201,14 @@ class PostProductUpdater:
             product_blocks = []
             processed_products = []
             
+            # 링크 변환은 플랫폼별로 일괄 처리
+            conversions = self.get_products_info_and_affiliate_links(product_urls)
+            
             for product_url in product_urls:
                 if not product_url.strip():
                     continue
                 
-                platform, affiliate_link, product_info, error = self.get_product_info_and_affiliate_link(product_url.strip())
+                platform, affiliate_link, product_info, error = conversions[product_url.strip()]
                 
                 if error:
                     processed_products.append({
@@ -180,9 +230,6 @@ class PostProductUpdater:
                         "product_info": product_info,
                         "status": "success"
                     })
-                
-                # API 제한 고려 대기
-                time.sleep(1)
             
             # 기존 글 내용에서 상품 블록 제거 및 새로운 블록 추가
             current_content = post['content']['raw'] if 'raw' in post['content'] else post['content']['rendered']
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+워드프레스 게시물 발행기 (해외 여행지 자동 포스팅 / 상품 자동 포스팅 공용)
+게시물 생성 → 메타 설정 → SEO 설정을 순서대로 기다리지 않도록 요청 수와 대기 시간을 줄임
+
+- 메타(_fifu_image_url 등)는 생성 요청에 함께 전송하고, 응답의 meta에 반영되지 않은 키만 후속 요청
+- 후속 요청(메타, Yoast SEO)은 /batch/v1로 한 번에 전송, 배치를 지원하지 않는 사이트/경로는 동시 요청
+- 단계별 소요 시간(create / batch / meta / seo)을 결과에 포함
+
+파일 위치: /var/www/novacents/tools/wp_publisher.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+SEO_ENDPOINT_PATH = '/my-api/v1/update-seo'
+
+
+class WordPressPublisher:
+    """
+    워드프레스 REST 발행기
+    - publish(fields, meta, seo): {'success', 'post_id', 'post_url', 'timings', 'message', ...}
+    """
+
+    def __init__(self, wp_url, auth, posts_url=None, use_batch=True):
+        """
+        :param wp_url: 사이트 주소 (REST 루트는 {wp_url}/wp-json)
+        :param auth: (사용자, 애플리케이션 비밀번호)
+        :param posts_url: 게시물 엔드포인트 (기본: {wp_url}/wp-json/wp/v2/posts)
+        :param use_batch: /batch/v1 사용 시도 여부
+        """
+        self.rest_root = f"{wp_url.rstrip('/')}/wp-json"
+        self.posts_url = (posts_url or f"{self.rest_root}/wp/v2/posts").rstrip('/')
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.headers.update({'Content-Type': 'application/json', 'Accept': 'application/json'})
+        # None: 아직 모름, True/False: 첫 배치 요청 결과로 결정
+        self.batch_supported = None if use_batch else False
+
+    def _timed(self, timings, step, func, *args):
+        started = time.time()
+        try:
+            return func(*args)
+        finally:
+            timings[step] = round(time.time() - started, 3)
+
+    def _create_post(self, fields, meta):
+        payload = dict(fields)
+        if meta:
+            payload['meta'] = meta
+        response = self.session.post(self.posts_url, json=payload, timeout=30)
+        return response
+
+    def _direct_followup(self, request):
+        """후속 요청 1건 직접 전송 → (성공 여부, 메시지)"""
+        try:
+            response = self.session.post(f"{self.rest_root}{request['path']}", json=request['body'], timeout=20)
+            return response.ok, f"HTTP {response.status_code}"
+        except requests.exceptions.RequestException as e:
+            return False, str(e)
+
+    def _run_concurrently(self, requests_to_send, timings):
+        """후속 요청 동시 전송 (단계별 소요 시간 기록)"""
+        results = {}
+
+        def _run(request):
+            started = time.time()
+            outcome = self._direct_followup(request)
+            timings[request['name']] = round(time.time() - started, 3)
+            return request['name'], outcome
+
+        with ThreadPoolExecutor(max_workers=len(requests_to_send)) as executor:
+            for name, outcome in executor.map(_run, requests_to_send):
+                results[name] = outcome
+        return results
+
+    def _run_batch(self, requests_to_send, timings):
+        """
+        /batch/v1로 후속 요청 일괄 전송
+        :return: {이름: (성공 여부, 메시지)} (배치 자체를 쓸 수 없으면 None)
+        """
+        started = time.time()
+        try:
+            response = self.session.post(
+                f"{self.rest_root}/batch/v1",
+                json={'requests': [{'method': 'POST', 'path': r['path'], 'body': r['body']} for r in requests_to_send]},
+                timeout=30
+            )
+        except requests.exceptions.RequestException:
+            return None
+        finally:
+            timings['batch'] = round(time.time() - started, 3)
+
+        if response.status_code in (404, 405) or not response.ok:
+            self.batch_supported = False
+            return None
+        self.batch_supported = True
+
+        try:
+            responses = response.json().get('responses', [])
+        except ValueError:
+            return None
+
+        results = {}
+        retry = []
+        for request, item in zip(requests_to_send, responses):
+            status = item.get('status', 0)
+            body = item.get('body') or {}
+            if status == 400 and isinstance(body, dict) and body.get('code') == 'rest_batch_not_allowed':
+                # 배치를 허용하지 않는 경로(커스텀 엔드포인트 등)는 개별 요청
+                retry.append(request)
+            else:
+                results[request['name']] = (200 <= status < 300, f"HTTP {status}")
+        if retry:
+            results.update(self._run_concurrently(retry, timings))
+        return results
+
+    def run_followups(self, requests_to_send, timings):
+        """후속 요청 실행 (배치 → 동시 요청 순으로 시도)"""
+        if not requests_to_send:
+            return {}
+        if len(requests_to_send) > 1 and self.batch_supported is not False:
+            results = self._run_batch(requests_to_send, timings)
+            if results is not None:
+                return results
+        return self._run_concurrently(requests_to_send, timings)
+
+    def publish(self, fields, meta=None, seo=None, retry_meta=True):
+        """
+        게시물 발행
+        :param fields: 게시물 필드 (title, content, status, categories, tags, slug 등)
+        :param meta: 게시물 메타 (생성 요청에 포함)
+        :param seo: Yoast SEO 값 (focus_keyphrase, meta_description) - 발행 후 SEO 엔드포인트로 전송
+        :param retry_meta: 생성 응답에 반영되지 않은 메타 키를 후속 요청으로 다시 설정할지 여부
+        :return: 결과 dict
+        """
+        timings = {}
+        try:
+            response = self._timed(timings, 'create', self._create_post, fields, meta)
+        except requests.exceptions.Timeout:
+            return {'success': False, 'message': "워드프레스 API 요청 시간 초과", 'timings': timings}
+        except requests.exceptions.RequestException as e:
+            return {'success': False, 'message': f"워드프레스 API 요청 실패: {str(e)}", 'timings': timings}
+
+        if response.status_code not in (200, 201):
+            return {
+                'success': False,
+                'message': f"워드프레스 발행 실패: HTTP {response.status_code}",
+                'response': response.text,
+                'timings': timings
+            }
+
+        post_json = response.json()
+        post_id, post_url = post_json.get('id'), post_json.get('link', '')
+        if not post_id:
+            return {'success': False, 'message': "게시물 생성 후 ID를 받아오지 못했습니다.", 'response': response.text, 'timings': timings}
+
+        followups = []
+        if meta and retry_meta:
+            # REST에 등록되지 않은 메타 키는 생성 요청에서 무시되므로 응답으로 확인
+            applied_meta = post_json.get('meta') or {}
+            pending_meta = {key: value for key, value in meta.items()
+                            if not isinstance(applied_meta, dict) or applied_meta.get(key) != value}
+            if pending_meta:
+                followups.append({'name': 'meta', 'path': f"/wp/v2/posts/{post_id}", 'body': {'meta': pending_meta}})
+        if seo:
+            followups.append({'name': 'seo', 'path': SEO_ENDPOINT_PATH, 'body': dict(seo, post_id=post_id)})
+
+        followup_results = self.run_followups(followups, timings)
+        failed = {name: message for name, (ok, message) in followup_results.items() if not ok}
+
+        return {
+            'success': True,
+            'post_id': post_id,
+            'post_url': post_url,
+            'message': '글이 성공적으로 발행되었습니다.',
+            'followups': followup_results,
+            'failed_followups': failed,
+            'timings': timings
+        }
+
+
+def format_timings(timings):
+    """단계별 소요 시간 로그 문자열"""
+    return ", ".join(f"{step} {seconds:.2f}s" for step, seconds in timings.items())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+워드프레스 태그 이름 → ID 로컬 인덱스
+게시물마다 태그별로 REST 검색/생성 요청을 보내지 않도록 /wp/v2/tags 전체를 주기적으로 동기화
+
+- 동기화: per_page=100 페이지 단위 일괄 조회 (X-WP-TotalPages 기준), 결과는 JSON 파일에 저장
+- 조회: 정규화한 이름(NFKC, 대소문자 무시, 공백 정리, HTML 엔티티 해제)으로 로컬 조회
+- 미스: 인덱스에 없는 태그만 동시에 생성 (이미 있으면 term_exists 응답의 ID 사용)
+
+파일 위치: /var/www/novacents/tools/wp_tag_index.py
+"""
+
+import os
+import re
+import json
+import html
+import time
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+DEFAULT_INDEX_FILE = '/var/www/novacents/tools/cache/wp_tag_index.json'
+DEFAULT_SYNC_INTERVAL = 24 * 3600
+TAGS_PER_PAGE = 100
+CREATE_WORKERS = 4
+
+
+def normalize_tag_name(name):
+    """태그 이름 비교용 정규화"""
+    name = unicodedata.normalize('NFKC', html.unescape(name or ''))
+    return re.sub(r'\s+', ' ', name).strip().casefold()
+
+
+class WordPressTagIndex:
+    """
+    태그 이름 → ID 인덱스
+    - resolve(tag_names): 태그 ID 목록 (입력 순서 유지, 없는 태그는 생성)
+    """
+
+    def __init__(self, api_base, auth, index_file=DEFAULT_INDEX_FILE, sync_interval=DEFAULT_SYNC_INTERVAL):
+        """
+        :param api_base: 워드프레스 REST 기본 URL (예: https://example.com/wp-json/wp/v2)
+        :param auth: (사용자, 애플리케이션 비밀번호)
+        :param index_file: 인덱스 저장 파일
+        :param sync_interval: 전체 동기화 주기 (초)
+        """
+        self.api_base = api_base.rstrip('/')
+        self.auth = auth
+        self.index_file = index_file
+        self.sync_interval = sync_interval
+        self.session = requests.Session()
+        self.session.auth = auth
+        self._lock = threading.Lock()
+        self.tags = {}
+        self.synced_at = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.tags = data.get('tags', {})
+            self.synced_at = data.get('synced_at', 0)
+        except (IOError, ValueError):
+            self.tags = {}
+            self.synced_at = 0
+
+    def _save(self):
+        """임시 파일 작성 후 교체 (잠금 안에서 호출)"""
+        index_dir = os.path.dirname(self.index_file)
+        if index_dir and not os.path.exists(index_dir):
+            os.makedirs(index_dir)
+        tmp_path = f"{self.index_file}.tmp.{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'synced_at': self.synced_at, 'tags': self.tags}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_file)
+
+    def _add(self, tag_id, name):
+        self.tags[normalize_tag_name(name)] = {'id': tag_id, 'name': html.unescape(name)}
+
+    def sync(self, force=False):
+        """
+        /tags 전체를 페이지 단위로 받아 인덱스 재구성
+        :param force: 동기화 주기와 관계없이 실행
+        :return: 동기화 실행 여부
+        """
+        if not force and self.tags and time.time() - self.synced_at < self.sync_interval:
+            return False
+
+        print("[🔄] 워드프레스 태그 인덱스를 동기화합니다...")
+        tags = {}
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            response = self.session.get(
+                f"{self.api_base}/tags",
+                params={'per_page': TAGS_PER_PAGE, 'page': page, '_fields': 'id,name', 'hide_empty': 'false'},
+                timeout=20
+            )
+            response.raise_for_status()
+            total_pages = int(response.headers.get('X-WP-TotalPages', 1) or 1)
+            for tag_data in response.json():
+                if isinstance(tag_data, dict) and tag_data.get('id'):
+                    tags[normalize_tag_name(tag_data.get('name'))] = {
+                        'id': tag_data['id'], 'name': html.unescape(tag_data.get('name', ''))
+                    }
+            page += 1
+
+        with self._lock:
+            self.tags = tags
+            self.synced_at = int(time.time())
+            self._save()
+        print(f"[✅] 태그 인덱스 동기화 완료: {len(tags)}개 ({total_pages}페이지)")
+        return True
+
+    def lookup(self, name):
+        """로컬 인덱스 조회 (없으면 None)"""
+        entry = self.tags.get(normalize_tag_name(name))
+        return entry['id'] if entry else None
+
+    def _create(self, name):
+        """
+        태그 생성 (이미 있으면 term_exists 응답의 ID 사용)
+        :return: 태그 ID 또는 None
+        """
+        try:
+            response = self.session.post(f"{self.api_base}/tags", json={'name': name}, timeout=10)
+            if response.status_code == 400:
+                error = response.json()
+                if error.get('code') == 'term_exists':
+                    return error.get('data', {}).get('term_id')
+            response.raise_for_status()
+            return response.json().get('id')
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"[❌] 태그 생성 중 오류 ('{name}'): {e}")
+            return None
+
+    def resolve(self, tag_names):
+        """
+        태그 이름 목록 → ID 목록 (입력 순서 유지, 중복 제거)
+        - 인덱스에 없는 태그만 동시에 생성하고 인덱스에 추가
+        """
+        try:
+            self.sync()
+        except requests.exceptions.RequestException as e:
+            # 동기화에 실패해도 기존 인덱스와 생성 요청으로 진행
+            print(f"[⚠️] 태그 인덱스 동기화 실패, 기존 인덱스로 진행합니다: {e}")
+
+        names = []
+        seen = set()
+        for name in tag_names:
+            key = normalize_tag_name(name)
+            if key and key not in seen:
+                seen.add(key)
+                names.append(name.strip())
+
+        missing = [name for name in names if self.lookup(name) is None]
+        if missing:
+            print(f"[⚙️] 인덱스에 없는 태그 {len(missing)}개를 생성합니다: {', '.join(missing)}")
+            with ThreadPoolExecutor(max_workers=min(CREATE_WORKERS, len(missing))) as executor:
+                created = list(executor.map(self._create, missing))
+            with self._lock:
+                for name, tag_id in zip(missing, created):
+                    if tag_id:
+                        self._add(tag_id, name)
+                self._save()
+
+        return [tag_id for tag_id in (self.lookup(name) for name in names) if tag_id]